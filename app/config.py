@@ -28,8 +28,10 @@ class AppConfig(QObject):
         #          -- MUST be done AFTER QCoreApplication is created in main()
 
         # Default formats (to be overridden by user settings)
-        self.date_display_format = "%d %b %Y"  # My 01 Han 202t format (used in testing). "%m/%d/%y" is 01/01/2026
-        self.time_display_format = "%I:%M %p"   # for 12‑hr time. "%H:%M" for 24‑hr time.
+        self._date_display_format = "%d %b %Y"  # My 01 Han 202t format (used in testing). "%m/%d/%y" is 01/01/2026
+        self._time_display_format = "%I:%M %p"   # for 12‑hr time. "%H:%M" for 24‑hr time.
+        # Bumped whenever a display format changes. (Cached display strings compare against it)
+        self._format_generation = 0
 
         self._cell_font_pt_size = C.DEFAULT_CELL_FONT_SIZE
         self._hdr_font_pt_size = C.DEFAULT_CELL_FONT_SIZE - 1
@@ -37,6 +39,9 @@ class AppConfig(QObject):
         # Max lines allowed in descr column (1, 2, or 3)
         self.line_limit = 2
 
+        # Memory for rendered cells (See RenderCache). 0 turns the cache off
+        self.render_cache_kb = C.DEFAULT_RENDER_CACHE_KB
+
         self._geom_str = C.DEFAULT_GEOM_STR
     #end __init__
 
@@ -48,6 +53,30 @@ class AppConfig(QObject):
         """
         return self._cell_font_pt_size / C.DEFAULT_CELL_FONT_SIZE
 
+    @property
+    def date_display_format(self):
+        return self._date_display_format
+
+    @date_display_format.setter
+    def date_display_format(self, value):
+        if self._date_display_format != value:
+            self._date_display_format = value
+            self._format_generation += 1
+
+    @property
+    def time_display_format(self):
+        return self._time_display_format
+
+    @time_display_format.setter
+    def time_display_format(self, value):
+        if self._time_display_format != value:
+            self._time_display_format = value
+            self._format_generation += 1
+
+    @property
+    def format_generation(self):
+        return self._format_generation
+
     @property
     def cell_font_pt_size(self):
         return self._cell_font_pt_size
@@ -104,6 +133,7 @@ class AppConfig(QObject):
         self._cell_font_pt_size = int(settings.value("display/font_size", self._cell_font_pt_size))
         self._hdr_font_pt_size = self._cell_font_pt_size - 1
         self.line_limit = int(settings.value("display/line_limit", self.line_limit))
+        self.render_cache_kb = int(settings.value("display/render_cache_kb", self.render_cache_kb))
 
         # Window geometry
         self._geom_str = settings.value("window/geometry", self._geom_str)
@@ -122,6 +152,7 @@ class AppConfig(QObject):
         # Sizing settings
         settings.setValue("display/font_size", self._cell_font_pt_size)
         settings.setValue("display/line_limit", self.line_limit)
+        settings.setValue("display/render_cache_kb", self.render_cache_kb)
 
         # Window geometry
         settings.setValue("window/geometry", self._geom_str)
@@ -0,0 +1,142 @@
+# indexed_csv_reader.py
+#
+# IndexedCsvReader gives random access to the rows of a (very large)
+# reminders CSV file, without parsing the whole file. The file is memory-
+# mapped, and a compact index of row byte-offsets, plus the parsed "when"
+# value of each row, is cached on disk next to it (csv_path + ".idx").
+# Re-opening an unchanged file costs only the index read.
+# The index is rebuilt whenever the CSV file's size or mtime changes.
+
+import os, io, sys, csv, mmap, struct
+from array import array
+
+from reminder_item import LazyReminderItem
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+import utilities as fcn
+
+# Index file header: magic, version, csv size, csv mtime_ns, row count
+INDEX_HEADER = struct.Struct("<4sIQqQ")
+INDEX_MAGIC = b"RIDX"
+INDEX_VERSION = 1
+
+class IndexedCsvReader:
+
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self.index_path = os.fspath(csv_path) + C.ROW_INDEX_SUFFIX
+        self.loaded_from_cache = False
+
+        self._file = open(csv_path, "rb")
+        st = os.fstat(self._file.fileno())
+        self._stamp = (st.st_size, st.st_mtime_ns)
+
+        # offsets[row] is where the row starts. (offsets[-1] is the end of the file)
+        # whens[row] is the row's when value, in fcn.epoch_seconds() form.
+        self.offsets = array("Q")
+        self.whens = array("q")
+        if not st.st_size:
+            # An empty file has no rows. (And can't be mapped)
+            self._mm = None
+            self.offsets.append(0)
+            return
+
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._read_index():
+            self.loaded_from_cache = True
+        else:
+            self._build_index()
+            self._write_index()
+
+    def __len__(self):
+        return len(self.whens)
+
+    def when_at(self, row):
+        """The row's date & time, straight from the index (No parsing)"""
+        return fcn.from_epoch_seconds(self.whens[row])
+
+    def get_reminder(self, row):
+        """Decode just the requested row. Returns a (lazy) ReminderItem"""
+        start, end = self.offsets[row], self.offsets[row + 1]
+        text = self._mm[start:end].decode("utf-8")
+        fields = next(csv.reader(io.StringIO(text)))
+        return LazyReminderItem(self.when_at(row), fields)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------
+    # The index
+    # ------------------------
+    def _build_index(self):
+        """One pass through the file, recording where each row starts"""
+        mm = self._mm
+        line_starts = array("Q", [0])
+
+        def lines():
+            mm.seek(0)
+            while True:
+                line = mm.readline()
+                if not line:
+                    return
+                line_starts.append(mm.tell())   # Where the next line starts
+                yield line.decode("utf-8")
+
+        # The csv reader takes care of quoted fields that span lines.
+        # Its line_num says where the next row starts.
+        reader = csv.reader(lines())
+        next(reader, None)  # skip header row
+        start = line_starts[reader.line_num]
+        for fields in reader:
+            if fields:  # (skip blank lines)
+                date_str = fields[1] if len(fields) > 1 else ""
+                time_str = fields[2] if len(fields) > 2 else ""
+                self.offsets.append(start)
+                self.whens.append(fcn.epoch_seconds(fcn.datetime_from_iso(date_str, time_str)))
+            start = line_starts[reader.line_num]
+        self.offsets.append(len(mm))
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return False
+
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+        if len(data) < INDEX_HEADER.size:
+            return False
+
+        magic, version, size, mtime_ns, count = INDEX_HEADER.unpack_from(data)
+        if (magic, version, (size, mtime_ns)) != (INDEX_MAGIC, INDEX_VERSION, self._stamp):
+            return False  # Stale: The CSV file has changed since the index was built
+
+        offsets_end = INDEX_HEADER.size + (count + 1) * self.offsets.itemsize
+        if len(data) != offsets_end + count * self.whens.itemsize:
+            return False
+
+        self.offsets.frombytes(data[INDEX_HEADER.size:offsets_end])
+        self.whens.frombytes(data[offsets_end:])
+        if sys.byteorder == "big":
+            self.offsets.byteswap()
+            self.whens.byteswap()
+        return True
+
+    def _write_index(self):
+        offsets, whens = self.offsets, self.whens
+        if sys.byteorder == "big":
+            offsets, whens = array("Q", offsets), array("q", whens)
+            offsets.byteswap()
+            whens.byteswap()
+
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, *self._stamp, len(whens))
+        fcn.atomic_save(header + offsets.tobytes() + whens.tobytes(), self.index_path)
+
+    #end CLASS IndexedCsvReader
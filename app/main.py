@@ -8,6 +8,7 @@ import utilities as fcn
 from app.qt_ui.reminders_window       import RemindersWindow
 from app.qt_ui.model_adapter import ModelAdapter
 from app.reminders_persistence        import RemindersPersistence
+from app.reminders_database           import RemindersDatabase
 from app.model.reminders_model        import RemindersModel
 
 from app.timer_service import TimerService
@@ -16,6 +17,9 @@ from app.timer_service import TimerService
 import table_constants as C
 
 USE_MOCK_DATA = False  # Set to True for GUI testing
+USE_SQLITE_DB = False  # Set to True to keep reminders in an SQLite database
+                       # (The CSV file is migrated when the database is created)
+USE_COLUMNAR_STORE = False  # Set to True for very large lists (less memory. See ReminderStore)
 
 def main():
     """
@@ -34,11 +38,16 @@ def main():
     else:
         csv_path = fcn.get_app_file_path(config.curr_csv_file)
         #print(f"csv_path: {csv_path}")
-        manager = RemindersPersistence(csv_path)
-        domain_model = RemindersModel(data_manager=manager)
+        if USE_SQLITE_DB:
+            db_path = fcn.get_app_file_path(C.DEFAULT_DB_FILENAME)
+            manager = RemindersDatabase(db_path, csv_path=csv_path)
+        else:
+            manager = RemindersPersistence(csv_path, use_journal=True, use_snapshot=True)
+        domain_model = RemindersModel(data_manager=manager, background_saves=True,
+                                      columnar=USE_COLUMNAR_STORE)
 
     app = QApplication(sys.argv)
-    rtm = ModelAdapter(domain_model)
+    rtm = ModelAdapter(domain_model, page_size=C.TABLE_PAGE_ROWS)
     window = RemindersWindow(rtm)
 
     # Create the timer thread
@@ -55,6 +64,13 @@ def main():
 
     # Stop the timer service
     timer_service.stop()
+
+    # Final flush of any pending (background) saves
+    try:
+        domain_model.close()
+    except Exception as e:
+        print(f"Final save failed:\n{e}")
+
     timer_service.wait() # Make sure the timer has finished before exiting
     sys.exit(exit_code)
 
@@ -0,0 +1,66 @@
+# countdown_scheduler.py
+#
+# CountdownScheduler keeps track of when each reminder's countdown text
+# (and its TODAY/TOMORROW faux date) will next change. Most of them
+# ("in 12 days") change only at midnight, so on each heartbeat
+# RemindersModel updates just the reminders that are due, rather than
+# sweeping the whole list.
+#
+# The due times live in a heap. A reminder that's rescheduled (or removed)
+# leaves its old heap entry behind. Stale entries are skipped when they
+# come up, by checking them against the current due time for that uid.
+
+import heapq
+
+class CountdownScheduler:
+
+    def __init__(self):
+        self._heap = []      # (due, uid)
+        self._due = {}       # uid -> due datetime (None = never)
+        self._dirty = set()  # uids to update on the next tick, whatever the time
+
+    def __len__(self):
+        return len(self._due)
+
+    def schedule(self, item, now):
+        """Queue the item's next countdown change (after it's been updated for 'now')"""
+        uid = item.uid
+        due = item.next_countdown_change(now)
+        self._due[uid] = due
+        self._dirty.discard(uid)
+        if due is not None:
+            heapq.heappush(self._heap, (due, uid))
+            if len(self._heap) > 2 * len(self._due) + 64:
+                self._compact()
+
+    def mark_dirty(self, uid):
+        """The item is new or was edited. Update it on the next tick"""
+        self._dirty.add(uid)
+
+    def remove(self, uid):
+        self._due.pop(uid, None)
+        self._dirty.discard(uid)
+
+    def clear(self):
+        self._heap.clear()
+        self._due.clear()
+        self._dirty.clear()
+
+    def _compact(self):
+        """Drop the stale heap entries"""
+        self._heap = [(due, uid) for uid, due in self._due.items() if due is not None]
+        heapq.heapify(self._heap)
+
+    def pop_due(self, now):
+        """The uids (dirty, or due at or before 'now') to update. Each is dropped from the queue"""
+        uids = self._dirty
+        self._dirty = set()
+        heap, due_of = self._heap, self._due
+        while heap and heap[0][0] <= now:
+            due, uid = heapq.heappop(heap)
+            if due_of.get(uid) == due:  # (Otherwise, a stale entry)
+                del due_of[uid]
+                uids.add(uid)
+        return uids
+
+    #end CLASS CountdownScheduler
@@ -23,15 +23,17 @@ def combine_text_and_notes(text, notes):
 
 def format_day_of_week(dt):
     """Return something like 'Tue' or 'Tuesday'."""
-    return dt.strftime("%a")   # or "%A" for full name
+    import utilities as fcn
+    return fcn.format_datetime(dt, "%a")   # or "%A" for full name
 
 
 def formatted_date_time(dt):
     """Return (date_str, time_str) using config-defined formats."""
     from app.config import config
+    import utilities as fcn
     date_fmt = config.date_display_format
     time_fmt = config.time_display_format
-    return dt.strftime(date_fmt), dt.strftime(time_fmt)
+    return fcn.format_datetime(dt, date_fmt), fcn.format_datetime(dt, time_fmt)
 
 
 def reminders_to_display_rows(reminder):
@@ -8,32 +8,17 @@ import table_constants as C
 
 from app.config import config
 
-class ReminderItem:
-    # TODO: Add "alert_schedule" to the constructor argument
-    def __init__(self, when:dt.datetime, descr, flags="", notes="", repeat=""):
-        if when:
-            assert isinstance(when, dt.datetime),\
-                f"Reminder.when must be datetime, got {type(when)}: {when}"
-        if repeat:
-            # ToDo: decode repetition data?
-            pass
-
-        # ToDo: Take muted/active state as an init argument
-
-        self._when: datetime = when  # date & time
-        self._descr = descr          # main reminder descr
-        self._flags = flags          # "". "!" (C.IS_CRTICAL_FLAG), "A' (alerts enabled), or !A
-        self._notes = notes          # optional notes (location, what to bring, etc)
-        self._alert_sched = None     # TODO: Store and read back actual alert-schedule
-        self._repeat_sched: str = "" # TODO: Display in table as "Daily", "Weekly", "Custom", etc.
-
-        self._faux_date_str = ""     # Date-override Used by countdown for imminent dates
-        self._countdown_str = ""     # Time remaining until the event or activity
-    #end __init__
+class ReminderBase:
+    """
+    The behavior of a reminder. The fields (_when, _descr, _flags, etc.)
+    are supplied by the subclasses: ReminderItem holds them in slots, and
+    a StoredReminder reads them from a ReminderStore.
+    """
+    __slots__ = ()
 
     def __eq__(self, other):
         """ Comparison operator for use in unit tests"""
-        if not isinstance(other, ReminderItem):
+        if not isinstance(other, ReminderBase):
             return False
 
         # Return True if all relevant fields match
@@ -44,6 +29,14 @@ class ReminderItem:
                 self._alert_sched == other._alert_sched and
                 self._repeat_sched == other._repeat_sched)
 
+    @property
+    def uid(self):
+        return self._uid
+
+    @uid.setter
+    def uid(self, value: int):
+        self._uid = value
+
     @property
     def is_critical(self):
         return C.IS_CRITICAL_FLAG in self._flags
@@ -109,9 +102,7 @@ class ReminderItem:
     @property
     def day_of_week(self):
         # Derived field, not stored in CSV
-        if not self._when:
-            return ""
-        return self._when.date().strftime("%a")
+        return self._display_strings()[2]
 
     @property
     def descr(self):
@@ -121,30 +112,49 @@ class ReminderItem:
         return self._descr
 
     @property
-    def date(self):
-        if not self._when:
-            return ""
+    def line_count(self):
+        # Lines in descr (as above), without building the combined string
+        notes = self._notes
+        lines = self._descr.count("\n") + 1
+        return lines + notes.count("\n") + 1 if notes else lines
 
-        if self._faux_date_str:
+    @property
+    def date(self):
+        strings = self._display_strings()
+        if strings[1] and self._faux_date_str:
             return self._faux_date_str
-
-        d = self._when.date()
-        date_fmt = config.date_display_format
-        return d.strftime(date_fmt).lstrip("0")
+        return strings[3]
 
     @property
     def time(self):
-        if not self._when:
-            return ""
-
-        t = self._when.time()
-        if t.hour == 0 and t.minute == 0:
+        return self._display_strings()[4]
+
+    def _display_strings(self):
+        """
+        (key, has_date, day_of_week, date, time). The strings are formatted once,
+        then reused until 'when' or the config's display formats change.
+        """
+        key = (config.format_generation, self._sort_key)
+        strings = self._display_strs
+        if strings is None or strings[0] != key:
+            strings = self._display_strs = (key, *self._format_display_strings())
+        return strings
+
+    def _format_display_strings(self):
+        """(has_date, day_of_week, date, time) for the current display formats"""
+        when = self._when
+        if not when:
+            return False, "", "", ""
+
+        day_str = fcn.format_datetime(when, "%a")
+        date_str = fcn.format_datetime(when, config.date_display_format).lstrip("0")
+
+        if when.hour == 0 and when.minute == 0:
             time_str = ""
         else:
             # Time with no leading zero, Lowercase "am/pm". So: 6:00 am)"""
-            time_fmt = config.time_display_format
-            time_str = t.strftime(time_fmt).lstrip("0").lower()
-        return time_str
+            time_str = fcn.compile_format(config.time_display_format, display=True).format(when)
+        return True, day_str, date_str, time_str
 
 
     #TODO: Implement repeats, plus encoding & decoding for serilaization
@@ -153,16 +163,18 @@ class ReminderItem:
 
     def to_csv_row(self):
         """Convert to a list of strings for csv writer"""
-        # csv col headers defined in table_constants: [Title,Date,Time,Flag,Notes,Repeat]
+        # csv col headers defined in table_constants: [Title,Date,Time,Flag,Notes,Repeat,Id]
         date_str, time_str = fcn.iso_date_time(self._when)
         notes_str = fcn.encode_newlines(self._notes)  # Escape NLs
         repeat_str = self._repeat_sched  # TODO: ENCODE JSON REPETITION (display value for now)
-        return [self._descr, date_str, time_str, self._flags, notes_str, repeat_str]
+        uid_str = "" if self._uid is None else str(self._uid)
+        return [self._descr, date_str, time_str, self._flags, notes_str, repeat_str, uid_str]
 
     @classmethod
     def from_csv_row(cls, row):
         # Stored row from a csv file to a Reminder object
-        # csv row = [Title,Date,Time,Flag,Notes,Repeat]
+        # csv row = [Title,Date,Time,Flag,Notes,Repeat,Id]
+        # (Older files have no Id column)
         descr = row[0]
         date_obj = dt.date.fromisoformat(row[1]) if row[1] else None
         time_obj = dt.time.fromisoformat(row[2]) if row[2] else None
@@ -175,19 +187,28 @@ class ReminderItem:
             notes = fcn.decode_newlines(notes)     # Un-escape NLs
 
         repeat = row[5] if len(row) > 5 else ""
-        if repeat:
-            #Decode JSON repeat string
-            self.set_repeat_sched(repeat)
+        # TODO: Decode JSON repeat string (stored as-is, for now)
+
+        uid = cls._uid_from_csv_row(row)
+
+        # ReminderItem init: when:dt.datetime, descr, flag, notes, repeat, uid
+        return cls(when, descr, flag, notes, repeat, uid)
 
-        # ReminderItem init: when:dt.datetime, descr, flag, notes, repeat
-        return cls(when, descr, flag, notes, repeat)
+    @staticmethod
+    def _uid_from_csv_row(row):
+        uid_str = row[C.CSV_ID_IDX] if len(row) > C.CSV_ID_IDX else ""
+        return int(uid_str) if uid_str else None
         
     # The value to use for sorting (date/time)
     def sort_key(self):
+        return self._sort_key
+
+    @staticmethod
+    def _make_sort_key(when):
         # False (0) comes before True (1)
         # Put items where 'when' is None at the top
         # (when it exists, sort on the 'when' value)
-        return self._when is not None, self._when
+        return when is not None, when
 
     @property
     def countdown(self):
@@ -277,4 +298,141 @@ class ReminderItem:
         return
     #end update_countdown()
 
-#end CLASS Reminder
\ No newline at end of file
+    def next_countdown_change(self, now):
+        """
+        The first time after 'now' at which update_countdown() could give a
+        different result. (None if it never will.) Follows the rules in
+        update_countdown(). It may be early, but never late.
+        """
+        if not now or self._when is None:
+            return None
+
+        days = (self._when.date() - now.date()).days
+        if days < 0:
+            return None  # "Past", for good
+
+        midnight = dt.datetime.combine(now.date() + dt.timedelta(days=1), dt.time())
+        if days > 0:
+            return midnight  # One day closer
+
+        # --- TODAY ---
+        seconds = int((self._when - now).total_seconds())
+        if seconds < 0 and self.has_time:
+            if seconds > -3600:
+                # LATE -> Over
+                return min(now + dt.timedelta(seconds=seconds + 3600), midnight)
+            return midnight  # Over -> Past
+
+        # The text follows the whole hours (2+ hours out), or else the minutes
+        raw_minutes = seconds // 60
+        step = 3600 if raw_minutes >= 120 else 60
+        # Seconds until 'seconds' drops below its current step boundary
+        until_change = seconds - (seconds // step) * step + 1
+        return min(now + dt.timedelta(seconds=until_change), midnight)
+
+#end CLASS ReminderBase
+
+
+class ReminderItem(ReminderBase):
+    __slots__ = ("_when", "_sort_key", "_descr", "_flags", "_notes", "_alert_sched",
+                 "_repeat_sched", "_uid", "_faux_date_str", "_countdown_str", "_display_strs")
+
+    # TODO: Add "alert_schedule" to the constructor argument
+    def __init__(self, when:dt.datetime, descr, flags="", notes="", repeat="", uid=None):
+        if when:
+            assert isinstance(when, dt.datetime),\
+                f"Reminder.when must be datetime, got {type(when)}: {when}"
+        if repeat:
+            # ToDo: decode repetition data?
+            pass
+
+        # ToDo: Take muted/active state as an init argument
+
+        self._when: datetime = when  # date & time
+        self._sort_key = self._make_sort_key(when)  # (An edit replaces the item, so it never changes)
+        self._descr = descr          # main reminder descr
+        self._flags = flags          # "". "!" (C.IS_CRTICAL_FLAG), "A' (alerts enabled), or !A
+        self._notes = notes          # optional notes (location, what to bring, etc)
+        self._alert_sched = None     # TODO: Store and read back actual alert-schedule
+        self._repeat_sched: str = repeat # TODO: Display in table as "Daily", "Weekly", "Custom", etc.
+        self._uid = uid              # Stable unique ID (int). Assigned by RemindersModel
+
+        self._faux_date_str = ""     # Date-override Used by countdown for imminent dates
+        self._countdown_str = ""     # Time remaining until the event or activity
+        self._display_strs = None    # Cached display strings (See _display_strings)
+    #end __init__
+
+#end CLASS ReminderItem
+
+
+class LazyReminderItem(ReminderItem):
+    """
+    A ReminderItem built from a csv row, for large files.
+    Only the sort key (when) and the flags are parsed up front.
+    The remaining fields are decoded from the stored row the first time
+    they are used, so the cost of a load follows what is displayed,
+    rather than the size of the file.
+    """
+    __slots__ = ("_row", "_decoded_notes", "_decoded_repeat")
+
+    def __init__(self, when: dt.datetime, row):
+        # (Don't call super(). It would decode everything.)
+        self._when = when
+        self._sort_key = self._make_sort_key(when)
+        self._row = row
+        self._flags = row[3] if len(row) > 3 else ""
+        self._uid = self._uid_from_csv_row(row)
+        self._alert_sched = None
+        self._faux_date_str = ""
+        self._countdown_str = ""
+        self._display_strs = None
+        self._decoded_notes = None
+        self._decoded_repeat = None
+
+    @classmethod
+    def from_csv_row(cls, row):
+        # csv row = [Title,Date,Time,Flag,Notes,Repeat]
+        date_str = row[1] if len(row) > 1 else ""
+        time_str = row[2] if len(row) > 2 else ""
+        return cls(fcn.datetime_from_iso(date_str, time_str), row)
+
+    # The decoded fields live in slots of their own, under other names,
+    # so the base class can keep using _descr, _notes, & _repeat_sched.
+    # (Those properties hide ReminderItem's slots of the same names.)
+    @property
+    def _descr(self):
+        return self._row[0]
+
+    @property
+    def _notes(self):
+        notes = self._decoded_notes
+        if notes is None:
+            notes = self._row[4] if len(self._row) > 4 else ""
+            if notes:
+                notes = fcn.decode_newlines(notes)     # Un-escape NLs
+            self._decoded_notes = notes
+        return notes
+
+    @property
+    def line_count(self):
+        # Counted from the stored row, so estimating row heights decodes nothing
+        if self._decoded_notes is not None:
+            return super().line_count
+        notes = self._row[4] if len(self._row) > 4 else ""
+        lines = self._row[0].count("\n") + 1
+        return lines + notes.count("\\n") + 1 if notes else lines
+
+    @property
+    def _repeat_sched(self):
+        repeat = self._decoded_repeat
+        if repeat is None:
+            # TODO: Decode JSON repeat string (stored as-is, for now)
+            repeat = self._row[5] if len(self._row) > 5 else ""
+            self._decoded_repeat = repeat
+        return repeat
+
+    @_repeat_sched.setter
+    def _repeat_sched(self, value):
+        self._decoded_repeat = value
+
+#end CLASS LazyReminderItem
\ No newline at end of file
@@ -0,0 +1,258 @@
+# reminder_store.py
+#
+# ReminderStore keeps the reminders in columns (typed arrays and string
+# tables) instead of one full ReminderItem object apiece. For very large
+# lists, that takes a fraction of the memory.
+#
+# RemindersModel then holds StoredReminder views. A view is a reminder
+# (a ReminderBase) whose fields are properties that read (and write) its
+# slot in the store, so everything that works with a ReminderItem works
+# with a view.
+#
+# When a reminder is deleted or replaced by an edit, the model releases
+# its view, and the slot is reused by the next add. (The released view is
+# detached from the store, so a stale one fails loudly instead of reading
+# another reminder's data.) Replaced strings leave dead bytes in the string
+# tables; a table is compacted (on a release) once they outweigh the live ones.
+
+from array import array
+
+import utilities as fcn
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+from app.model.reminder_item import ReminderBase
+
+NO_UID = -1
+COMPACT_MIN_BYTES = 64 * 1024  # (Don't bother compacting small tables)
+
+def _flags_byte(flags):
+    return sum(bit for ch, bit in C.FLAG_BITS.items() if ch in flags)
+
+class _StringTable:
+    """Strings packed in one utf-8 blob. Slot i is blob[starts[i]:ends[i]]"""
+    def __init__(self):
+        self._blob = bytearray()
+        self._starts = array("Q")
+        self._ends = array("Q")
+        self._dead = 0   # Bytes of replaced text still in the blob
+
+    def append(self, s):
+        self._starts.append(len(self._blob))
+        self._blob += s.encode("utf-8")
+        self._ends.append(len(self._blob))
+
+    def __getitem__(self, slot):
+        return self._blob[self._starts[slot]:self._ends[slot]].decode("utf-8")
+
+    def __setitem__(self, slot, s):
+        data = s.encode("utf-8")
+        start, end = self._starts[slot], self._ends[slot]
+        if len(data) <= end - start:
+            # It fits: Write it over the old text
+            self._blob[start:start + len(data)] = data
+            self._ends[slot] = start + len(data)
+            self._dead += end - start - len(data)
+        else:
+            self._dead += end - start
+            self._starts[slot] = len(self._blob)
+            self._blob += data
+            self._ends[slot] = len(self._blob)
+
+    def needs_compaction(self):
+        return self._dead >= COMPACT_MIN_BYTES and self._dead * 2 > len(self._blob)
+
+    def compact(self):
+        """Drop the dead bytes. (Slot numbers don't change)"""
+        blob = bytearray()
+        for slot, (start, end) in enumerate(zip(self._starts, self._ends)):
+            self._starts[slot] = len(blob)
+            blob += self._blob[start:end]
+            self._ends[slot] = len(blob)
+        self._blob = blob
+        self._dead = 0
+
+    def nbytes(self):
+        return len(self._blob) + 8 * (len(self._starts) + len(self._ends))
+
+class _StringPool:
+    """Few distinct values (repeat schedules, countdown strings): Each is stored once, by number"""
+    def __init__(self):
+        self._strings = [""]
+        self._ids = {"": 0}
+
+    def id_of(self, s):
+        found = self._ids.get(s)
+        if found is None:
+            found = self._ids[s] = len(self._strings)
+            self._strings.append(s)
+        return found
+
+    def __getitem__(self, string_id):
+        return self._strings[string_id]
+
+
+class ReminderStore:
+
+    def __init__(self):
+        self._whens = array("q")        # fcn.epoch_seconds (NO_DATE_EPOCH for None)
+        self._uids = array("q")         # NO_UID for None
+        self._flags = bytearray()       # C.FLAG_BITS
+        self._descrs = _StringTable()
+        self._notes = _StringTable()
+        self._pool = _StringPool()      # Repeat schedules, countdown & faux-date strings
+        self._repeats = array("I")      # (_pool ids)
+        self._countdowns = array("I")
+        self._faux_dates = array("I")
+        self._free = []                 # Released slots, for reuse
+
+    def __len__(self):
+        """Number of slots (including released ones, waiting to be reused)"""
+        return len(self._whens)
+
+    @property
+    def live_count(self):
+        return len(self._whens) - len(self._free)
+
+    def add(self, item):
+        """Copy a reminder into a slot. Returns its StoredReminder view"""
+        if self._free:
+            view = StoredReminder(self, self._free.pop())
+            view._when_secs = fcn.epoch_seconds(item._when)
+            view._uid = item.uid
+            view._flags = item._flags
+            view._descr = item._descr
+            view._notes = item._notes
+            view._repeat_sched = item._repeat_sched
+            view._countdown_str = item._countdown_str
+            view._faux_date_str = item._faux_date_str
+            return view
+        self._whens.append(fcn.epoch_seconds(item._when))
+        self._uids.append(NO_UID if item.uid is None else item.uid)
+        self._flags.append(_flags_byte(item._flags))
+        self._descrs.append(item._descr)
+        self._notes.append(item._notes)
+        self._repeats.append(self._pool.id_of(item._repeat_sched))
+        self._countdowns.append(self._pool.id_of(item._countdown_str))
+        self._faux_dates.append(self._pool.id_of(item._faux_date_str))
+        return StoredReminder(self, len(self._whens) - 1)
+
+    def release(self, view):
+        """
+        The view's reminder was deleted (or replaced): Its slot is free for
+        reuse. The view is detached, and must not be used again.
+        """
+        if view._store is not self:
+            return
+        slot = view._slot
+        self._descrs[slot] = ""   # (Counts its text as dead)
+        self._notes[slot] = ""
+        self._free.append(slot)
+        view._store = None
+        # (Compacting moves the other slots' text. RemindersModel releases views
+        # only while the background writer is idle, so it isn't reading them.)
+        for table in (self._descrs, self._notes):
+            if table.needs_compaction():
+                table.compact()
+
+    def nbytes(self):
+        """Approximate size of the columns (not counting the views)"""
+        arrays = (self._whens, self._uids, self._repeats, self._countdowns, self._faux_dates)
+        return (sum(a.itemsize * len(a) for a in arrays) + len(self._flags)
+                + self._descrs.nbytes() + self._notes.nbytes())
+
+    #end CLASS ReminderStore
+
+
+class StoredReminder(ReminderBase):
+    """
+    A reminder view of one slot in a ReminderStore. (The store holds the fields)
+    """
+    __slots__ = ("_store", "_slot", "_display_strs")
+
+    def __init__(self, store, slot):
+        self._store = store
+        self._slot = slot
+        self._display_strs = None  # (See ReminderBase._display_strings)
+
+    @property
+    def _when(self):
+        return fcn.from_epoch_seconds(self._store._whens[self._slot])
+
+    @property
+    def _when_secs(self):
+        return self._store._whens[self._slot]
+
+    @_when_secs.setter
+    def _when_secs(self, value):
+        # (Only when a released slot is reused. A view's 'when' never changes)
+        self._store._whens[self._slot] = value
+
+    @property
+    def _sort_key(self):
+        # Epoch seconds: No-date items (NO_DATE_EPOCH) still sort to the top.
+        # (Every item in a store-backed list is a view, so the keys are all ints)
+        return self._store._whens[self._slot]
+
+    @property
+    def _uid(self):
+        uid = self._store._uids[self._slot]
+        return None if uid == NO_UID else uid
+
+    @_uid.setter
+    def _uid(self, value):
+        self._store._uids[self._slot] = NO_UID if value is None else value
+
+    @property
+    def _flags(self):
+        return C.FLAG_STRINGS[self._store._flags[self._slot] & 3]
+
+    @_flags.setter
+    def _flags(self, value):
+        self._store._flags[self._slot] = _flags_byte(value)
+
+    @property
+    def _descr(self):
+        return self._store._descrs[self._slot]
+
+    @_descr.setter
+    def _descr(self, value):
+        self._store._descrs[self._slot] = value
+
+    @property
+    def _notes(self):
+        return self._store._notes[self._slot]
+
+    @_notes.setter
+    def _notes(self, value):
+        self._store._notes[self._slot] = value
+
+    @property
+    def _repeat_sched(self):
+        return self._store._pool[self._store._repeats[self._slot]]
+
+    @_repeat_sched.setter
+    def _repeat_sched(self, value):
+        self._store._repeats[self._slot] = self._store._pool.id_of(value)
+
+    @property
+    def _countdown_str(self):
+        return self._store._pool[self._store._countdowns[self._slot]]
+
+    @_countdown_str.setter
+    def _countdown_str(self, value):
+        self._store._countdowns[self._slot] = self._store._pool.id_of(value)
+
+    @property
+    def _faux_date_str(self):
+        return self._store._pool[self._store._faux_dates[self._slot]]
+
+    @_faux_date_str.setter
+    def _faux_date_str(self, value):
+        self._store._faux_dates[self._slot] = self._store._pool.id_of(value)
+
+    @property
+    def _alert_sched(self):
+        return None  # TODO: Store alert schedules (as ReminderItem does)
+
+    #end CLASS StoredReminder
@@ -9,28 +9,113 @@
 # pure data/logic layer consumed by the Qt table model.)
 
 #import datetime as dt   # contains date, time, & datetime classes
-#import utilities as fcn
+import utilities as fcn
+from bisect import bisect_right
+from contextlib import contextmanager
+from operator import attrgetter
 
 # noinspection PyPep8Naming
 import app.table_constants as C
+from app.model.reminder_item import ReminderItem
+from app.model.countdown_scheduler import CountdownScheduler
+from app.model import vector_countdowns
+
+# Each item caches its sort key. (See ReminderItem.sort_key)
+_sort_key = attrgetter("_sort_key")
 
 class RemindersModel:
-    def __init__(self, data_manager=None, reminder_list=None):
+    def __init__(self, data_manager=None, reminder_list=None, background_saves=False,
+                 columnar=False):
+        """
+        background_saves: When True, saves are handed to a PersistenceWorker,
+        which coalesces them and writes them on a background thread.
+        columnar: When True, the reminders are kept in a ReminderStore (typed
+        arrays & string tables), and the list holds lightweight views of it.
+        (Much less memory for very large lists.)
+        """
         self._reminder_items = []
+        self.data_manager = data_manager  # None when running on a mock list
+        self._save_worker = None
+        self._batch_depth = 0
+        self._batch_changes = []  # Changes held back until the batch ends
+        self._countdowns = CountdownScheduler()
+        self._countdown_now = None  # Time of the last countdown update
+        # Very large lists: All the countdowns in one NumPy pass (when NumPy is installed)
+        self._vector_countdowns = vector_countdowns.VectorCountdowns() if vector_countdowns.AVAILABLE else None
+        self.vector_min_items = C.VECTOR_COUNTDOWN_MIN_ITEMS
+        self._store = None
+        self._released = []  # Views waiting for the background writer to be idle (See _release)
+        if columnar:
+            from app.model.reminder_store import ReminderStore
+            self._store = ReminderStore()
+
         if reminder_list is not None:
             self._reminder_items = reminder_list
         elif data_manager is not None:
-            self.data_manager = data_manager
-            self._reminder_items = data_manager.load()
+            if self._store is not None and hasattr(data_manager, "iter_reminders"):
+                # Stream the items straight into the store
+                self._reminder_items = data_manager.iter_reminders()
+            else:
+                self._reminder_items = data_manager.load()
         else:
             raise ValueError("Need reminder_list or data_manager")
 
+        if self._store is not None:
+            self._reminder_items = [self._store.add(item) for item in self._reminder_items]
+            if hasattr(data_manager, "reminders"):
+                data_manager.reminders = self._reminder_items  # (Shared, as after load())
+
+        # Every item gets a stable ID. (Files from older versions have none.)
+        uids = [item.uid for item in self._reminder_items if item.uid is not None]
+        self._next_uid = max(uids, default=0) + 1
+        missing = [item for item in self._reminder_items if item.uid is None]
+        for item in missing:
+            self._assign_uid(item)
+        if missing and data_manager is not None:
+            data_manager.save(self._reminder_items)  # Write the new IDs out
+
+        # From here on, the list is kept in order as items come and go
+        self._row_of = {}  # uid -> row
+        self.sort()
+
+        if background_saves and data_manager is not None:
+            from app.persistence_worker import PersistenceWorker
+            self._save_worker = PersistenceWorker(data_manager)
+
     def update_countdown_values(self, now):
-        # 1. Delegate the update to the data model
-        # Update every item used for countdown calculations in the model's list
-        # Assuming self.reminder_list is your collection of ReminderItems
-        for item in self._reminder_items:
+        """
+        Bring the countdown (and TODAY/TOMORROW) strings up to date.
+        Only the items that are due for a change are updated. (See CountdownScheduler)
+        Returns the sorted list of rows whose strings changed.
+        """
+        self._drain_released()  # (A periodic chance to free slots once the writer is idle)
+        if self._vector_countdowns and len(self._reminder_items) >= self.vector_min_items:
+            self._countdown_now = None  # (The scheduler starts over if the list shrinks)
+            return self._vector_countdowns.update(self._reminder_items, now)
+        if self._vector_countdowns:
+            self._vector_countdowns.invalidate()  # (Its arrays are about to be out of date)
+
+        scheduler = self._countdowns
+        if self._countdown_now is None or now < self._countdown_now:
+            # First time (or the clock went back): Update everything
+            scheduler.clear()
+            due_items = self._reminder_items
+        else:
+            row_of = self._rows_by_uid()
+            items = self._reminder_items
+            due_items = [items[row_of[uid]] for uid in scheduler.pop_due(now) if uid in row_of]
+        self._countdown_now = now
+
+        changed = []
+        for item in due_items:
+            before = (item._countdown_str, item._faux_date_str)
             item.update_countdown(now)
+            scheduler.schedule(item, now)
+            if (item._countdown_str, item._faux_date_str) != before:
+                changed.append(item.uid)
+
+        row_of = self._rows_by_uid()
+        return sorted(row_of[uid] for uid in changed)
 
     def __len__(self):
         """Standard Python way to support len(model)"""
@@ -47,21 +132,158 @@ class RemindersModel:
 
     def sort(self):
         # Sort in date/time order. No-date items at top. Where item has date(datetime.date). time(datetime.time), or None
-        self._reminder_items.sort(key=lambda r: r.sort_key())
+        self._reminder_items.sort(key=_sort_key)
+        self._row_of = {}
+        self._reindex(0)
+        if self._vector_countdowns:
+            self._vector_countdowns.invalidate()
+
+    @contextmanager
+    def batch(self):
+        """
+        Group many changes into one operation:
+            with model.batch():
+                for row in reversed(selected_rows):
+                    model.delete(row)
+        Inside the batch, add() appends and update() replaces in place.
+        Sorting and persistence wait until the (outermost) batch ends:
+        Then the list is sorted once, and all the changes are saved at once.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.sort()
+                changes, self._batch_changes = self._batch_changes, []
+                if changes:
+                    self._persist(changes)
+
+    @property
+    def in_batch(self):
+        return self._batch_depth > 0
+
+    def _vector_rows_changed(self, removed=None, inserted=None):
+        """
+        Keep the NumPy countdown arrays in step with the list.
+        removed: a row number. inserted: a (row, reminder) pair.
+        (In a batch, they're simply rebuilt after the batch.)
+        """
+        engine = self._vector_countdowns
+        if engine is None:
+            return
+        if self.in_batch:
+            engine.invalidate()
+            return
+        if removed is not None:
+            engine.removed(removed)
+        if inserted is not None:
+            engine.inserted(*inserted)
+
+    def _reindex(self, first_row, last_row=None):
+        """Refresh the uid -> row map for rows first_row..last_row (default: to the end)"""
+        if self._row_of is None:
+            return  # (Rebuilt when it's needed. See _rows_by_uid)
+        items = self._reminder_items
+        stop = len(items) if last_row is None else min(last_row + 1, len(items))
+        row_of = self._row_of
+        for row in range(first_row, stop):
+            row_of[items[row].uid] = row
+
+    def _stored(self, reminder):
+        """In columnar mode, the reminder's view in the store. (Otherwise, the reminder)"""
+        return reminder if self._store is None else self._store.add(reminder)
+
+    def _release(self, reminder):
+        """
+        In columnar mode, free the (deleted or replaced) reminder's slot in the store.
+        While the background writer is busy, the slot is held back: The writer's
+        snapshot may still include the reminder. (See PersistenceWorker)
+        """
+        if self._store is None:
+            return
+        self._released.append(reminder)
+        self._drain_released()
+
+    def _drain_released(self):
+        """Free the held-back slots, if the background writer is idle"""
+        if self._released and (self._save_worker is None or self._save_worker.idle):
+            for view in self._released:
+                self._store.release(view)
+            self._released.clear()
+
+    def _assign_uid(self, reminder):
+        reminder.uid = self._next_uid
+        self._next_uid += 1
+
+    def _insertion_row(self, reminder):
+        """Where the reminder goes in the sorted list (after any equal items)"""
+        return bisect_right(self._reminder_items, reminder.sort_key(), key=_sort_key)
+
+    def insertion_row(self, reminder, replacing=None):
+        """
+        The row add() will put the reminder in. Or, with replacing=row_idx,
+        the row update(row_idx, reminder) will move it to.
+        (So a View can be told about the change before it happens)
+        """
+        key = reminder.sort_key() if self._store is None else fcn.epoch_seconds(reminder._when)
+        row_idx = bisect_right(self._reminder_items, key, key=_sort_key)
+        if replacing is not None and row_idx > replacing:
+            row_idx -= 1  # (The old item is gone by then)
+        return row_idx
 
     def add(self, reminder):
-        self._reminder_items.append(reminder)
-        self.sort()
-        self.save()
+        """Insert the reminder in sorted order. Returns its row"""
+        if reminder.uid is None or reminder.uid in self._rows_by_uid():
+            self._assign_uid(reminder)
+        reminder = self._stored(reminder)
+        # (In a batch, the list is sorted when the batch ends)
+        row_idx = len(self._reminder_items) if self.in_batch else self._insertion_row(reminder)
+        self._countdowns.mark_dirty(reminder.uid)
+        self._reminder_items.insert(row_idx, reminder)
+        self._vector_rows_changed(inserted=(row_idx, reminder))
+        self._reindex(row_idx)
+        self._persist([(C.JOURNAL_ADD, None, reminder.to_csv_row())])
+        return row_idx
 
     def update(self, row_idx, reminder):
-        self._reminder_items[row_idx] = reminder
-        self.sort()
-        self.save()
+        """Replace the reminder at row_idx. Returns the row it moved to"""
+        old_item = self._reminder_items[row_idx]
+        old_row = old_item.to_csv_row()
+        reminder.uid = old_item.uid  # (The edited reminder keeps its ID)
+        reminder = self._stored(reminder)
+        self._countdowns.mark_dirty(reminder.uid)
+        if self.in_batch:
+            self._vector_rows_changed()
+            self._reminder_items[row_idx] = reminder
+            self._release(old_item)
+            self._persist([(C.JOURNAL_UPDATE, old_row, reminder.to_csv_row())])
+            return row_idx
+        del self._reminder_items[row_idx]
+        new_row_idx = self._insertion_row(reminder)
+        self._reminder_items.insert(new_row_idx, reminder)
+        self._release(old_item)
+        self._vector_rows_changed(removed=row_idx, inserted=(new_row_idx, reminder))
+        # Only the rows between the old & new positions have shifted
+        self._reindex(min(row_idx, new_row_idx), max(row_idx, new_row_idx))
+        self._persist([(C.JOURNAL_UPDATE, old_row, reminder.to_csv_row())])
+        return new_row_idx
 
     def delete(self, row_idx):
+        old_item = self._reminder_items[row_idx]
+        old_row = old_item.to_csv_row()
         del self._reminder_items[row_idx]
-        self.save()
+        self._countdowns.remove(old_item.uid)
+        self._vector_rows_changed(removed=row_idx)
+        if self.in_batch:
+            # Many deletes in a row: Rebuild the map once, when it's needed
+            self._row_of = None
+        else:
+            del self._row_of[old_item.uid]
+            self._reindex(row_idx)
+        self._release(old_item)
+        self._persist([(C.JOURNAL_DELETE, old_row, None)])
 
     def get_reminder(self, row_idx: int) -> ReminderItem:
         """Returns the ReminderItem at the specified index."""
@@ -75,18 +297,73 @@ class RemindersModel:
         Returns the integer row index of a specific ReminderItem.
         Used by the View to locate a new or edited item after a sort.
         """
-        try:
-            return self._reminder_items.index(item)
-        except ValueError:
-            return -1  # Not found
+        return self._rows_by_uid().get(item.uid, -1)  # -1: Not found
+
+    def row_of_uid(self, uid):
+        """Row of the reminder with the given ID, or -1"""
+        return self._rows_by_uid().get(uid, -1)
+
+    def _rows_by_uid(self):
+        if self._row_of is None:
+            self._row_of = {}
+            self._reindex(0)
+        return self._row_of
+
+    def uids(self):
+        """The reminders' IDs, in row order"""
+        return [item.uid for item in self._reminder_items]
 
     def toggle_item_flag(self, row_idx):
         reminder = self.get_reminder(row_idx)
+        old_row = reminder.to_csv_row()
         reminder.toggle_critical()
-        self.save()  # Persist the change
+        self._persist([(C.JOURNAL_UPDATE, old_row, reminder.to_csv_row())])  # Persist the change
+
+    def _persist(self, changes):
+        """
+        Hand a list of (op, old_row, new_row) changes to the data manager.
+        (It journals them, or saves the whole list.)
+        """
+        if self.in_batch:
+            self._batch_changes.extend(changes)
+            return
+        if self.data_manager is None:
+            return
+        if self._save_worker:
+            self._save_worker.submit(self._reminder_items, changes)
+        else:
+            self.data_manager.log_changes(self._reminder_items, changes)
 
     def save(self):
-        # Now that you stored the manager, this works!
-        self.data_manager.save(self._reminder_items)
+        # Full save. (Also folds any journaled changes into the CSV file)
+        # Waits for the write to finish, even when saving in the background.
+        if self.data_manager is None:
+            return
+        if self._save_worker:
+            self._save_worker.submit(self._reminder_items)
+            self._save_worker.flush()
+            self._drain_released()
+        else:
+            self.data_manager.save(self._reminder_items)
+
+    @property
+    def pending_writes(self):
+        """Number of save requests waiting for the background writer"""
+        return self._save_worker.pending_writes if self._save_worker else 0
+
+    def flush(self):
+        """Wait until pending background saves are on disk. (Raises the error if a save fails)"""
+        if self._save_worker:
+            self._save_worker.flush()
+            self._drain_released()
+
+    def close(self):
+        """Final flush. Stops the background writer. (Raises the error if the final save fails)"""
+        if self._save_worker:
+            try:
+                self._save_worker.stop()
+            finally:
+                self._save_worker = None
+            self._drain_released()
 
 #end CLASS ReminderDataModel
@@ -0,0 +1,146 @@
+# vector_countdowns.py
+#
+# A NumPy version of ReminderItem.update_countdown() for very large lists.
+# The reminders' 'when' values are kept in an int64 array (epoch seconds),
+# and one pass over the arrays sorts every reminder into a countdown
+# category (NOW, LATE, "in N days", etc.) plus the number shown in the text.
+# Only the items whose category or number changed get new strings, and the
+# strings are shared (one per distinct text).
+#
+# NumPy is optional. Without it, AVAILABLE is False and RemindersModel
+# uses the CountdownScheduler only.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import utilities as fcn
+
+AVAILABLE = np is not None
+
+SECS_PER_DAY = 86400
+
+# Countdown categories. (They follow the rules in ReminderItem.update_countdown)
+NO_DATE, PAST, DAYS, TOMORROW, LATE, OVER, NOW, HOURS, HOUR_MIN, MINUTES = range(10)
+
+_strings = {}  # (category, number) -> (countdown, faux date). Shared by all items
+
+def countdown_strings(code, value):
+    """The (countdown, faux date) strings for a category & number"""
+    key = (code, value)
+    found = _strings.get(key)
+    if found is None:
+        found = _strings[key] = _make_strings(code, value)
+    return found
+
+def _make_strings(code, value):
+    if code == NO_DATE: return "", ""
+    if code == PAST: return "Past", ""
+    if code == DAYS: return f"in {fcn.pluralize(value, 'day')}", ""
+    if code == TOMORROW: return "in 1 day", "TOMORROW"
+    if code == LATE: return "LATE", "TODAY"
+    if code == OVER: return "Over", "TODAY"
+    if code == NOW: return "NOW", "TODAY"
+    if code == HOURS: return f"in {fcn.pluralize(value, 'hour')}", "TODAY"
+    if code == HOUR_MIN: return f"in 1 hour, {value} min", "TODAY"
+    return f"in {fcn.pluralize(value, 'minute')}", "TODAY"
+
+def countdown_codes(whens, now):
+    """
+    whens: int64 array of fcn.epoch_seconds() values.
+    Returns (categories, numbers) arrays. (The number is 0 where the text has none.)
+    """
+    if not now:
+        return np.full(len(whens), NO_DATE, np.int8), np.zeros(len(whens), np.int64)
+
+    now_secs = fcn.epoch_seconds(now)
+    no_date = whens == fcn.NO_DATE_EPOCH
+    safe_whens = np.where(no_date, now_secs, whens)  # (Keep the math clear of -2**63)
+
+    days = safe_whens // SECS_PER_DAY - now_secs // SECS_PER_DAY
+    seconds = safe_whens - now_secs
+    if now.microsecond:
+        # update_countdown truncates (when - now) toward zero
+        seconds = np.where(seconds > 0, seconds - 1, seconds)
+    has_time = safe_whens % SECS_PER_DAY != 0
+    late = (seconds < 0) & has_time
+
+    raw_minutes = seconds // 60
+    hours = (raw_minutes // 15 * 15) // 60
+
+    codes = np.select(
+        [no_date, days < 0, days > 1, days == 1,
+         late & (seconds > -3600), late,
+         raw_minutes == 0, hours >= 2, hours == 1],
+        [NO_DATE, PAST, DAYS, TOMORROW,
+         LATE, OVER,
+         NOW, HOURS, HOUR_MIN],
+        default=MINUTES).astype(np.int8)
+
+    values = np.where(codes == DAYS, days,
+             np.where(codes == HOURS, hours,
+             np.where((codes == HOUR_MIN) | (codes == MINUTES), raw_minutes, 0)))
+    return codes, values
+
+def _epoch_seconds(when, epoch=fcn.EPOCH):
+    """fcn.epoch_seconds(), trimmed for speed. (Called once per item)"""
+    if when is None:
+        return fcn.NO_DATE_EPOCH
+    delta = when - epoch
+    return delta.days * SECS_PER_DAY + delta.seconds
+
+class VectorCountdowns:
+    """
+    The arrays for one list of reminders. Tell it when rows come and go
+    (inserted/removed), or call invalidate() to rebuild them from scratch.
+    """
+    def __init__(self):
+        self._whens = None
+        self._codes = None
+        self._values = None
+
+    def invalidate(self):
+        self._whens = self._codes = self._values = None
+
+    def inserted(self, row, item):
+        if self._whens is None:
+            return
+        self._whens = np.insert(self._whens, row, _epoch_seconds(item._when))
+        if self._codes is not None:
+            # (No category: The new row counts as changed on the next update)
+            self._codes = np.insert(self._codes, row, -1)
+            self._values = np.insert(self._values, row, 0)
+
+    def removed(self, row):
+        if self._whens is None:
+            return
+        self._whens = np.delete(self._whens, row)
+        if self._codes is not None:
+            self._codes = np.delete(self._codes, row)
+            self._values = np.delete(self._values, row)
+
+    def update(self, items, now):
+        """Update the items' countdown strings. Returns the rows whose strings changed"""
+        if self._whens is None or len(self._whens) != len(items):
+            self._whens = np.fromiter((_epoch_seconds(r._when) for r in items),
+                                      np.int64, len(items))
+            self._codes = self._values = None
+
+        codes, values = countdown_codes(self._whens, now)
+        if self._codes is None:
+            rows = np.arange(len(items))  # (Check them all)
+        else:
+            rows = np.flatnonzero((codes != self._codes) | (values != self._values))
+        self._codes, self._values = codes, values
+
+        changed = []
+        for row, code, value in zip(rows.tolist(), codes[rows].tolist(), values[rows].tolist()):
+            item = items[row]
+            countdown, faux_date = countdown_strings(code, value)
+            if item._countdown_str != countdown or item._faux_date_str != faux_date:
+                item._countdown_str, item._faux_date_str = countdown, faux_date
+                changed.append(row)
+        return changed
+
+    #end CLASS VectorCountdowns
@@ -0,0 +1,149 @@
+# persistence_worker.py
+#
+# PersistenceWorker moves disk writes off the GUI thread. RemindersModel
+# hands it save requests. Requests that arrive within the debounce window
+# are coalesced into a single write, made by a background thread from a
+# snapshot (a tuple) of the reminders list.
+#
+# The tuple holds the items themselves, not copies (copying a large list
+# on every edit would cost more than the write). That's safe because the
+# model never changes a saved field of an item the writer may be reading:
+#   - An edit replaces the item. (The writer keeps the old one.)
+#   - A flag toggle assigns the item a new flags string. The writer sees
+#     the old flags or the new ones, and the toggle queues a write of its own.
+#   - Countdown strings are changed in place, but they aren't saved.
+#   - In columnar mode, a deleted item's store slot isn't reused until the
+#     writer is idle. (See RemindersModel._release)
+#
+# A failed write stays queued, and is tried again after SAVE_RETRY_SECS.
+# flush() and stop() raise the error, so the caller knows the data isn't
+# on disk.
+#
+# The data manager (RemindersPersistence or RemindersDatabase) is then used
+# only by the worker thread.
+
+import threading, time
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+class PersistenceWorker:
+
+    def __init__(self, data_manager, debounce_secs=C.SAVE_DEBOUNCE_SECS):
+        self.data_manager = data_manager
+        self.debounce_secs = debounce_secs
+
+        self._cond = threading.Condition()
+        self._snapshot = ()       # Latest copy of the reminders list
+        self._changes = []        # Journal records, in order
+        self._full_save = False   # A full save makes the journal records redundant
+        self._pending = 0         # Requests that haven't been written yet
+        self._due = None          # When the next write is due (time.monotonic)
+        self._writing = False
+        self._stopping = False
+        self._error = None        # Exception from the last write (None once one succeeds)
+
+        self._thread = threading.Thread(target=self._run, name="PersistenceWorker", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending_writes(self):
+        """Number of save requests not yet written (for tests)"""
+        with self._cond:
+            return self._pending
+
+    @property
+    def idle(self):
+        """True when nothing is waiting to be written, or being written"""
+        with self._cond:
+            return not self._pending and not self._writing
+
+    @property
+    def last_error(self):
+        with self._cond:
+            return self._error
+
+    def submit(self, reminders, changes=None):
+        """
+        Queue a save request. 'changes' is a list of (op, old_row, new_row)
+        journal records. (None requests a full save.)
+        """
+        with self._cond:
+            self._snapshot = tuple(reminders)
+            if changes is None:
+                self._full_save = True
+            else:
+                self._changes.extend(changes)
+            self._pending += 1
+            if self._due is None:
+                # The first request opens the debounce window
+                self._due = time.monotonic() + self.debounce_secs
+            self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Write anything that's pending right now, and wait until it's done.
+        Raises the write's exception if it fails. (The changes stay queued.)
+        Returns False if the timeout expires first.
+        """
+        with self._cond:
+            if self._pending:
+                self._error = None
+                self._due = time.monotonic()
+                self._cond.notify_all()
+            done = self._cond.wait_for(
+                lambda: self._error is not None or (not self._pending and not self._writing), timeout)
+            if self._error is not None:
+                raise self._error
+            return done
+
+    def stop(self):
+        """Final flush, then end the thread. (Raises the error if the final write fails)"""
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # Sleep until a write is due (or we're told to stop)
+                while not self._stopping and (self._due is None or time.monotonic() < self._due):
+                    timeout = None if self._due is None else self._due - time.monotonic()
+                    self._cond.wait(timeout)
+
+                if self._stopping:
+                    return  # (stop() has flushed)
+
+                # Take everything that's been requested so far
+                snapshot, changes, full_save = self._snapshot, self._changes, self._full_save
+                count = self._pending
+                self._changes, self._full_save, self._due = [], False, None
+                self._writing = True
+
+            try:
+                if full_save:
+                    self.data_manager.save(snapshot)
+                else:
+                    self.data_manager.log_changes(snapshot, changes)
+            except Exception as e:
+                with self._cond:
+                    # Keep the request queued, and try again later. As a full save:
+                    # Some of the journal records may have been written already.
+                    self._error = e
+                    self._changes[:0] = changes
+                    self._full_save = True
+                    self._due = time.monotonic() + C.SAVE_RETRY_SECS
+                    self._writing = False
+                    self._cond.notify_all()
+            else:
+                with self._cond:
+                    self._error = None
+                    self._pending -= count
+                    self._writing = False
+                    self._cond.notify_all()
+
+    #end CLASS PersistenceWorker
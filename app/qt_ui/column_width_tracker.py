@@ -0,0 +1,232 @@
+# column_width_tracker.py
+#
+# ColumnWidthTracker sizes the table's columns without re-measuring the
+# whole table. It keeps each row's measured text widths (in both the
+# regular and the bold font, so toggling a reminder's critical flag costs
+# nothing), and a count of the widths in each column, so the widest is
+# known at all times. When rows are added, removed, or changed, only those
+# rows are measured. A column's width is reported only when its clamped
+# width (ColDef.min_w..max_w) actually changes.
+#
+# Many rows at once (a fetched page, a rebuild) are measured WIDTH_MEASURE_CHUNK
+# rows at a time: the first chunk right away, the rest from a timer, so the
+# GUI thread never stalls. The columns widen as the results come in.
+
+from collections import Counter, deque
+
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+
+# noinspection PyPep8Naming
+import table_constants as C
+import font_registry
+
+DESCR_PADDING = 20
+CELL_PADDING = 12
+
+class _RowWidths:
+    """Measured text widths for one row. (None until the row is measured)"""
+    __slots__ = ("uid", "is_bold", "regular", "bold", "dropped")
+
+    def __init__(self, uid, is_bold=False, regular=None, bold=None):
+        self.uid = uid
+        self.is_bold = is_bold
+        self.regular = regular   # Per column, in the regular font
+        self.bold = bold         # ...and in the bold font
+        self.dropped = False     # Its row was removed before it was measured
+
+    @property
+    def measured(self):
+        return self.regular is not None
+
+    def widths(self):
+        return self.bold if self.is_bold else self.regular
+
+
+class ColumnWidthTracker(QObject):
+    width_changed = Signal(int, int)   # (column, width)
+
+    def __init__(self, model_adapter, font, parent=None):
+        super().__init__(parent)
+        self._model = model_adapter
+        self._num_cols = len(C.ALL_COLS)
+        self._rows = []          # _RowWidths, in row order
+        self._counts = [Counter() for _ in range(self._num_cols)]   # width -> number of rows
+        self._max = [0] * self._num_cols
+        self._widths = [None] * self._num_cols   # The (clamped) widths last reported
+        self._ready = False           # Nothing is tracked until the first rebuild()
+        self._rebuild_pending = False
+        self._unmeasured = deque()    # Entries waiting to be measured (in chunks)
+        self._chunk_scheduled = False
+        self.chunk_rows = C.WIDTH_MEASURE_CHUNK
+        self.measure_count = 0        # Cells measured (for testing)
+        self._set_metrics(font)
+
+        model_adapter.rowsInserted.connect(self._on_rows_inserted)
+        model_adapter.rowsAboutToBeRemoved.connect(self._on_rows_removed)
+        model_adapter.rowsMoved.connect(self._on_rows_moved)
+        model_adapter.dataChanged.connect(self._on_data_changed)
+        model_adapter.layoutChanged.connect(self._on_layout_changed)
+        model_adapter.modelReset.connect(self._schedule_rebuild)
+
+    def _set_metrics(self, font):
+        self._regular_fm = font_registry.metrics(font_registry.matching(font))
+        self._bold_fm = font_registry.metrics(font_registry.matching(font, bold=True))
+
+    def set_font(self, font):
+        """The table font changed: Measure everything again"""
+        self._set_metrics(font)
+        self.rebuild()
+
+    def width(self, col):
+        """The column's clamped width"""
+        return self._widths[col]
+
+    # ------------------------
+    # Measuring
+    # ------------------------
+    def _measure_cell(self, row, col):
+        """(regular, bold) width of a cell's text"""
+        self.measure_count += 1
+        text = self._model.data(self._model.index(row, col), Qt.DisplayRole) or ""
+        regular, bold = self._regular_fm.horizontalAdvance, self._bold_fm.horizontalAdvance
+        if col == C.DESCR_IDX:
+            # Multi-line. Only the first line is bold for a critical reminder
+            first, *rest = text.split("\n")
+            rest_w = max((regular(line) for line in rest), default=0)
+            return max(regular(first), rest_w), max(bold(first), rest_w)
+        return regular(text), bold(text)
+
+    def _measure_row(self, row, entry):
+        entry.is_bold = bool(self._model.get_reminder(row).is_critical)
+        cells = [self._measure_cell(row, col) for col in range(self._num_cols)]
+        entry.regular, entry.bold = [w for w, _ in cells], [w for _, w in cells]
+
+    def _queue_rows(self, first, last):
+        """Entries for the rows, to be measured a chunk at a time"""
+        get_reminder = self._model.get_reminder
+        entries = [_RowWidths(get_reminder(row).uid) for row in range(first, last + 1)]
+        self._unmeasured.extend(entries)
+        return entries
+
+    def _measure_chunk(self):
+        """Measure the next chunk of queued rows. (Reports any widths that changed)"""
+        self._chunk_scheduled = False
+        row_of_uid = self._model.row_of_uid
+        measured = 0
+        while self._unmeasured and measured < self.chunk_rows:
+            entry = self._unmeasured.popleft()
+            if entry.dropped:
+                continue
+            self._measure_row(row_of_uid(entry.uid), entry)
+            self._add(entry)
+            measured += 1
+        self._report()
+        if self._unmeasured and not self._chunk_scheduled:
+            self._chunk_scheduled = True
+            QTimer.singleShot(0, self._measure_chunk)
+
+    # ------------------------
+    # The running maximums
+    # ------------------------
+    def _add(self, entry):
+        if not entry.measured:
+            return
+        for col, w in enumerate(entry.widths()):
+            self._counts[col][w] += 1
+            if w > self._max[col]:
+                self._max[col] = w
+
+    def _remove(self, entry):
+        if not entry.measured:
+            return
+        for col, w in enumerate(entry.widths()):
+            counts = self._counts[col]
+            counts[w] -= 1
+            if not counts[w]:
+                del counts[w]
+                if w == self._max[col]:
+                    self._max[col] = max(counts, default=0)
+
+    def _report(self):
+        """Emit width_changed for each column whose clamped width changed"""
+        for col, col_def in enumerate(C.ALL_COLS):
+            padding = DESCR_PADDING if col == C.DESCR_IDX else CELL_PADDING
+            width = max(col_def.min_w, min(self._max[col] + padding, col_def.max_w))
+            if width != self._widths[col]:
+                self._widths[col] = width
+                self.width_changed.emit(col, width)
+
+    def rebuild(self):
+        """Measure every row (the first chunk right away). Reports every column's width"""
+        self._ready = True
+        self._rebuild_pending = False
+        self._unmeasured.clear()
+        self._rows = self._queue_rows(0, self._model.rowCount() - 1)
+        self._counts = [Counter() for _ in range(self._num_cols)]
+        self._max = [0] * self._num_cols
+        self._widths = [None] * self._num_cols
+        self._measure_chunk()
+
+    def _schedule_rebuild(self):
+        # After a model reset. (Coalesced with a set_font that usually follows)
+        if self._ready and not self._rebuild_pending:
+            self._rebuild_pending = True
+            QTimer.singleShot(0, self._rebuild_if_pending)
+
+    def _rebuild_if_pending(self):
+        if self._rebuild_pending:
+            self.rebuild()
+
+    def _tracking(self):
+        return self._ready and not self._rebuild_pending
+
+    # ------------------------
+    # Model changes
+    # ------------------------
+    def _on_rows_inserted(self, parent, first, last):
+        if not self._tracking():
+            return
+        self._rows[first:first] = self._queue_rows(first, last)
+        self._measure_chunk()
+
+    def _on_rows_removed(self, parent, first, last):
+        if not self._tracking():
+            return
+        for entry in self._rows[first:last + 1]:
+            self._remove(entry)
+            entry.dropped = True
+        del self._rows[first:last + 1]
+        self._report()
+
+    def _on_rows_moved(self, parent, first, last, dest_parent, dest):
+        # (dest: the row they went in front of, in the old order)
+        if not self._tracking():
+            return
+        moved = self._rows[first:last + 1]
+        del self._rows[first:last + 1]
+        if dest > last:
+            dest -= len(moved)
+        self._rows[dest:dest] = moved
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if not self._tracking() or not top_left.isValid():
+            return
+        for row in range(top_left.row(), min(bottom_right.row() + 1, len(self._rows))):
+            entry = self._rows[row]
+            if not entry.measured:
+                continue  # (It's measured with the new data when its turn comes)
+            self._remove(entry)
+            entry.is_bold = bool(self._model.get_reminder(row).is_critical)
+            for col in range(top_left.column(), bottom_right.column() + 1):
+                entry.regular[col], entry.bold[col] = self._measure_cell(row, col)
+            self._add(entry)
+        self._report()
+
+    def _on_layout_changed(self, *args):
+        # Rows moved. The widths go with their reminders
+        if not self._tracking():
+            return
+        row_of_uid = self._model.row_of_uid
+        self._rows.sort(key=lambda entry: row_of_uid(entry.uid))
+
+    #end CLASS ColumnWidthTracker
@@ -5,6 +5,7 @@ from PySide6.QtGui import QFont
 import datetime as dt
 
 from app.config import config
+import utilities as fcn
 
 class DateBannerWindow(QMainWindow):
     def __init__(self):
@@ -87,7 +88,7 @@ class DateBannerWindow(QMainWindow):
     def update_date_label(self):
         today = dt.date.today()
         day_format = f"%a,  {config.date_display_format}"
-        day_and_date = today.strftime(day_format)   #("%a, %d %b %Y")
+        day_and_date = fcn.format_datetime(today, day_format)   #("%a, %d %b %Y")
         self.date_label = QLabel(day_and_date)
         self._last_banner_date = dt.date
 
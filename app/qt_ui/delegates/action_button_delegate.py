@@ -0,0 +1,93 @@
+from PySide6.QtCore import Qt, QEvent, QSize, QPersistentModelIndex, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle, QApplication
+
+# noinspection PyPep8Naming
+import table_constants as C
+from app.config import config
+from icon_cache import icon_pixmap
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Paints an action-button column (EDIT, ALERTS, NEXT, DEL) and turns
+    clicks on it into clicked(action_id, row) signals.
+    There are no button widgets: Only the visible cells are painted.
+    Hover: The view doesn't pass hover events to delegates. With WA_Hover
+    on its viewport (See RemindersWindow), it marks the cell under the mouse
+    State_MouseOver, and repaints the cells the mouse enters & leaves.
+    """
+    clicked = Signal(str, int)   # (Action ID, row)
+
+    PAD = 6   # Space around the icon
+
+    def __init__(self, action_id, parent=None):
+        super().__init__(parent)
+        self.action_id = action_id
+        self._btn_cfg = C.ICON_MAP[action_id]
+        self._base_size = 24 if action_id == "ALERTS" else 22   # (At scale_factor 1)
+        self._pressed = None      # Cell under a mouse press (drawn sunken until release)
+
+    def _icon_and_color(self, index):
+        """The icon to show, which depends on the reminder's state"""
+        cfg = self._btn_cfg
+        icon_str, icon_color = cfg["icon"], cfg["color"]
+        if self.action_id == "ALERTS" and not index.data(C.ALERTS_ROLE):
+            icon_str = cfg.get("off_icon", icon_str)
+            icon_color = "lightgray"
+        elif self.action_id == "NEXT" and not index.data(C.REPEATS_ROLE):
+            icon_color = "lightgray"
+        return icon_str, icon_color
+
+    def _icon_size(self):
+        side = int(self._base_size * config.scale_factor)
+        return QSize(side, side)
+
+    def sizeHint(self, option, index):
+        # (The text sets the row height. The icon shrinks to fit a one-line row)
+        size = self._icon_size()
+        return QSize(size.width() + self.PAD, option.fontMetrics.height())
+
+    def paint(self, painter, option, index):
+        # Cell background (alternating row colors, etc.)
+        super().paint(painter, option, index)
+
+        rect = option.rect
+        is_pressed = (self._pressed == QPersistentModelIndex(index)
+                      and QApplication.mouseButtons() & Qt.MouseButton.LeftButton)
+        if is_pressed or option.state & QStyle.StateFlag.State_MouseOver:
+            painter.save()
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 40 if is_pressed else 16))
+            painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 4, 4)
+            painter.restore()
+
+        icon_rect = rect if not is_pressed else rect.translated(1, 1)
+        size = self._icon_size()
+        if size.height() > rect.height() - 2:
+            side = max(rect.height() - 2, 1)
+            size = QSize(side, side)
+        icon_str, icon_color = self._icon_and_color(index)
+        enabled = bool(option.state & QStyle.StateFlag.State_Enabled)
+        pixmap = icon_pixmap(icon_str, icon_color, size, painter.device().devicePixelRatioF(), enabled)
+        painter.drawPixmap(icon_rect.x() + (icon_rect.width() - size.width()) // 2,
+                           icon_rect.y() + (icon_rect.height() - size.height()) // 2,
+                           pixmap)
+
+    # Press, then release on the same cell = a click
+    def editorEvent(self, event, table_model, option, index):
+        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+            self._pressed = QPersistentModelIndex(index)
+            self._repaint(option)
+            return True
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            was_pressed, self._pressed = self._pressed, None
+            self._repaint(option)
+            if was_pressed == QPersistentModelIndex(index) and option.rect.contains(event.position().toPoint()):
+                self.clicked.emit(self.action_id, index.row())
+            return True
+        return False
+
+    @staticmethod
+    def _repaint(option):
+        if option.widget is not None:
+            option.widget.viewport().update(option.rect)
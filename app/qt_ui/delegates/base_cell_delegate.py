@@ -1,7 +1,8 @@
 from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont, QFontMetrics
 from PySide6.QtWidgets import QStyledItemDelegate
 
+import font_registry
+
 from typing import cast, TYPE_CHECKING
 if TYPE_CHECKING:
     from model_adapter import ModelAdapter
@@ -21,9 +22,8 @@ class BaseCellDelegate(QStyledItemDelegate):
         # Check if the row is critical (Needs Bold space)
         reminder = index.model().get_reminder(index.row())
         if reminder and reminder.is_critical:
-            bold_font = QFont(option.font)
-            bold_font.setBold(True)
-            fm = QFontMetrics(bold_font)  # Use the wider bold metrics
+            # Use the wider bold metrics
+            fm = font_registry.metrics(font_registry.matching(option.font, bold=True))
 
         # Calculate width based on the actual text content
         text = str(index.data() or "")
@@ -0,0 +1,11 @@
+from .centered_delegate import CenteredDelegate
+
+from render_cache import render_cache
+
+class CachedCellDelegate(CenteredDelegate):
+    """
+    A CenteredDelegate whose cells are painted by way of the RenderCache
+    (For the cells that change only when the reminder does: Day, Date, Time)
+    """
+    def paint(self, painter, option, index):
+        render_cache.paint(painter, option, index, super().paint)
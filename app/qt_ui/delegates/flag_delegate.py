@@ -1,8 +1,12 @@
 from PySide6.QtCore import QEvent, Signal
 from .base_cell_delegate import BaseCellDelegate
+from render_cache import render_cache
 
 class FlagDelegate(BaseCellDelegate):
 
+    def paint(self, painter, option, index):
+        render_cache.paint(painter, option, index, super().paint)
+
     # Event can be button press or button release
     def editorEvent(self, event, table_model, option, index):
         if event.type() == QEvent.MouseButtonRelease:
@@ -2,12 +2,15 @@ import sys
 
 from PySide6.QtCore import Qt
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QFont, QTextDocument, QFontMetrics, QColor  #, QTextOption
+from PySide6.QtGui import QColor  #, QTextOption
 from PySide6.QtWidgets import QStyledItemDelegate
 
 # noinspection PyPep8Naming
 import table_constants as C
 from app.config import config
+from text_layout_cache import layout_cache
+from render_cache import render_cache
+import font_registry
 
 import os
 #import sys, traceback
@@ -65,25 +68,17 @@ class LeftJustifiedDelegate(QStyledItemDelegate):
         if width <= 1:
             width = option.widget.columnWidth(index.column())
         
-        doc = QTextDocument()
-        doc.setDocumentMargin(0)
-
-        # Update the font with the configured point size
-        f=QFont(option.font)
-        f.setPointSize(config.cell_font_pt_size)
-        doc.setDefaultFont(f)
-
-        doc.setPlainText(text)
-        doc.setTextWidth(width)
+        # The font at the configured point size
+        f = font_registry.get_font(option.font.family(), config.cell_font_pt_size)
 
         # Calculate height for a single line
-        metrics = QFontMetrics(f)
+        metrics = font_registry.metrics(f)
         line_height = metrics.lineSpacing()
 
         # Get the actual number of lines (after wrapping)
-        # doc.lineCount() is the most accurate way to see how many
-        # lines the text takes up inside the current 'width'.
-        actual_lines = doc.lineCount()
+        # A QTextDocument's lineCount() is the most accurate way to see how many
+        # lines the text takes up inside the current 'width'. (Cached. See TextLayoutCache)
+        actual_lines = layout_cache.line_count(text, width, f)
 
         # Apply the User Governor (Max Lines)
         # e.g., the doce has 5 lines, but the user set max to 3
@@ -114,6 +109,14 @@ class LeftJustifiedDelegate(QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
+        # The description changes only with the reminder: Draw it from the render cache
+        # (The countdown changes by the minute)
+        if index.column() == C.DESCR_IDX:
+            render_cache.paint(painter, option, index, self._paint_cell)
+        else:
+            self._paint_cell(painter, option, index)
+
+    def _paint_cell(self, painter, option, index):
         # 1. Make sure no text ever goes past a cell boundary
         painter.save()
         painter.setClipRect(option.rect)
@@ -170,9 +173,7 @@ class LeftJustifiedDelegate(QStyledItemDelegate):
             self.initStyleOption(option, index)
 
         # 6. Draw Bold First Line
-        bold_font = QFont(option.font)
-        bold_font.setBold(True)
-        painter.setFont(bold_font)
+        painter.setFont(font_registry.matching(option.font, bold=True))
 
         # boundingRect calculates the height used by the wrapped first line
         # drawText gives us automatic wrapping
@@ -195,16 +196,12 @@ class LeftJustifiedDelegate(QStyledItemDelegate):
 
 
     def _draw_elide_indicator(self, painter, option, text):
-        # 1. Initialize doc with the current cell width and font
-        check_doc = QTextDocument()
-        check_doc.setDocumentMargin(0)
-        check_doc.setDefaultFont(option.font)
-        check_doc.setPlainText(text)
-        check_doc.setTextWidth(option.rect.width())
+        # 1. Lay out the text at the current cell width and font (Cached)
+        line_count = layout_cache.line_count(text, option.rect.width(), option.font)
 
         # 2. Check if text is "crushed out" based on user limit.
         # If so, add the ellipsis
-        if check_doc.lineCount() > config.line_limit:
+        if line_count > config.line_limit:
             painter.save()
             painter.setPen(QColor("#888888"))  # Subtle gray
             painter.drawText(option.rect,
@@ -0,0 +1,48 @@
+# font_registry.py
+#
+# Shared QFont & QFontMetrics objects. The delegates, the adapter, and the
+# column sizing all need the same few fonts (the cell font, its bold
+# version, the header font) over and over. Each is made once, here.
+#
+# The fonts handed out are shared: Copy one (QFont(font)) before changing it.
+# The registry is emptied when the configured font size changes.
+
+from PySide6.QtGui import QFont, QFontMetrics
+
+from app.config import config
+
+_fonts = {}     # (family, point size, weight) -> QFont
+_metrics = {}   # QFont.key() -> QFontMetrics
+
+def get_font(family=None, point_size=None, bold=False):
+    """
+    The font in the given family (None: the application font) and
+    point size (None: the application font's size)
+    """
+    weight = QFont.Weight.Bold if bold else QFont.Weight.Normal
+    key = (family, point_size, weight)
+    found = _fonts.get(key)
+    if found is None:
+        found = QFont() if family is None else QFont(family)
+        if point_size is not None and point_size > 0:
+            found.setPointSize(point_size)
+        found.setWeight(weight)
+        _fonts[key] = found
+    return found
+
+def matching(font, bold=False):
+    """The registry's font with the same family & size as 'font' (bold or not)"""
+    return get_font(font.family(), font.pointSize(), bold)
+
+def metrics(font):
+    key = font.key()
+    found = _metrics.get(key)
+    if found is None:
+        found = _metrics[key] = QFontMetrics(font)
+    return found
+
+def clear():
+    _fonts.clear()
+    _metrics.clear()
+
+config.font_changed.connect(clear)
@@ -0,0 +1,34 @@
+# icon_cache.py
+#
+# Pre-rendered pixmaps for the qtawesome icons. Each glyph/color/size is
+# rendered once and shared by everything that draws it. (The table has
+# only a handful of distinct icons, drawn on every visible row.)
+#
+# The sizes follow config.scale_factor, which changes with the cell font
+# size. So the cache is cleared when the font changes.
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QIcon
+
+import qtawesome as qta
+
+from app.config import config
+
+_pixmaps = {}   # (icon ID, color, width, height, device pixel ratio, enabled) -> QPixmap
+
+def icon_pixmap(icon_id, color, size, dpr=1.0, enabled=True):
+    """
+    The icon, rendered at 'size' (a QSize, in device-independent pixels)
+    for a screen with device pixel ratio 'dpr'.
+    """
+    key = (icon_id, color, size.width(), size.height(), dpr, enabled)
+    found = _pixmaps.get(key)
+    if found is None:
+        mode = QIcon.Mode.Normal if enabled else QIcon.Mode.Disabled
+        found = _pixmaps[key] = qta.icon(icon_id, color=color).pixmap(QSize(size), dpr, mode)
+    return found
+
+def clear():
+    _pixmaps.clear()
+
+config.font_changed.connect(clear)
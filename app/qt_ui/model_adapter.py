@@ -6,12 +6,17 @@
 # text, column counts, and cell values to the view. This layer is the sole
 # authority on the table’s shape and is the bridge between domain-model data & Qt.
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import count
+
 from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
-from PySide6.QtGui import QFont, QColor #, QIcon, QFontMetrics
+from PySide6.QtGui import QColor #, QIcon, QFont, QFontMetrics
 
 from app.model.reminders_model import RemindersModel
 from app.model.reminder_item import ReminderItem
 from app.config import config
+import font_registry
 
 # noinspection PyPep8Naming
 import table_constants as C
@@ -42,22 +47,136 @@ def h_alignment(col_idx):
     col_def = C.ALL_COLS[col_idx]
     return C.ALIGN_MAP[col_def.align]
 
+def _runs(rows):
+    """Ascending row numbers -> list of contiguous [first, last] ranges"""
+    runs = []
+    for row in rows:
+        if runs and row == runs[-1][1] + 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
+
+# Roles data() answers. (Everything else gets None)
+_DATA_ROLES = frozenset((Qt.DisplayRole, C.ALERTS_ROLE, C.REPEATS_ROLE,
+                         Qt.FontRole, Qt.TextAlignmentRole, Qt.ForegroundRole))
+
+TODAY_COLOR = QColor("#228B22")    # Forest Green
+URGENT_COLOR = QColor("#B22222")   # Firebrick Red (for urgency)
+
+def _flag_text(reminder):
+    # The 'User Facing' string: Show the ! but hide (alerts-enabled) "A"
+    return C.IS_CRITICAL_FLAG if reminder.is_critical else ""
+
+def _attr_getter(attr_name):
+    return lambda reminder: getattr(reminder, attr_name, "")
+
+def _display_getter(col_def):
+    """The function that gets a column's display text from a reminder"""
+    if col_def.icon:
+        return None  # Action-button columns are drawn, not displayed
+    if col_def.id == "FLAG":
+        return _flag_text
+    # If col_id is in UI_COL_MAP, use that value.
+    # Otherwise, default to the lowercase col_id, to map
+    # the Column ID to the ReminderItem attribute name.
+    # e.g., If col_id is "TIME", look for reminder.time
+    return _attr_getter(C.UI_COL_MAP.get(col_def.id, col_def.id.lower()))
+
+# Per-column dispatch table (By column index. Built once, from the schema)
+_DISPLAY_GETTERS = [_display_getter(col_def) for col_def in C.ALL_COLS]
+_H_ALIGNMENTS = [h_alignment(col_idx) for col_idx in range(len(C.ALL_COLS))]
+
+class _RowBundle:
+    """
+    Everything data() can return for one row: A {role: value} dict per column.
+    Each cell's dict is computed when it's first asked for, and kept until the
+    row's data changes.
+    """
+    __slots__ = ("item", "generation", "cells", "serial", "_bold_font")
+
+    _serials = count(1)
+
+    def __init__(self, item, bold_font):
+        self.item = item
+        self.serial = next(self._serials)   # A new bundle means new row content
+        self.generation = config.format_generation  # (Display formats it was made with)
+        self.cells = [None] * len(_DISPLAY_GETTERS)
+        self._bold_font = bold_font
+
+    def cell(self, col_idx):
+        cell = self.cells[col_idx]
+        if cell is None:
+            cell = self.cells[col_idx] = self._make_cell(col_idx)
+        return cell
+
+    def _make_cell(self, col_idx):
+        item = self.item
+        getter = _DISPLAY_GETTERS[col_idx]
+        is_today = col_idx == C.DATE_IDX and item.date == "TODAY"
+        is_urgent = col_idx == C.COUNTDOWN_IDX and item.countdown in ("NOW", "LATE")
+        color = TODAY_COLOR if is_today else URGENT_COLOR if is_urgent else None
+        return {
+            Qt.DisplayRole: getter(item) if getter else None,
+            C.ALERTS_ROLE: getattr(item, "alerts_enabled", False),
+            C.REPEATS_ROLE: getattr(item, "repeats", False),
+            Qt.FontRole: self._bold_font if item.is_critical or is_today or is_urgent else None,
+            Qt.ForegroundRole: color,
+            Qt.TextAlignmentRole: v_alignment(item) | _H_ALIGNMENTS[col_idx],
+        }
+
 class ModelAdapter(QAbstractTableModel):
     """
     Wrapper on my view_model class for Qt to talk to.
     """
-    def __init__(self, domain_model:RemindersModel):
+    def __init__(self, domain_model:RemindersModel, page_size=None):
+        """
+        page_size: When set, the View sees the list a page at a time. It asks
+        for the next page (canFetchMore/fetchMore) as the user scrolls down.
+        (So a huge list opens without building and measuring every row.)
+        """
         super().__init__()
         self._reminders_model = domain_model
         self._reminders_model._fully_initialized = True
 
-        # Cache the font we'll need many times later
-        self._bold_font = QFont()
-        self._bold_font.setBold(True)  # MUST be done in TWO steps
+        # Paging: The first _fetched rows of the domain model are visible to the View
+        self._page_size = page_size
+        self._fetched = min(page_size, len(domain_model)) if page_size else None
+
+        # The font we'll need many times later
+        self._bold_font = font_registry.get_font(bold=True)
+
+        # Row bundles (See _row_bundle). Dropped when a row's data changes,
+        # or its row is removed. (The least recently used go first)
+        self._bundles = OrderedDict()    # uid -> _RowBundle
+        self.bundle_cache_size = C.ROW_BUNDLE_CACHE_SIZE
+        self.dataChanged.connect(self._forget_rows)
+        self.modelReset.connect(self._bundles.clear)
+
+        # Batch state (See batch())
+        self._batch_depth = 0
+        self._batch_changed = set()   # IDs of reminders edited in the batch
+        self._replay_count = None     # rowCount() while the batch's signals go out
 
     def update_countdown_values(self, now):
         # Delegate the countdown-update to the data model
-        self._reminders_model.update_countdown_values(now)
+        # (Returns the rows whose countdown changed. Only the fetched ones, when paging)
+        rows = self._reminders_model.update_countdown_values(now)
+        if self._fetched is not None:
+            rows = [row for row in rows if row < self._fetched]
+        return rows
+
+    def announce_rows_changed(self, rows, columns, roles=()):
+        """
+        dataChanged for just these cells: One signal per run of adjacent rows,
+        per column. Returns the number of ranges emitted.
+        """
+        ranges = 0
+        for first, last in _runs(sorted(rows)):
+            for col in columns:
+                self.dataChanged.emit(self.index(first, col), self.index(last, col), list(roles))
+                ranges += 1
+        return ranges
 
     def on_font_changed(self):
         # Trigger a call to headerData() for FontRole/DisplayRole
@@ -66,16 +185,136 @@ class ModelAdapter(QAbstractTableModel):
     @_qt_guard
     def rowCount(self, parent=QModelIndex()):
         # Direct count of the row objects
+        if self._replay_count is not None:
+            return self._replay_count  # The row count the View expects right now
         if not self._reminders_model:
             return 0  # Return an actual integer when the model isn't present, not None!
+        if self._fetched is not None:
+            return min(self._fetched, len(self._reminders_model))
         return len(self._reminders_model)
-    
+
+    # ------------------------
+    # Paging
+    # ------------------------
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetched is None:
+            return False
+        return self._fetched < len(self._reminders_model)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetch_to(self._fetched + self._page_size - 1)
+
+    def _in_fetched(self, row):
+        """True if (after an add or a move) the row is one the View has fetched"""
+        if self._fetched is None or self._fetched >= len(self._reminders_model):
+            return True  # (Every row is fetched. A row added at the end is, too)
+        return row < self._fetched
+
+    def _fetch_to(self, row):
+        """Make rows up to 'row' visible to the View (announced as inserted rows)"""
+        if self._fetched is None:
+            return
+        first = self.rowCount()
+        last = min(row, len(self._reminders_model) - 1)
+        if last < first:
+            return
+        self.beginInsertRows(QModelIndex(), first, last)
+        self._fetched = last + 1
+        self.endInsertRows()
+
     #@_qt_guard
     def columnCount(self, parent=QModelIndex()):
         return len(C.ALL_COLS)
 
+    # ------------------------
+    # Batches
+    # ------------------------
+    @contextmanager
+    def batch(self):
+        """
+        Many changes, one update for the View:
+            with adapter.batch():
+                for row in reversed(selected_rows):
+                    adapter.delete_reminder(row)
+        The domain model sorts and saves once, when the batch ends. Then the
+        View gets one set of row remove/move/insert signals.
+        (Row numbers returned inside the batch are provisional. Use index_of afterward.)
+        """
+        outermost = self._batch_depth == 0
+        old_total = len(self._reminders_model)
+        old_uids = self._reminders_model.uids()[:self.rowCount()] if outermost else None
+        self._batch_depth += 1
+        try:
+            with self._reminders_model.batch():
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if outermost:
+                changed, self._batch_changed = self._batch_changed, set()
+                self._announce_batch(old_uids, changed, old_total)
+
+    def _announce_batch(self, old_uids, changed_uids, old_total):
+        """
+        Replay the net effect of a batch for the View: Removes (bottom-up),
+        then one layout change for the rows that moved, then inserts (top-down).
+        rowCount() reports the count each signal expects.
+        (When paging, only the fetched rows are announced. The page keeps its size,
+        give or take the rows added & removed.)
+        """
+        new_uids = self._reminders_model.uids()
+        if self._fetched is not None:
+            self._fetched = max(0, len(old_uids) + len(new_uids) - old_total)
+            new_uids = new_uids[:self._fetched]
+        old_set, new_set = set(old_uids), set(new_uids)
+        count = len(old_uids)
+        try:
+            # 1. Removed rows
+            removed = [row for row, uid in enumerate(old_uids) if uid not in new_set]
+            self._forget_removed(old_uids[row] for row in removed)
+            for first, last in reversed(_runs(removed)):
+                self._replay_count = count
+                self.beginRemoveRows(QModelIndex(), first, last)
+                count -= last - first + 1
+                self._replay_count = count
+                self.endRemoveRows()
+
+            # 2. Rows that moved (re-sorted). Persistent indexes follow their reminders
+            survivors = [uid for uid in old_uids if uid in new_set]
+            kept = [uid for uid in new_uids if uid in old_set]
+            if kept != survivors:
+                self._replay_count = count
+                self.layoutAboutToBeChanged.emit()
+                new_pos = {uid: row for row, uid in enumerate(kept)}
+                old_indexes = self.persistentIndexList()
+                new_indexes = [self.index(new_pos[survivors[idx.row()]], idx.column())
+                               for idx in old_indexes]
+                self.changePersistentIndexList(old_indexes, new_indexes)
+                self.layoutChanged.emit()
+
+            # 3. Added rows
+            added = [row for row, uid in enumerate(new_uids) if uid not in old_set]
+            for first, last in _runs(added):
+                self._replay_count = count
+                self.beginInsertRows(QModelIndex(), first, last)
+                count += last - first + 1
+                self._replay_count = count
+                self.endInsertRows()
+        finally:
+            self._replay_count = None
+
+        # 4. Edited rows that were there all along: One repaint for the lot
+        rows = [row for row, uid in enumerate(new_uids) if uid in changed_uids and uid in old_set]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0),
+                                  self.index(max(rows), self.columnCount() - 1))
+
     def delete_reminder(self, row):
         #print(f"adapter.reomove_row called")
+        if self._batch_depth:
+            self._reminders_model.delete(row)  # (Announced when the batch ends)
+            return
 
         # Start a  'sandwich' (Parent index, start row, end row)
         # to signal the start of a structural change that affects row_count.
@@ -83,7 +322,10 @@ class ModelAdapter(QAbstractTableModel):
         self.beginRemoveRows(QModelIndex(), row, row)
 
         # Do the deed
+        self._forget_removed([self._reminders_model.get_reminder(row).uid])
         self._reminders_model.delete(row)
+        if self._fetched is not None:
+            self._fetched -= 1  # (Don't let an unfetched row slide into view)
 
         # Close the 'sandwich'
         self.endRemoveRows()
@@ -100,14 +342,22 @@ class ModelAdapter(QAbstractTableModel):
             repeat=reminder_data["repeats"],
         )
 
-        # 2. The 'Reset' Sandwich (Better for sorting than beginInsertRows)
-        # This tells the View: "Hold your breath, the whole list is shifting."
-        self.beginResetModel()
-        self._reminders_model.add(new_item)
-        self.endResetModel()
+        if self._batch_depth:
+            return self._reminders_model.add(new_item)  # (Announced when the batch ends)
+
+        # 2. Tell the View where the new row goes. (Only that row is new to it)
+        new_row = self._reminders_model.insertion_row(new_item)
+        if not self._in_fetched(new_row):
+            # It sorts past the fetched pages. The View gets to it by way of fetchMore
+            return self._reminders_model.add(new_item)
+        self.beginInsertRows(QModelIndex(), new_row, new_row)
+        new_row = self._reminders_model.add(new_item)
+        if self._fetched is not None:
+            self._fetched += 1
+        self.endInsertRows()
 
         # 3. Return the new position
-        return self._reminders_model.index_of(new_item)
+        return new_row
 
     def update_reminder(self, index, reminder_data: dict):
         new_item = ReminderItem(
@@ -116,12 +366,32 @@ class ModelAdapter(QAbstractTableModel):
             notes=reminder_data["notes"],
             repeat=reminder_data["repeats"],
         )
-        self.beginResetModel()
-        self._reminders_model.update(index, new_item)
-        self.endResetModel()
+        if self._batch_depth:
+            self._batch_changed.add(self._reminders_model.get_reminder(index).uid)
+            return self._reminders_model.update(index, new_item)
+
+        # Where the edited reminder will sort to
+        new_row = self._reminders_model.insertion_row(new_item, replacing=index)
+        if not self._in_fetched(new_row):
+            # It moves past the fetched pages: It leaves the View, for now
+            self.beginRemoveRows(QModelIndex(), index, index)
+            new_row = self._reminders_model.update(index, new_item)
+            self._fetched -= 1
+            self.endRemoveRows()
+            return new_row
+
+        if new_row == index:
+            self._reminders_model.update(index, new_item)
+        else:
+            # Move the one row. (Qt's destination is the row to insert before, in the old order)
+            dest = new_row + 1 if new_row > index else new_row
+            self.beginMoveRows(QModelIndex(), index, index, QModelIndex(), dest)
+            new_row = self._reminders_model.update(index, new_item)
+            self.endMoveRows()
+        self.dataChanged.emit(self.index(new_row, 0), self.index(new_row, self.columnCount() - 1))
 
         # Return the new position
-        return self._reminders_model.index_of(new_item)
+        return new_row
 
     @_qt_guard
     def data(self, index, role):
@@ -131,73 +401,61 @@ class ModelAdapter(QAbstractTableModel):
             return None
 
         # Quick Exit for roles we don't handle
-        if role not in (Qt.DisplayRole, C.ALERTS_ROLE, C.REPEATS_ROLE,
-                        Qt.FontRole, Qt.TextAlignmentRole,
-                        Qt.ForegroundRole):
+        if role not in _DATA_ROLES:
             return None
 
-        row_idx = index.row()
-        col_idx = index.column()
-
-        # Skip action-button columns (they're handled in the View)
-        if col_idx >= C.FIRST_BTN_IDX:
-            # Skip if the View is asking for TEXT (DisplayRole)
-            if role == Qt.ItemDataRole.DisplayRole:
-                return None
+        bundle = self._row_bundle(index.row())
+        if bundle is None:
+            return None
+        return bundle.cell(index.column())[role]
 
-        item = self.get_reminder(row_idx)
+    @_qt_guard
+    def multiData(self, index, role_data_span):
+        """Qt 6 views ask for many roles at once. They're all in the row's bundle"""
+        bundle = self._row_bundle(index.row()) if index.isValid() else None
+        if bundle is None:
+            for role_data in role_data_span:
+                role_data.clearData()
+            return
+        cell = bundle.cell(index.column())
+        for role_data in role_data_span:
+            role_data.setData(cell.get(role_data.role()))
+
+    # ------------------------
+    # Row bundles
+    # ------------------------
+    def _row_bundle(self, row):
+        """The row's (cached) role values"""
+        item = self.get_reminder(row)
         if not item:
             return None
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            # Derive the value to display
-            col_id = C.COLUMN_SCHEMA[col_idx].id
-            return self._get_display_value(item, col_id)
-
-        if role == C.ALERTS_ROLE:
-            # Query from view: How to display the Alerts button
-            value = getattr(item, "alerts_enabled", False)
-            #print(f"ROW {row_idx} | FLAGS: '{reminder._flags}' | ALERTS: {value}")
-            return value
-
-        if role == C.REPEATS_ROLE:
-            # Query from view: How to display the Repeat button
-            return getattr(item, "repeats", False)
-
-        # Styling
-        if role == Qt.FontRole:
-            if getattr(item, "is_critical", False):
-                # Bold entire row if critical
-                #print(f"Bold for row {row_idx}, col {col_idx}")
-                return self._bold_font
-
-            if col_idx == C.DATE_IDX:
-                if getattr(item, "date", "") == "TODAY":  #in ["TODAY", "TOMORROW"]:
-                    #print(f"Bold triggered for row {row_idx}, col {col_idx}")
-                    return self._bold_font
-
-            if col_idx == C.COUNTDOWN_IDX:
-                if getattr(item, "countdown", "") in ["NOW", "LATE"]:
-                    return self._bold_font
-
-        if role == Qt.ForegroundRole:
-            # Colorize the Date cell for TODAY
-            if col_idx == C.DATE_IDX and getattr(item, "date", "") == "TODAY":
-                return QColor("#228B22")  # Forest Green
-
-            # Colorize the Countdown cell for NOW/LATE
-            if col_idx == C.COUNTDOWN_IDX and getattr(item, "countdown", "") in ["NOW", "LATE"]:
-                return QColor("#B22222")  # Firebrick Red (for urgency)
-
-            return None  # Use default text color for everything else
-
-        if role == Qt.TextAlignmentRole:
-            #print(f"Row {row_idx} alignment check: {reminder.has_notes}")
-            v_bit = v_alignment(item)
-            h_bit = h_alignment(col_idx)
-            return v_bit | h_bit
-
-        return None
+        bundles = self._bundles
+        bundle = bundles.get(item.uid)
+        if bundle is None or bundle.item is not item or bundle.generation != config.format_generation:
+            # (New, or the reminder was replaced by an edit, or the display formats changed)
+            bundle = bundles[item.uid] = _RowBundle(item, self._bold_font)
+            if len(bundles) > self.bundle_cache_size:
+                bundles.popitem(last=False)  # (Least recently used)
+        bundles.move_to_end(item.uid)
+        return bundle
+
+    def row_version(self, row):
+        """A number that changes whenever the row's content does. (None: no such row)"""
+        bundle = self._row_bundle(row)
+        return bundle.serial if bundle else None
+
+    def _forget_rows(self, top_left, bottom_right, roles=()):
+        if not top_left.isValid():
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            item = self.get_reminder(row)
+            if item is not None:
+                self._bundles.pop(item.uid, None)
+
+    def _forget_removed(self, uids):
+        # (By ID: By the time a batch's removals are announced, the rows are gone)
+        for uid in uids:
+            self._bundles.pop(uid, None)
 
     # Pass-thru m,ethod
     def get_reminder(self, row: int):
@@ -206,21 +464,10 @@ class ModelAdapter(QAbstractTableModel):
 
     def index_of(self, item):
         # 'Proxy' or 'Wrapper'. Delegate the call to the domain model
-        return self.reminder_list.index_of(item)
-
-    @staticmethod
-    def _get_display_value(reminder, col_id):
-        if col_id == "FLAG":
-            # The 'User Facing' string: Show the ! but hide (alerts-enabled) "A"
-            return C.IS_CRITICAL_FLAG if reminder.is_critical else ""
-
-        # If col_id is in UI_COL_MAP, use that value.
-        # Otherwise, default to the lowercase col_id, to map
-        # the Column ID to the ReminderItem attribute name.
-        # e.g., If col_id is "TIME", look for reminder.time
-        attr_name = C.UI_COL_MAP.get(col_id, col_id.lower())
-        value = getattr(reminder, attr_name, "")
-        return value
+        return self._reminders_model.index_of(item)
+
+    def row_of_uid(self, uid):
+        return self._reminders_model.row_of_uid(uid)
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):  # type: ignore[attr-defined]
         # Only care about horizontal headers
@@ -237,10 +484,7 @@ class ModelAdapter(QAbstractTableModel):
             #return C.ALL_COL_LABELS[section]
 
         if role == Qt.ItemDataRole.FontRole:
-            font = QFont()
-            font.setPointSize(config.hdr_font_pt_size)
-            font.setBold(True)
-            return font
+            return font_registry.get_font(point_size=config.hdr_font_pt_size, bold=True)
 
         if role == Qt.TextAlignmentRole:
             return C.ALIGN_MAP[col_def.align] | Qt.AlignmentFlag.AlignVCenter
@@ -256,6 +500,9 @@ class ModelAdapter(QAbstractTableModel):
     def toggle_flag(self, row_idx):
         # Tell the Domain Model to flip the bit
         self._reminders_model.toggle_item_flag(row_idx)
+        if self._batch_depth:
+            self._batch_changed.add(self._reminders_model.get_reminder(row_idx).uid)
+            return
 
         # Define the range (from first column to last)
         left = self.index(row_idx, 0)
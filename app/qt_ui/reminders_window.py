@@ -15,14 +15,16 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QAbstractItemView,
                                QAbstractScrollArea, QDialog
                                )
 from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtGui import QFont
 
 import datetime as dt
-import qtawesome as qta
 
 from date_banner import DateBannerWindow
 from auto_resizing_table_view import AutoResizingTableView
 from delegates.centered_delegate import CenteredDelegate
+from delegates.action_button_delegate import ActionButtonDelegate
+from column_width_tracker import ColumnWidthTracker
+from row_height_engine import RowHeightEngine
 
 from timer_service import TimerService
 
@@ -51,6 +53,7 @@ class RemindersWindow(DateBannerWindow):
         self.setUpdatesEnabled(False)  # "Freeze" the UI
         self._suppress_qt_events = True      # Ignore, paint, resize, and show until we're ready
         self._initial_layout_done = False      # Prevent resize events until it's done
+        self.heartbeat_ranges = 0     # dataChanged ranges sent by the last heartbeat
 
         # Reminders Table
         #self.table_view = QtRowAwareTableView()      # The Qt view model
@@ -59,9 +62,6 @@ class RemindersWindow(DateBannerWindow):
         # Domain-model adapter
         self.model_adapter: ModelAdapter = model_adapter      # My domain model = table_model.reminders_model
         self.table_view.setModel(self.model_adapter)
-        #
-        # Connect it to the data-changed listener
-        self.model_adapter.dataChanged.connect(self.on_data_modified)
 
         # TUrn off cell selections &  highlighting on hover
         self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
@@ -73,7 +73,6 @@ class RemindersWindow(DateBannerWindow):
         # Allow for vertical row-expansion via our descr-column delegate
         vh = self.table_view.verticalHeader()
         vh.setDefaultSectionSize(16)
-        vh.setSectionResizeMode(QHeaderView.ResizeToContents)
 
         # Expand table to fill available space
         self.table_view.setSizePolicy(
@@ -99,12 +98,25 @@ class RemindersWindow(DateBannerWindow):
                 # Set centered data cells
                 self.table_view.setItemDelegateForColumn(col_idx, CenteredDelegate())
 
+        # Day, Date, & Time cells are drawn from the render cache
+        from delegates.cached_cell_delegate import CachedCellDelegate
+        cached_cell_delegate = CachedCellDelegate(self.table_view)
+        for col_idx in (C.DAY_IDX, C.DATE_IDX, C.TIME_IDX):
+            self.table_view.setItemDelegateForColumn(col_idx, cached_cell_delegate)
+
         # Data-row font
         cell_font = self.table_view.font()
         cell_font.setPointSize(config.cell_font_pt_size)
         self.table_view.setFont(cell_font)
         config.font_changed.connect(self.on_font_changed)  # Listen for font-changed events
 
+        # Column widths follow the rows as they're added, changed, & removed
+        self.width_tracker = ColumnWidthTracker(self.model_adapter, cell_font, self)
+        self.width_tracker.width_changed.connect(self.table_view.setColumnWidth)
+
+        # Row heights: Estimated for every row, measured only for the rows in view
+        self.row_heights = RowHeightEngine(self.table_view, self.model_adapter)
+
         # Enable headers
         self.table_view.horizontalHeader().setVisible(True)
         hdr_font = self.table_view.horizontalHeader().font()
@@ -185,6 +197,16 @@ class RemindersWindow(DateBannerWindow):
         self.table_view.setItemDelegateForColumn(
             C.FLAG_IDX, FlagDelegate(self.table_view)
         )
+
+        # Action buttons: Painted by a delegate, which reports the clicks
+        for col_idx, col_def in enumerate(C.ALL_COLS):
+            if col_def.icon and col_def.id in C.ICON_MAP:
+                delegate = ActionButtonDelegate(col_def.id, self.table_view)
+                delegate.clicked.connect(self.on_action_button_click)
+                self.table_view.setItemDelegateForColumn(col_idx, delegate)
+        # ...and highlight under the mouse. (No mouse tracking needed. The
+        # style sheet above keeps the data cells from highlighting.)
+        self.table_view.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
         '''
         # Wire up the Action Buttons
         for col_idx, col_def in enumerate(C._COLUMN_SCHEMA):
@@ -237,18 +259,15 @@ class RemindersWindow(DateBannerWindow):
 
         # Tell the model that the time used for countdown calculations
         # used for countdown calculations has changed.
-        self.model_adapter.update_countdown_values(now)
+        # (It returns the rows whose countdown or TODAY/TOMORROW date changed)
+        rows = self.model_adapter.update_countdown_values(now)
 
         # --- SURGICAL REPAINT ---
-        # Define the Top-Left and Bottom-Right of the 'Countdown' column
-        rows = self.model_adapter.rowCount() - 1
-        top_left = self.model_adapter.index(0, C.COUNTDOWN_IDX)
-        bottom_right = self.model_adapter.index(rows, C.COUNTDOWN_IDX)
-
-        # Tell the View to redraw ONLY those cells
-        self.model_adapter.dataChanged.emit(top_left, bottom_right,
-                                            [Qt.ItemDataRole.DisplayRole,
-                                             Qt.ItemDataRole.FontRole])
+        # Tell the View to redraw ONLY those cells (Countdown & Date columns),
+        # in as few ranges as possible
+        self.heartbeat_ranges = self.model_adapter.announce_rows_changed(
+            rows, (C.DATE_IDX, C.COUNTDOWN_IDX),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.FontRole, Qt.ItemDataRole.ForegroundRole])
 
 
     def resizeEvent(self, event):
@@ -271,25 +290,15 @@ class RemindersWindow(DateBannerWindow):
         #   (Must occur after the delegate is assigned.)
         QTimer.singleShot(0, self.refresh_layout)  # schedule initial layout refresh once
 
-    def on_data_modified(self, topLeft, bottomRight, roles):
-        # Fires whenever the critical flag is toggled,
-        # Handle the newly bold or not-bold data in the row.
-        self.table_view.resizeColumnsToContents()
-
     def refresh_layout(self):
         # Don't display updates while we're making them
         self.setUpdatesEnabled(False)
 
         # Size columns and rows
         self._apply_column_sizing()
-        self.table_view.resizeRowsToContents()
-        self._apply_row_height_limits()   # Cap row heights
-
-        # RE-CREATE BUTTONS (required after any sort or model change)
-        self._update_action_buttons()
+        self.row_heights.refresh()   # (Capped at 3 lines)
 
         # Tell window to tell the window that sizeHint has changed
-        self.table_view.resizeColumnsToContents()
         self.table_view.updateGeometry()  # Refresh the sizeHint
 
         # --- INSTRUMENTATION START ---
@@ -316,25 +325,6 @@ class RemindersWindow(DateBannerWindow):
 
     #end refresh_layout
 
-    def _apply_row_height_limits(self):
-        # Calculate the max height for 3 lines
-        metrics = self.table_view.fontMetrics()
-        # height() is for one line; lineSpacing() is the distance between baselines
-        max_h = (metrics.lineSpacing() * 2) + metrics.height() + 4  # 3 lines + margin for cell border
-
-        v_header = self.table_view.verticalHeader()
-
-        # TEMPORARILY allow manual resizing
-        # If the mode is 'ResizeToContents', manual resizeSection() calls are ignored.
-        #old_mode = v_header.sectionsClickable()  # A placeholder to show we're changing state
-        #v_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-
-        # Iterate and cap
-        for row in range(self.model_adapter.rowCount()):
-            current_h = self.table_view.rowHeight(row)
-            if current_h > max_h:
-                v_header.resizeSection(row, max_h)
-
 
     # ------------------------
     # Window behaviors
@@ -376,191 +366,12 @@ class RemindersWindow(DateBannerWindow):
         return x, y
 
     def _apply_column_sizing(self):
-        # Let Qt compute a baseline (helps with icon columns, etc.)
-        self.table_view.resizeColumnsToContents()
-
-        model = self.model_adapter
-        view = self.table_view
-        row_count = model.rowCount()
-        col_count = model.columnCount()
-
-        # If row_count is 0 or None, we aren't ready to measure fonts yet!
-        if not row_count:
-            # Wait 50ms and try again
-            QTimer.singleShot(50, self._apply_column_sizing)
-            return
-
-        # --- 1. Compute description column separately (your existing logic)
-        self.compute_descr_col_width()
-
-        # --- 2. Compute all other columns using actual row fonts
-        for col in range(col_count):
-            if col == C.DESCR_IDX:
-                continue
-
-            col_def = C.ALL_COLS[col]
-            min_w = col_def.min_w
-            max_w = col_def.max_w
-
-            natural_max = 0
-
-            for row in range(row_count):
-                index = model.index(row, col)
-                text = index.data(Qt.DisplayRole) or ""
+        # Measure every row once. (After that, the tracker measures only
+        # the rows that change. See ColumnWidthTracker)
+        self.width_tracker.rebuild()
 
-                # Get the actual font for this cell
-                font = view.font()
-                reminder = model.get_reminder(row)
-                if getattr(reminder, "is_critical", False):
-                    font.setBold(True)
-
-                fm = QFontMetrics(font)
-                w = fm.horizontalAdvance(text)
-
-                if w > natural_max:
-                    natural_max = w
-
-            # Apply padding (optional but recommended)
-            padded = natural_max + 12
-
-            # Clamp
-            final = max(min_w, min(padded, max_w))
-            view.setColumnWidth(col, final)
-            #if col in (C.DATE_IDX, C.TIME_IDX) :
-            #    print(f"Col {col}, Label: {col_def.label}, min:{col_def.min_w}, "
-            #          f"max:{col_def.max_w}, final: {final}")
-
-    def compute_descr_col_width(self):
-        """
-        Compute width of multi-line, where first line may be bold
-        """
-        model = self.model_adapter
-        view = self.table_view
-        row_count = model.rowCount()
-
-        col_def = C.ALL_COLS[C.DESCR_IDX]
-        min_w = col_def.min_w
-        max_w = col_def.max_w
-
-        natural_max = 0
-        for row in range(row_count):
-            col_idx = model.index(row, C.DESCR_IDX)
-            text = col_idx.data(Qt.DisplayRole) or ""
-
-            # Split into lines
-            lines = text.split("\n")
-
-            # Determine fonts for this row
-            base_font = view.font()
-            bold_font = QFont(base_font)
-            bold_font.setBold(True)
-
-            # First line may be bold
-            for i, line in enumerate(lines):
-                reminder = model.get_reminder(row)
-                if i == 0 and getattr(reminder,"is_critical", False):
-                    fm = QFontMetrics(bold_font)
-                else:
-                    fm = QFontMetrics(base_font)
-
-                w = fm.horizontalAdvance(line)
-                if w > natural_max:
-                    natural_max = w
-
-        # Add padding
-        padded = natural_max + 20
-
-        # Clamp
-        final = max(min_w, min(padded, max_w))
-        view.setColumnWidth(C.DESCR_IDX, final)
-
-    def _update_action_buttons(self):
-        """
-        MUST BE CALLED after and SORT or MODEL CHANGE
-        """
-        model = self.table_view.model()
-        for row in range(model.rowCount()):
-            for col, col_def in enumerate(C.COLUMN_SCHEMA):
-                if col_def.icon:
-                    # Check if this ID is a 'Button' type in our map
-                    btn_cfg = C.ICON_MAP.get(col_def.id)
-                    if not btn_cfg:
-                        continue
-
-                    # Default values from the map
-                    icon_str = btn_cfg["icon"]
-                    icon_color = btn_cfg["color"]
-                    icon_size = QSize(22,22)
-
-                    if col_def.id == "ALERTS":
-                        icon_size = QSize(24,24)
-                        alerts_enabled = model.data(model.index(row, col), C.ALERTS_ROLE)
-                        if not alerts_enabled:
-                            icon_str = btn_cfg.get("off_icon", icon_str)
-                            icon_color = "lightgray"
-                            # "gray"--dark gray, "lightgray"--std light gray,
-                            # #E0E0E0--very soft gray for disabled states
-
-                    if col_def.id == "NEXT":
-                        has_repeats = model.data(model.index(row, col), C.REPEATS_ROLE)
-                        if not has_repeats:
-                            icon_color = "lightgray"
-
-                    # Build the button
-                    btn = QPushButton()
-                    btn.setIcon(qta.icon(icon_str, color=icon_color))
-                    btn.setIconSize(icon_size)
-                    btn.setFlat(True)
-                    # Transparent background, no extra padding
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: transparent; 
-                            border: none;
-                            padding: 0px;
-                            margin: 0px;
-                        }
-                    """)
-
-                    # Tag it with the action ID
-                    btn.setProperty("action_id", col_def.id)
-
-                    # Connect to the smart row-finder
-                    btn.clicked.connect(self.on_action_button_click)
-
-                    # 2. Create a Container to center the icon
-                    container = QWidget()
-                    layout = QHBoxLayout(container)
-                    layout.setContentsMargins(0, 0, 0, 0)
-                    layout.setSpacing(0)
-
-                    # Apply Alignment from the Schema
-                    if col_def.align == "Ctr":
-                        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    elif col_def.align == "Left":
-                        layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-
-                    layout.addWidget(btn)
-
-                    # Set it in the view
-                    self.table_view.setIndexWidget(model.index(row, col), container)
-
-    # Identify current row, dispatch to handler for current column
-    def on_action_button_click(self):
-        # Identify current row
-        button = self.sender()
-        action_id = button.property("action_id")
-
-        # Map the button's local (0,0) coordinate to the TableView's coordinate system
-        global_pos = button.mapTo(self.table_view.viewport(), button.rect().center())
-        index = self.table_view.indexAt(global_pos)
-
-        if not index.isValid():
-            return
-
-        row_idx = index.row()
-        col_idx = index.column()
-
-        # Dispatch to handler for current column
+    # Dispatch an action-button click (See ActionButtonDelegate) to its handler
+    def on_action_button_click(self, action_id, row_idx):
         dispatch = {
             "EDIT":    self.on_edit_action,
             "ALERTS":  self.on_alerts_toggle_action,
@@ -674,9 +485,7 @@ class RemindersWindow(DateBannerWindow):
         """
         Adjust window and table view after an add or edit
         """
-        # FORCE THE MODEL TO RE-SYNC
-        # Ensure the model emits the change signal so the view knows to redraw
-        self.model_adapter.layoutChanged.emit()
+        # (The adapter has already told the View which rows moved or were inserted)
 
         # Trigger a manual heartbeat to fill the countdown immediately
         # to prevent the 'blank countdown until next timer' delay
@@ -685,22 +494,22 @@ class RemindersWindow(DateBannerWindow):
 
         # POSITIONING (Select and Scroll)
         # (BEFORE setting buttons so the view is stable)
-        if target_row is not None and target_row >= 0:
+        # (When paging, a row that sorted past the fetched pages isn't in the View yet)
+        if target_row is not None and 0 <= target_row < self.model_adapter.rowCount():
             idx = self.model_adapter.index(target_row, 0)
             self.table_view.selectRow(target_row)
             self.table_view.scrollTo(idx, QAbstractItemView.ScrollHint.EnsureVisible)
         #
         # Jump to the new/edited row
-        if target_row is not None and target_row >= 0:
+        if target_row is not None and 0 <= target_row < self.model_adapter.rowCount():
             idx = self.model_adapter.index(target_row, 0)
             self.table_view.selectRow(target_row)
             self.table_view.scrollTo(idx, QAbstractItemView.ScrollHint.EnsureVisible)
 
-        # Re-attach action buttons for the new row order
-        self._update_action_buttons()
-
-        # Run the 'Snug Fit' and scaling logic
-        self.refresh_ui_proportions()
+        # Snug fit: Measure the rows now in view, and let the window fit the table
+        self.row_heights.refine()
+        self.table_view.updateGeometry()
+        self.adjustSize()
 
 
 
@@ -709,10 +518,6 @@ class RemindersWindow(DateBannerWindow):
         Proportional scaling of row heights, column widths, and icon sizes
         based on original sizes and a scaling factor.
         """
-        # 1. TEMPORARILY FREEZE the layout to prevent 'ghosting'
-        header = self.table_view.verticalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-
         scale = config.scale_factor
 
         # 1. Update the font (triggers the Delegate sizeHints)
@@ -731,14 +536,11 @@ class RemindersWindow(DateBannerWindow):
         self.model_adapter.endResetModel()
 
         # 4. RESIZE (while frozen)
-        # Adjust column widths to account for current font.
-        # We set the base widths, but resizeColumnsToContents will fine-tune them
-        self.table_view.setColumnWidth(C.TIME_IDX, int(85 * scale))
-        self.table_view.setColumnWidth(C.DATE_IDX, int(110 * scale))
-        self.table_view.resizeColumnsToContents()
-
-        # 5. SET THE MODE: Tell the table to use our sizeHint logic (needed for vertical size)
-        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        # Measure the columns in the current font
+        self.width_tracker.set_font(table_font)
+
+        # 5. Row heights in the new font (estimates, then the rows in view)
+        self.row_heights.refresh()
 
         # 6. REPAINT: Refresh the View and Window
         self.table_view.viewport().update()
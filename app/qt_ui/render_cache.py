@@ -0,0 +1,88 @@
+# render_cache.py
+#
+# Most cells (description, day, date, time, flag) change only when their
+# reminder is edited. Yet every paint (scrolling, window exposes) lays out
+# and draws their text again. RenderCache keeps each such cell as a pixmap,
+# so a repaint is a blit.
+#
+# A cell's pixmap is keyed by its row's content version (See
+# ModelAdapter.row_version), its column and size, the font, and the
+# style state (alternate row, selection, hover). The pixmaps live in an
+# LRU, capped at config.render_cache_kb. (0 turns the cache off.)
+
+from collections import OrderedDict
+from math import ceil
+
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QStyleOptionViewItem
+
+from app.config import config
+
+class RenderCache:
+
+    def __init__(self):
+        self._pixmaps = OrderedDict()   # key -> QPixmap
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    def paint(self, painter, option, index, paint_fn):
+        """Draw the cell from the cache. (paint_fn(painter, option, index) renders it)"""
+        max_bytes = config.render_cache_kb * 1024
+        version = index.model().row_version(index.row()) if max_bytes > 0 else None
+        rect = option.rect
+        if version is None or rect.isEmpty():
+            paint_fn(painter, option, index)
+            return
+
+        dpr = painter.device().devicePixelRatioF()
+        key = (version, index.column(), rect.width(), rect.height(), dpr, option.font.key(),
+               option.state.value, option.features.value, config.line_limit)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self._pixmaps.move_to_end(key)
+        else:
+            self.misses += 1
+            pixmap = self._render(option, index, paint_fn, dpr)
+            self._pixmaps[key] = pixmap
+            self.nbytes += self._size_of(pixmap)
+            while self.nbytes > max_bytes and self._pixmaps:
+                _, dropped = self._pixmaps.popitem(last=False)  # (Least recently used)
+                self.nbytes -= self._size_of(dropped)
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    @staticmethod
+    def _render(option, index, paint_fn, dpr):
+        rect = option.rect
+        pixmap = QPixmap(QSize(ceil(rect.width() * dpr), ceil(rect.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Paint the cell at (0, 0) of the pixmap
+        cell_option = QStyleOptionViewItem(option)
+        cell_option.rect = QRect(0, 0, rect.width(), rect.height())
+        pixmap_painter = QPainter(pixmap)
+        try:
+            paint_fn(pixmap_painter, cell_option, index)
+        finally:
+            pixmap_painter.end()
+        return pixmap
+
+    @staticmethod
+    def _size_of(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def clear(self):
+        self._pixmaps.clear()
+        self.nbytes = 0
+
+    #end CLASS RenderCache
+
+# Shared by the delegates
+render_cache = RenderCache()
+config.font_changed.connect(render_cache.clear)
@@ -0,0 +1,165 @@
+# row_height_engine.py
+#
+# RowHeightEngine sizes the table's rows lazily. Measuring a row's height
+# means laying out its text (through the delegates' sizeHints), so doing it
+# for every row of a long list blocks the window. Instead:
+#   - Every row gets a cheap estimate, from the number of lines in its
+#     description (capped at config.line_limit). No text layout. One-line
+#     rows simply use the header's default section size, so only the
+#     multi-line rows are resized.
+#   - Only the rows in (or near) the viewport are measured. More are
+#     measured as the user scrolls, or as the table is resized.
+# Heights are capped at three lines, as before.
+
+from PySide6.QtCore import QObject, QEvent, QTimer
+from PySide6.QtWidgets import QHeaderView
+
+# noinspection PyPep8Naming
+import table_constants as C
+from app.config import config
+
+class RowHeightEngine(QObject):
+
+    def __init__(self, table_view, model_adapter, margin_rows=C.ROW_HEIGHT_MARGIN_ROWS):
+        """margin_rows: Rows above & below the viewport that are measured too"""
+        super().__init__(table_view)
+        self._view = table_view
+        self._model = model_adapter
+        self.margin_rows = margin_rows
+        self._measured = set()        # Rows whose height has been measured
+        self._refine_pending = False
+        self.measure_count = 0        # Rows measured (for testing)
+
+        # The engine sets the heights. (ResizeToContents would measure every row)
+        self._header = table_view.verticalHeader()
+        self._header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+
+        table_view.verticalScrollBar().valueChanged.connect(self.schedule_refine)
+        table_view.horizontalHeader().sectionResized.connect(self._on_column_resized)
+        table_view.viewport().installEventFilter(self)
+
+        model_adapter.rowsInserted.connect(self._on_rows_inserted)
+        model_adapter.rowsRemoved.connect(self._on_rows_removed)
+        model_adapter.rowsMoved.connect(self._on_rows_moved)
+        model_adapter.layoutChanged.connect(self.refresh)
+        model_adapter.modelReset.connect(self.refresh)
+        model_adapter.dataChanged.connect(self._on_data_changed)
+
+    def max_height(self):
+        """Three lines + margin for the cell border"""
+        # height() is for one line; lineSpacing() is the distance between baselines
+        metrics = self._view.fontMetrics()
+        return (metrics.lineSpacing() * 2) + metrics.height() + 4
+
+    # ------------------------
+    # Estimates
+    # ------------------------
+    def _line_heights(self):
+        """Estimated heights of rows with 1, 2, ... line_limit lines. (Once per pass)"""
+        line_spacing = self._view.fontMetrics().lineSpacing()
+        min_h, max_h = self._header.minimumSectionSize(), self.max_height()
+        return [max(min_h, min(lines * line_spacing + 2, max_h))
+                for lines in range(1, max(config.line_limit, 1) + 1)]
+
+    def _estimate_rows(self, first, last, heights=None):
+        """Estimate the rows' heights. Only rows that differ from their current size are resized"""
+        heights = heights or self._line_heights()
+        header, get_reminder = self._header, self._model.get_reminder
+        single, most = heights[0], len(heights)
+        for row in range(first, last + 1):
+            item = get_reminder(row)
+            height = heights[min(item.line_count, most) - 1] if item else single
+            if header.sectionSize(row) != height:
+                header.resizeSection(row, height)
+
+    def refresh(self):
+        """Estimate every row, then measure the visible ones. (After a reset or a font change)"""
+        self._measured.clear()
+        heights = self._line_heights()
+        if self._header.defaultSectionSize() != heights[0]:
+            # (Resizes every row, but only when the font changes)
+            self._header.setDefaultSectionSize(heights[0])
+        self._estimate_rows(0, self._model.rowCount() - 1, heights)
+        self.refine()
+
+    # ------------------------
+    # Measuring the visible rows
+    # ------------------------
+    def visible_rows(self):
+        """(first, last) rows in or near the viewport. (None if there are none)"""
+        row_count = self._model.rowCount()
+        if not row_count:
+            return None
+        first = self._view.rowAt(0)
+        last = self._view.rowAt(self._view.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = row_count - 1 if last < 0 else last
+        return max(0, first - self.margin_rows), min(row_count - 1, last + self.margin_rows)
+
+    def refine(self):
+        """Measure the rows in & near the viewport that haven't been measured"""
+        self._refine_pending = False
+        rows = self.visible_rows()
+        if rows is None:
+            return
+        max_h = self.max_height()
+        for row in range(rows[0], rows[1] + 1):
+            if row in self._measured:
+                continue
+            self._measured.add(row)
+            self.measure_count += 1
+            self._header.resizeSection(row, min(self._view.sizeHintForRow(row), max_h))
+
+    def schedule_refine(self, *args):
+        # (Many scroll steps, one pass)
+        if not self._refine_pending:
+            self._refine_pending = True
+            QTimer.singleShot(0, self._refine_if_pending)
+
+    def _refine_if_pending(self):
+        if self._refine_pending:
+            self.refine()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Resize:
+            self.schedule_refine()  # (More rows may be showing)
+        return False
+
+    # ------------------------
+    # Model & column changes
+    # ------------------------
+    def _on_rows_inserted(self, parent, first, last):
+        # Row numbers from 'first' on have shifted
+        self._measured = {row for row in self._measured if row < first}
+        self._estimate_rows(first, last)
+        self.schedule_refine()
+
+    def _on_rows_removed(self, parent, first, last):
+        # (The header drops their sections)
+        self._measured = {row for row in self._measured if row < first}
+        self.schedule_refine()
+
+    def _on_rows_moved(self, parent, first, last, dest_parent, dest):
+        # The rows from the old to the new position have all changed places
+        low, high = min(first, dest), max(last, dest - 1)
+        self._measured = {row for row in self._measured if not low <= row <= high}
+        self._estimate_rows(low, min(high, self._model.rowCount() - 1))
+        self.schedule_refine()
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        if not top_left.isValid():
+            return
+        if top_left.column() > C.DESCR_IDX or bottom_right.column() < C.DESCR_IDX:
+            # (The description is what sets a row's height. Bold text wraps
+            # differently, but a flag toggle repaints the whole row)
+            return
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._measured.discard(row)
+        self.schedule_refine()
+
+    def _on_column_resized(self, col, old_width, new_width):
+        if col == C.DESCR_IDX:
+            self._measured.clear()  # (Text wraps differently)
+            self.schedule_refine()
+
+    #end CLASS RowHeightEngine
@@ -0,0 +1,56 @@
+# text_layout_cache.py
+#
+# Laying out wrapped text (a QTextDocument) is the slow part of sizing and
+# painting the description & countdown cells. The result that matters (the
+# number of wrapped lines) depends only on the text, the width, and the font.
+# So it's computed once and kept in an LRU cache, which the delegate's
+# sizeHint() and its elide check share. Scrolling and resizing a long list
+# then reuse the layouts instead of redoing them.
+
+from collections import OrderedDict
+
+from PySide6.QtGui import QTextDocument
+
+# noinspection PyPep8Naming
+import table_constants as C
+from app.config import config
+
+class TextLayoutCache:
+
+    def __init__(self, max_entries=C.TEXT_LAYOUT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lines = OrderedDict()   # (text, width, font key) -> line count
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._lines)
+
+    def line_count(self, text, width, font):
+        """Number of lines the text wraps to, at this width, in this font"""
+        key = (text, width, font.key())
+        found = self._lines.get(key)
+        if found is not None:
+            self.hits += 1
+            self._lines.move_to_end(key)
+            return found
+
+        self.misses += 1
+        doc = QTextDocument()
+        doc.setDocumentMargin(0)
+        doc.setDefaultFont(font)
+        doc.setPlainText(text)
+        doc.setTextWidth(width)
+        found = self._lines[key] = doc.lineCount()
+        if len(self._lines) > self.max_entries:
+            self._lines.popitem(last=False)  # (Least recently used)
+        return found
+
+    def clear(self):
+        self._lines.clear()
+
+    #end CLASS TextLayoutCache
+
+# Shared by the delegates. (Layouts in the old font are of no further use)
+layout_cache = TextLayoutCache()
+config.font_changed.connect(layout_cache.clear)
@@ -11,6 +11,7 @@ import datetime as dt
 # noinspection PyPep8Naming
 import app.table_constants as C
 from app.config import config
+import utilities as fcn
 
 class ReminderDialog(QDialog):
 
@@ -115,13 +116,13 @@ class ReminderDialog(QDialog):
                 self.day_combo.setCurrentIndex(0)
             else:
                 when = self.reminder._when
-                date_str = when.strftime(config.date_display_format)
+                date_str = fcn.format_datetime(when, config.date_display_format)
                 self.date_edit.setText(date_str)
 
-                time_str = when.strftime(config.time_display_format)
+                time_str = fcn.format_datetime(when, config.time_display_format)
                 self.time_edit.setText(time_str)
         else:
-            date_str = dt.datetime.now().strftime(config.date_display_format)
+            date_str = fcn.format_datetime(dt.datetime.now(), config.date_display_format)
             self.date_edit.setText(date_str)
 
             # Default new time to top of next hour
@@ -139,7 +140,7 @@ class ReminderDialog(QDialog):
 
         try:
             # 1. Parse the string using the user's configured format
-            py_date = dt.datetime.strptime(date_str, config.date_display_format)
+            py_date = fcn.parse_datetime(date_str, config.date_display_format)
 
             # 2. Map Python weekday (0=Mon..6=Sun) to the
             # QDate dayofWeek dropdown index (1=Mon, 7=Sun)
@@ -178,7 +179,7 @@ class ReminderDialog(QDialog):
 
         # Convert to Python date for strftime display
         py_date = dt.date(next_qdate.year(), next_qdate.month(), next_qdate.day())
-        self.date_edit.setText(py_date.strftime(config.date_display_format))
+        self.date_edit.setText(fcn.format_datetime(py_date, config.date_display_format))
 
     '''
     def build_time_menu(self):
@@ -206,14 +207,14 @@ class ReminderDialog(QDialog):
             when = None
         else:
             # We know this is valid because accept() passed
-            parsed_date = dt.datetime.strptime(date_str, config.date_display_format).date()
+            parsed_date = fcn.parse_datetime(date_str, config.date_display_format).date()
 
             if not time_str:
                 # Date exists, but no time (Default to Midnight)
                 when = dt.datetime.combine(parsed_date, dt.time.min)
             else:
                 # Both exist
-                parsed_time = dt.datetime.strptime(time_str, config.time_display_format).time()
+                parsed_time = fcn.parse_datetime(time_str, config.time_display_format).time()
                 when = dt.datetime.combine(parsed_date, parsed_time)
 
         return {
@@ -243,7 +244,7 @@ class ReminderDialog(QDialog):
         # 1. Validate Date (if not blank)
         if date_str:
             try:
-                dt.datetime.strptime(date_str, config.date_display_format)
+                fcn.parse_datetime(date_str, config.date_display_format)
             except ValueError:
                 QMessageBox.warning(self, "Date Format error",
                                     f"Date must match the format selected in the settings")
@@ -253,7 +254,7 @@ class ReminderDialog(QDialog):
         # 2. Validate Time (if not blank)
         if time_str:
             try:
-                dt.datetime.strptime(time_str, config.time_display_format)
+                fcn.parse_datetime(time_str, config.time_display_format)
             except ValueError:
                 QMessageBox.warning(self, "Time Format error",
                                     f"Time must match the format selected in the settings")
@@ -270,7 +271,7 @@ class ReminderDialog(QDialog):
         # Text Field
         self.date_edit = QLineEdit()
         self.date_edit.setFixedWidth(self.date_w)
-        date_str = dt.date.today().strftime(config.date_display_format)
+        date_str = fcn.format_datetime(dt.date.today(), config.date_display_format)
         self.date_edit.setText(date_str)
 
         # --- CALENDAR ICON FOR DATE BUTTON ---
@@ -313,7 +314,7 @@ class ReminderDialog(QDialog):
         # Pre-select the date currently in the box (if valid)
         current_text = self.date_edit.text().strip()
         try:
-            parsed_dt = dt.datetime.strptime(current_text, config.date_display_format)
+            parsed_dt = fcn.parse_datetime(current_text, config.date_display_format)
             self.cal_popup.setSelectedDate(QDate(parsed_dt.year, parsed_dt.month, parsed_dt.day))
         except ValueError:
             self.cal_popup.setSelectedDate(QDate.currentDate())
@@ -327,7 +328,7 @@ class ReminderDialog(QDialog):
         def on_date_picked():
             qdate = self.cal_popup.selectedDate()
             py_date = dt.date(qdate.year(), qdate.month(), qdate.day())
-            formatted_date = py_date.strftime(config.date_display_format)
+            formatted_date = fcn.format_datetime(py_date, config.date_display_format)
             self.date_edit.setText(formatted_date)
 
             #Day ComboBox idx ("" + Mon..Sun) == Qt/Iso idx 1..7)
@@ -367,11 +368,11 @@ class ReminderDialog(QDialog):
         next_hour_dt = (now + dt.timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
 
         # Format based on user's .ini setting (e.g. "2:00 PM" or "14:00")
-        default_time_str = next_hour_dt.strftime(config.time_display_format)
+        default_time_str = fcn.format_datetime(next_hour_dt, config.time_display_format)
 
         # Format just the "Hour Label" for the menu (e.g. "2 PM" or "14:00")
         # We'll use this to identify the submenu
-        default_hour_label = next_hour_dt.strftime("%I %p" if "p" in config.time_display_format.lower() else "%H:00")
+        default_hour_label = fcn.format_datetime(next_hour_dt, "%I %p" if "p" in config.time_display_format.lower() else "%H:00")
 
         # --- CHOICES MENU ---
         # Build 9 AM to 7 PM using the config format
@@ -379,7 +380,7 @@ class ReminderDialog(QDialog):
             # Create a temp time object for the top-level hour label
             temp_hour = dt.time(h, 0)
             # Label matches config style (12h vs 24h)
-            hour_label = temp_hour.strftime("%I %p" if "p" in config.time_display_format.lower() else "%H:00")
+            hour_label = fcn.format_datetime(temp_hour, "%I %p" if "p" in config.time_display_format.lower() else "%H:00")
 
             hour_sub = time_menu.addMenu(hour_label)
 
@@ -390,7 +391,7 @@ class ReminderDialog(QDialog):
             for m in [0, 15, 30, 45]:
                 temp_time = dt.time(h, m)
                 # This string matches the user's .ini format exactly
-                time_str = temp_time.strftime(config.time_display_format)
+                time_str = fcn.format_datetime(temp_time, config.time_display_format)
 
                 action = hour_sub.addAction(time_str)
                 action.triggered.connect(lambda _, t=time_str: self.time_edit.setText(t))
@@ -0,0 +1,173 @@
+# reminders_database.py
+#
+# RemindersDatabase is an alternative persistence layer that keeps reminders
+# in an SQLite database instead of a CSV file. It has the same load()/save()/
+# log_changes() contract as RemindersPersistence, so RemindersModel can use
+# either one. But here, a single edit touches a single row.
+# (Select the backend in main.py)
+
+import os, sqlite3
+import datetime as dt
+# "dt" module contains date, time, & datetime classes
+
+from reminder_item import ReminderItem
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS reminders (
+        id     INTEGER PRIMARY KEY,
+        descr  TEXT NOT NULL,
+        "when" TEXT,                   -- ISO date & time. NULL for "Date TBD"
+        flags  TEXT NOT NULL DEFAULT '',
+        notes  TEXT NOT NULL DEFAULT '',
+        repeat TEXT NOT NULL DEFAULT ''
+    );
+    CREATE INDEX IF NOT EXISTS reminders_when ON reminders("when");
+"""
+
+# Matches the sort order of ReminderItem.sort_key(): No-date items at the top
+# (The reminder's uid is its row id.)
+SELECT_ALL = 'SELECT id, descr, "when", flags, notes, repeat FROM reminders ' \
+             'ORDER BY "when" IS NOT NULL, "when", id'
+
+INSERT = 'INSERT INTO reminders (id, descr, "when", flags, notes, repeat) VALUES (?, ?, ?, ?, ?, ?)'
+
+# For id-less rows (older CSV files), find the reminder by content.
+# Identical reminders are interchangeable, so the first match will do.
+# (The index on "when" keeps the search short.)
+FIND_ID = 'SELECT id FROM reminders WHERE "when" IS ? AND descr = ? ' \
+          'AND flags = ? AND notes = ? AND repeat = ? LIMIT 1'
+
+class RemindersDatabase:
+
+    def __init__(self, db_path, csv_path=None):
+        """
+        db_path: The SQLite database file. (Created if it doesn't exist)
+        csv_path: An existing reminders CSV file. When the database is
+            first created, its contents are migrated into the database.
+        """
+        self.db_path = db_path
+        is_new = not os.path.exists(db_path)
+
+        # (Saves may be made by the PersistenceWorker thread. It serializes access.)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+        if is_new:
+            if csv_path and os.path.exists(csv_path):
+                self.migrate_from_csv(csv_path)
+            else:
+                self._insert_rows([C.INITIAL_CSV_DATA])
+                self.conn.commit()
+
+        self.reminders = []
+        self.load()
+
+    def load(self):
+        """Load reminders from the database, in sorted order."""
+        self.reminders = [
+            ReminderItem(self._to_when(when), descr, flags, notes, repeat, row_id)
+            for row_id, descr, when, flags, notes, repeat in self.conn.execute(SELECT_ALL)
+        ]
+        return self.reminders
+
+    def save(self, reminders):
+        """Replace the database contents with the list of reminders (one transaction)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM reminders")
+            self.conn.executemany(INSERT, (self._item_values(r) for r in reminders))
+
+    def log_changes(self, reminders, changes):
+        """
+        Apply a list of (op, old_row, new_row) changes, row by row, in one transaction.
+        (Rows are csv rows, as produced by ReminderItem.to_csv_row.
+        'reminders' is unused. It's there for the RemindersPersistence contract.)
+        """
+        with self.conn:
+            for op, old_row, new_row in changes:
+                if op == C.JOURNAL_ADD:
+                    self._insert_rows([new_row])
+                elif op == C.JOURNAL_UPDATE:
+                    self._update_row(old_row, new_row)
+                elif op == C.JOURNAL_DELETE:
+                    self._delete_row(old_row)
+
+    # ------------------------
+    # Row-level operations
+    # ------------------------
+    def insert(self, row):
+        """Insert one csv row. Returns the new row ID"""
+        with self.conn:
+            return self._insert_rows([row])
+
+    def update(self, old_row, new_row):
+        """Replace the stored reminder that matches old_row. Returns its row ID (or None)"""
+        with self.conn:
+            return self._update_row(old_row, new_row)
+
+    def delete(self, old_row):
+        """Delete the stored reminder that matches old_row. Returns its row ID (or None)"""
+        with self.conn:
+            return self._delete_row(old_row)
+
+    def _insert_rows(self, rows):
+        cursor = None
+        for row in rows:
+            cursor = self.conn.execute(INSERT, self._row_values(row))
+        return cursor.lastrowid if cursor else None
+
+    def _find_id(self, row):
+        row_id, descr, when, flags, notes, repeat = self._row_values(row)
+        if row_id is not None:
+            return row_id
+        found = self.conn.execute(FIND_ID, (when, descr, flags, notes, repeat)).fetchone()
+        return found[0] if found else None
+
+    def _update_row(self, old_row, new_row):
+        row_id = self._find_id(old_row)
+        if row_id is not None:
+            self.conn.execute('UPDATE reminders SET descr = ?, "when" = ?, flags = ?, '
+                              'notes = ?, repeat = ? WHERE id = ?',
+                              (*self._row_values(new_row)[1:], row_id))
+        return row_id
+
+    def _delete_row(self, old_row):
+        row_id = self._find_id(old_row)
+        if row_id is not None:
+            self.conn.execute("DELETE FROM reminders WHERE id = ?", (row_id,))
+        return row_id
+
+    # ------------------------
+    # Conversions
+    # ------------------------
+    @staticmethod
+    def _item_values(item):
+        """ReminderItem -> (id, descr, when, flags, notes, repeat) column values"""
+        when = item._when.isoformat(timespec="minutes") if item._when else None
+        return item.uid, item._descr, when, item._flags, item._notes, item._repeat_sched
+
+    @classmethod
+    def _row_values(cls, row):
+        """csv row -> column values (The csv row's date/time rules live in ReminderItem)"""
+        return cls._item_values(ReminderItem.from_csv_row(row))
+
+    @staticmethod
+    def _to_when(value):
+        return dt.datetime.fromisoformat(value) if value else None
+
+    # ------------------------
+    # Migration
+    # ------------------------
+    def migrate_from_csv(self, csv_path):
+        """One-shot copy of a reminders CSV file (C.CSV_COL_HEADERS layout) into the database"""
+        from app.reminders_persistence import RemindersPersistence
+        reminders = RemindersPersistence(csv_path).load()
+        self.save(reminders)
+        return len(reminders)
+
+    def close(self):
+        self.conn.close()
+
+    #end CLASS RemindersDatabase
@@ -6,11 +6,12 @@
 # It contains no UI logic and no knowledge of table columns or delegates.
 # This layer is the application’s data manager, supplying the ViewModel with domain objects.
 
-import os, csv, io
+import os, csv, io, time
+from collections import Counter
 #import datetime as dt
 # "dt" module contains date, time, & datetime classes
 
-from reminder_item import ReminderItem
+from reminder_item import LazyReminderItem
 
 # noinspection PyPep8Naming
 import app.table_constants as C
@@ -19,14 +20,34 @@ import utilities as fcn
 # The INTERNAL data model (separate from the storage model & the display model)
 class RemindersPersistence:
 
-    def __init__(self, csv_path):
+    def __init__(self, csv_path, use_journal=False, use_snapshot=False, lazy_load=False):
         """
         csv_PATH is the argument, to allow testing with different paths.
         The default folder remains the same for all csv files, if multiple
+
+        use_journal: When True, individual changes are appended to a small
+        sidecar journal (csv_path + C.JOURNAL_SUFFIX), instead of rewriting
+        the whole CSV file after every change. The CSV is the "snapshot".
+        load() replays the journal on top of it, and the journal is folded
+        back into the CSV when it gets too big or too old.
+
+        use_snapshot: When True, every full save also writes a packed binary
+        copy of the list (csv_path + C.SNAPSHOT_SUFFIX), and load() reads
+        that instead of parsing the CSV, as long as the CSV is unchanged.
+
+        lazy_load: When True, the list isn't loaded here. (Call load() or
+        iter_reminders() when it's wanted.) For random access to a very
+        large file, without parsing it, use open_indexed().
         """
         self.csv_path = csv_path
+        self.journal_path = os.fspath(csv_path) + C.JOURNAL_SUFFIX
+        self.snapshot_path = os.fspath(csv_path) + C.SNAPSHOT_SUFFIX
+        self.use_journal = use_journal
+        self.use_snapshot = use_snapshot
+        self._journal_started = None  # Creation time of the current journal
         self.reminders = []
-        self.load()
+        if not lazy_load:
+            self.load()
 
     def _initialize_empty_csv(self):
         with open(self.csv_path, 'w', newline='') as file:
@@ -34,7 +55,7 @@ class RemindersPersistence:
             writer.writerow(C.CSV_COL_HEADERS)
             writer.writerow(C.INITIAL_CSV_DATA)
         return self.csv_path
-    
+
     # Load values stored in CSV file
     # FUTURE
     #  Access curr_reminders_file from CONFIG
@@ -44,17 +65,44 @@ class RemindersPersistence:
         """
         Load reminders from CSV into self.reminders.
         Parse CSV rows → list of Reminder objects
+        Changes recorded in the journal (if any) are applied on top.
+        """
+        self.reminders = list(self.iter_reminders())
+        return self.reminders
+
+    def iter_reminders(self):
+        """
+        Generator: Yields (lazy) Reminder objects as the CSV rows are parsed.
+        (When there is a journal to replay, the rows are read and
+        sorted first, so the items still arrive in sorted order.)
         """
         if not os.path.exists(self.csv_path):
             self._initialize_empty_csv()
 
-        self.reminders = []
+        records = self._read_journal()
+
+        # The binary snapshot matches the CSV file, not the journal.
+        # (There's a journal to replay only after a crash. Use the CSV then.)
+        if self.use_snapshot and not records:
+            from app.reminders_snapshot import load_snapshot
+            reminders = load_snapshot(self.snapshot_path, self.csv_path)
+            if reminders is not None:
+                yield from reminders
+                return
+
         with open(self.csv_path, newline="", encoding="utf-8") as f:
             reader = csv.reader(f)
             next(reader)  # skip header row
-            for row in reader:
-                self.reminders.append(ReminderItem.from_csv_row(row))
-        return self.reminders
+            if not records:
+                for row in reader:
+                    yield LazyReminderItem.from_csv_row(row)
+                return
+            rows = [self._padded(row) for row in reader]
+
+        rows = self._replay_journal(rows, records)
+        items = [LazyReminderItem.from_csv_row(row) for row in rows]
+        items.sort(key=lambda r: r.sort_key())
+        yield from items
 
     # Store reminders in user's CSV file
     def save(self, reminders):
@@ -72,6 +120,15 @@ class RemindersPersistence:
         # Extract the full string and pass to atomic_save
         csv_data = buffer.getvalue()
         fcn.atomic_save(csv_data, self.csv_path)
+
+        if self.use_snapshot:
+            from app.reminders_snapshot import save_snapshot
+            save_snapshot(reminders, self.snapshot_path, self.csv_path)
+
+        # The new snapshot contains every journaled change. Drop the journal.
+        # (If we crash before it's removed, the journal header no longer
+        # matches the CSV file, so load() ignores it.)
+        self._discard_journal()
         '''
         with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
@@ -80,4 +137,137 @@ class RemindersPersistence:
                 writer.writerow(r.to_csv_row())
         '''
 
+    def log_changes(self, reminders, changes):
+        """
+        Persist a list of (op, old_row, new_row) changes, where op is
+        C.JOURNAL_ADD, C.JOURNAL_UPDATE, or C.JOURNAL_DELETE, and the rows
+        are csv rows (ReminderItem.to_csv_row) captured when the change was made.
+        'reminders' is the complete, current list, for when a full save is needed.
+        """
+        if not self.use_journal:
+            self.save(reminders)
+            return
+
+        self._append_to_journal(changes)
+        if self._journal_needs_compaction():
+            self.compact(reminders)
+
+    def compact(self, reminders=None):
+        """
+        Fold the journal back into the CSV file.
+        reminders: The complete, current list. (Default: The list as stored,
+        i.e. the CSV file with the journal replayed)
+        """
+        if reminders is None:
+            reminders = list(self.iter_reminders())
+        self.save(reminders)
+
+    def open_indexed(self):
+        """
+        Random access to the rows of the CSV file, for very large lists.
+        Returns an IndexedCsvReader. Re-opening an unchanged file reads only
+        its cached index. (Construct with lazy_load=True, so the constructor
+        doesn't parse the file either.) Journaled changes are folded into
+        the CSV file first, since the reader sees only the file.
+        """
+        from app.indexed_csv_reader import IndexedCsvReader
+        if not os.path.exists(self.csv_path):
+            self._initialize_empty_csv()
+        if self._read_journal():  # (A stale journal is simply dropped)
+            self.compact()
+        return IndexedCsvReader(self.csv_path)
+
+    # ------------------------
+    # Journal helpers
+    # ------------------------
+    @staticmethod
+    def _padded(row):
+        """Older files may have fewer columns. Pad them, so rows compare cleanly"""
+        missing = len(C.CSV_COL_HEADERS) - len(row)
+        return tuple(row + [""] * missing) if missing > 0 else tuple(row)
+
+    def _snapshot_stamp(self):
+        """Identifies the CSV file the journal applies to: [size, mtime_ns, inode]"""
+        st = os.stat(self.csv_path)
+        return [str(st.st_size), str(st.st_mtime_ns), str(st.st_ino)]
+
+    def _append_to_journal(self, changes):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+
+        if not os.path.exists(self.journal_path):
+            self._journal_started = int(time.time())
+            writer.writerow([C.JOURNAL_HEADER, *self._snapshot_stamp(), self._journal_started])
+
+        for op, old_row, new_row in changes:
+            writer.writerow([op, *(old_row or []), *(new_row or [])])
+
+        # One write per batch of changes. Flush it all the way to the disk,
+        # so a crash loses the last action, at most.
+        with open(self.journal_path, "a", newline="", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _journal_needs_compaction(self):
+        if os.path.getsize(self.journal_path) >= C.JOURNAL_MAX_BYTES:
+            return True
+        started = self._journal_started or 0
+        return time.time() - started >= C.JOURNAL_MAX_AGE_SECS
+
+    def _discard_journal(self):
+        self._journal_started = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _read_journal(self):
+        """
+        Return the list of journal records that apply to the current CSV file.
+        A stale journal (the CSV was rewritten or edited by hand after the
+        journal was started) is deleted.
+        """
+        if not os.path.exists(self.journal_path):
+            return []
+
+        with open(self.journal_path, newline="", encoding="utf-8") as f:
+            text = f.read()
+
+        # A crash in the middle of an append leaves a partial last line. Drop it.
+        if not text.endswith("\n"):
+            text = text[:text.rfind("\n") + 1]
+
+        reader = csv.reader(io.StringIO(text))
+        header = next(reader, None)
+        if not header or header[0] != C.JOURNAL_HEADER or header[1:4] != self._snapshot_stamp():
+            self._discard_journal()
+            return []
+
+        self._journal_started = int(header[4])
+        return list(reader)
+
+    @staticmethod
+    def _replay_journal(rows, records):
+        """
+        Apply journal records to a list of csv rows (tuples).
+        Rows normally differ by their Id column. (Identical id-less rows from
+        older files are interchangeable.) So a multiset of rows does the job.
+        (The caller re-sorts the result.)
+        """
+        n = len(C.CSV_COL_HEADERS)
+        live = Counter(rows)
+        for record in records:
+            op, fields = record[0], tuple(record[1:])
+            if op == C.JOURNAL_ADD and len(fields) == n:
+                live[fields] += 1
+            elif op == C.JOURNAL_DELETE and len(fields) == n:
+                if live[fields] > 0:
+                    live[fields] -= 1
+            elif op == C.JOURNAL_UPDATE and len(fields) == 2 * n:
+                old, new = fields[:n], fields[n:]
+                if live[old] > 0:
+                    live[old] -= 1
+                    live[new] += 1
+
+        return [list(row) for row, count in live.items() for _ in range(count)]
+
     #end CLASS RemindersPersistence
@@ -0,0 +1,119 @@
+# reminders_snapshot.py
+#
+# A packed, binary copy of the reminders list, for a fast start-up.
+# The CSV file remains the (human-editable) source of truth. The snapshot
+# records the size & mtime of the CSV file it was written with, and is
+# used only while that CSV file is unchanged.
+#
+# Layout (little-endian):
+#   header:  magic, version, csv size, csv mtime_ns, row count
+#   whens:   int64 x count      (fcn.epoch_seconds)
+#   uids:    int64 x count      (NO_UID for none)
+#   flags:   byte x count       (C.FLAG_BITS)
+#   descr, notes, repeat:  each a string table:
+#       uint64 x (count+1) character offsets, then a uint64 byte length + utf-8 blob
+
+import os, sys, struct
+from array import array
+
+from reminder_item import ReminderItem
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+import utilities as fcn
+
+SNAPSHOT_HEADER = struct.Struct("<4sIQqQ")
+SNAPSHOT_MAGIC = b"RSNP"
+SNAPSHOT_VERSION = 2  # 2: Added uids
+NO_UID = -1
+BLOB_LEN = struct.Struct("<Q")
+
+def _flags_byte(flags):
+    return sum(bit for ch, bit in C.FLAG_BITS.items() if ch in flags)
+
+
+def csv_stamp(csv_path):
+    st = os.stat(csv_path)
+    return st.st_size, st.st_mtime_ns
+
+def save_snapshot(reminders, snapshot_path, csv_path):
+    """Write the reminders as a binary snapshot of the (just saved) CSV file"""
+    whens = array("q", (fcn.epoch_seconds(r._when) for r in reminders))
+    uids = array("q", (NO_UID if r.uid is None else r.uid for r in reminders))
+    flags = bytes(_flags_byte(r._flags) for r in reminders)
+    tables = [_string_table([r._descr for r in reminders]),
+              _string_table([r._notes for r in reminders]),
+              _string_table([r._repeat_sched for r in reminders])]
+    if sys.byteorder == "big":
+        whens.byteswap()
+        uids.byteswap()
+
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                  *csv_stamp(csv_path), len(reminders))
+    fcn.atomic_save(b"".join([header, whens.tobytes(), uids.tobytes(), flags, *tables]), snapshot_path)
+
+def load_snapshot(snapshot_path, csv_path):
+    """
+    Return the list of reminders in the snapshot, or None if there is no
+    snapshot, or if the CSV file has changed since it was written.
+    """
+    if not os.path.exists(snapshot_path):
+        return None
+    with open(snapshot_path, "rb") as f:
+        data = memoryview(f.read())
+    if len(data) < SNAPSHOT_HEADER.size:
+        return None
+
+    magic, version, size, mtime_ns, count = SNAPSHOT_HEADER.unpack_from(data)
+    if (magic, version, (size, mtime_ns)) != (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, csv_stamp(csv_path)):
+        return None
+
+    pos = SNAPSHOT_HEADER.size
+    whens = array("q")
+    whens.frombytes(data[pos:pos + 8 * count])
+    pos += 8 * count
+    uids = array("q")
+    uids.frombytes(data[pos:pos + 8 * count])
+    pos += 8 * count
+    if sys.byteorder == "big":
+        whens.byteswap()
+        uids.byteswap()
+
+    flags = data[pos:pos + count]
+    pos += count
+
+    descrs, pos = _read_string_table(data, pos, count)
+    notes, pos = _read_string_table(data, pos, count)
+    repeats, pos = _read_string_table(data, pos, count)
+
+    from_epoch = fcn.from_epoch_seconds
+    return [ReminderItem(from_epoch(whens[i]), descrs[i], C.FLAG_STRINGS[flags[i] & 3],
+                         notes[i], repeats[i], None if uids[i] == NO_UID else uids[i])
+            for i in range(count)]
+
+def _string_table(strings):
+    """Character offsets (count+1), then the length-prefixed utf-8 blob"""
+    offsets = array("Q", [0])
+    total = 0
+    for s in strings:
+        total += len(s)
+        offsets.append(total)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    blob = "".join(strings).encode("utf-8")
+    return offsets.tobytes() + BLOB_LEN.pack(len(blob)) + blob
+
+def _read_string_table(data, pos, count):
+    """Decode the blob once, then slice the strings out of it"""
+    offsets = array("Q")
+    offsets.frombytes(data[pos:pos + 8 * (count + 1)])
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    pos += 8 * (count + 1)
+
+    (blob_len,) = BLOB_LEN.unpack_from(data, pos)
+    pos += BLOB_LEN.size
+    text = str(data[pos:pos + blob_len], "utf-8")
+    pos += blob_len
+
+    return [text[offsets[i]:offsets[i + 1]] for i in range(count)], pos
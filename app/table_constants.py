@@ -25,8 +25,9 @@ DEFAULT_CELL_FONT_SIZE = 10  # Header font set to one less in config
 DEFAULT_GEOM_STR = "582x278, 450x0"  # Initial size (wxh) and position (x,y)
 INITIAL_DISPLAY_DATA = ["!", "No entries yet. Add some!", "", "", "", ""]
 
-CSV_COL_HEADERS =  ["Title", "Date", "Time", "Flag", "Notes", "Repeat"]
-INITIAL_CSV_DATA = ["No entries yet. Add some!", "", "", "!", "", ""]
+CSV_COL_HEADERS =  ["Title", "Date", "Time", "Flag", "Notes", "Repeat", "Id"]
+INITIAL_CSV_DATA = ["No entries yet. Add some!", "", "", "!", "", "", ""]
+CSV_ID_IDX = CSV_COL_HEADERS.index("Id")  # Stable reminder ID. (Missing in older files)
 
 ############################
 ###  COLUMN DEFINITIONS  ###
@@ -111,6 +112,11 @@ FIRST_BTN_IDX = EDIT_IDX
 IS_CRITICAL_FLAG = "!"
 ALERTS_ENABLED_FLAG = "A"
 
+# Packed flags (binary snapshot, columnar store): One bit per flag character
+FLAG_BITS = {IS_CRITICAL_FLAG: 1, ALERTS_ENABLED_FLAG: 2}
+# All 4 possible flag strings, indexed by their bits, in the normalized "!A" order
+FLAG_STRINGS = ["".join(ch for ch, bit in FLAG_BITS.items() if n & bit) for n in range(4)]
+
 # --- Custom Data Roles ---
 # ("User Roles" start at 32 in Qt. Each additional "role" is one more.
 ALERTS_ROLE = Qt.ItemDataRole.UserRole      # Boolean: Are Alerts enabled?
@@ -121,6 +127,48 @@ REPEATS_ROLE = Qt.ItemDataRole.UserRole + 1  # Boolean: Does it repeat?
 # -----------------------------
 INI_FILENAME = "reminders.ini"
 DEFAULT_CSV_FILENAME = "reminders.csv"
+DEFAULT_DB_FILENAME = "reminders.db"    # SQLite backend (see main.USE_SQLITE_DB)
+ROW_INDEX_SUFFIX = ".idx"               # Row-offset index for a CSV file (IndexedCsvReader)
+SNAPSHOT_SUFFIX = ".snap"               # Binary copy of the CSV file, for a fast start-up
+
+# -----------------------------
+# Change journal (sidecar log next to the CSV file)
+# -----------------------------
+JOURNAL_SUFFIX = ".journal"         # e.g. reminders.csv.journal
+JOURNAL_MAX_BYTES = 256 * 1024      # Fold the journal back into the CSV past this size
+JOURNAL_MAX_AGE_SECS = 24 * 60 * 60 # ...or once the journal is a day old
+
+# Background saves: Changes made within this window are written together
+SAVE_DEBOUNCE_SECS = 0.5
+# ...and a failed write is tried again after this long
+SAVE_RETRY_SECS = 5.0
+
+# Lists at least this long update their countdowns with NumPy (if installed)
+VECTOR_COUNTDOWN_MIN_ITEMS = 20_000
+
+# The table loads rows a page at a time (more as the user scrolls). See ModelAdapter
+TABLE_PAGE_ROWS = 500
+
+# Wrapped-text layouts kept for the delegates (See TextLayoutCache)
+TEXT_LAYOUT_CACHE_SIZE = 5000
+
+# Rows whose role values (display text, font, colors...) are kept by the ModelAdapter
+ROW_BUNDLE_CACHE_SIZE = 5000
+
+# Default memory cap for rendered cell pixmaps (config.render_cache_kb)
+DEFAULT_RENDER_CACHE_KB = 16 * 1024
+
+# Rows measured at a time by the ColumnWidthTracker (The rest wait for a timer)
+WIDTH_MEASURE_CHUNK = 200
+
+# Rows above & below the viewport whose heights are measured (See RowHeightEngine)
+ROW_HEIGHT_MARGIN_ROWS = 20
+
+# Journal record types
+JOURNAL_HEADER = "#journal"
+JOURNAL_ADD = "A"
+JOURNAL_UPDATE = "U"
+JOURNAL_DELETE = "D"
 
 # -----------------------------
 # Configuration options
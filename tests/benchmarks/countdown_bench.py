@@ -0,0 +1,46 @@
+# tests/benchmarks/countdown_bench.py
+"""
+Heartbeat timings: update_countdown() for every item vs. the NumPy pass.
+
+USAGE (from the project folder, with the same source roots PyCharm uses):
+    PYTHONPATH=.:app:app/model:app/qt_ui:utilities python -m tests.benchmarks.countdown_bench [row counts]
+Default row counts: 10000 100000 1000000
+"""
+import sys, time
+import datetime as dt
+
+from app.model import vector_countdowns
+from tests.benchmarks.storage_bench import make_reminders
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+def timed(fcn, *args):
+    start = time.perf_counter()
+    fcn(*args)
+    return time.perf_counter() - start
+
+def sweep(items, now):
+    for item in items:
+        item.update_countdown(now)
+
+def bench(count):
+    items = make_reminders(count)
+    now = dt.datetime(2026, 6, 1, 9, 0)
+    later = now + dt.timedelta(minutes=5)
+
+    results = {"Python sweep": timed(sweep, items, now)}
+    if vector_countdowns.AVAILABLE:
+        engine = vector_countdowns.VectorCountdowns()
+        results["NumPy (first pass)"] = timed(engine.update, items, now)
+        results["NumPy (next tick)"] = timed(engine.update, items, later)
+    return results
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n{count:,} rows")
+        for name, secs in bench(count).items():
+            print(f"  {name:<22}{secs * 1000:>10.1f} ms")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
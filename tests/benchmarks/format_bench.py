@@ -0,0 +1,32 @@
+# tests/benchmarks/format_bench.py
+"""
+strftime/strptime vs. the precompiled formats in utilities.time_tools,
+for each of the date & time formats offered in the settings dialog.
+
+USAGE (from the project folder, with the same source roots PyCharm uses):
+    PYTHONPATH=.:app:app/model:app/qt_ui:utilities python -m tests.benchmarks.format_bench [repeats]
+Default repeats: 100000
+"""
+import sys, timeit
+import datetime as dt
+
+import utilities as fcn
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+def main(argv):
+    repeats = int(argv[0]) if argv else 100_000
+    when = dt.datetime(2025, 12, 31, 15, 45, 12)
+    print(f"{'format':<14}{'strftime':>10}{'compiled':>10}{'strptime':>10}{'parse':>10}   (ns/call)")
+    for pattern, _ in C.COMMON_DATE_FORMATS + C.COMMON_TIME_FORMATS:
+        text = when.strftime(pattern)
+        compiled = fcn.compile_format(pattern)
+        times = [timeit.timeit(lambda: when.strftime(pattern), number=repeats),
+                 timeit.timeit(lambda: fcn.format_datetime(when, pattern), number=repeats),
+                 timeit.timeit(lambda: dt.datetime.strptime(text, pattern), number=repeats),
+                 timeit.timeit(lambda: compiled.parse(text), number=repeats)]
+        print(f"{pattern:<14}" + "".join(f"{t / repeats * 1e9:>10.0f}" for t in times))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,37 @@
+# tests/benchmarks/memory_bench.py
+"""
+Memory used by a list of ReminderItems vs. a ReminderStore with its views.
+
+USAGE (from the project folder, with the same source roots PyCharm uses):
+    PYTHONPATH=.:app:app/model:app/qt_ui:utilities python -m tests.benchmarks.memory_bench [row counts]
+Default row counts: 100000 500000
+"""
+import sys, tracemalloc
+
+from app.model.reminder_store import ReminderStore
+from tests.benchmarks.storage_bench import make_reminders
+
+DEFAULT_SIZES = [100_000, 500_000]
+
+def traced_bytes(fcn, *args):
+    tracemalloc.start()
+    result = fcn(*args)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return used, result
+
+def store_views(reminders):
+    store = ReminderStore()
+    return [store.add(r) for r in reminders]
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    for count in sizes:
+        item_bytes, reminders = traced_bytes(make_reminders, count)
+        store_bytes, _ = traced_bytes(store_views, reminders)
+        print(f"\n{count:,} rows")
+        print(f"  {'ReminderItems':<22}{item_bytes / 2**20:>10.1f} MB")
+        print(f"  {'ReminderStore + views':<22}{store_bytes / 2**20:>10.1f} MB")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
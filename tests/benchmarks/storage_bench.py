@@ -0,0 +1,85 @@
+# tests/benchmarks/storage_bench.py
+"""
+Load/save timings for the CSV file (and its binary snapshot) vs. the SQLite database.
+
+USAGE (from the project folder, with the same source roots PyCharm uses):
+    PYTHONPATH=.:app:app/model:app/qt_ui:utilities python -m tests.benchmarks.storage_bench [row counts]
+Default row counts: 10000 100000 1000000
+"""
+import os, sys, time, random
+import datetime as dt
+from pathlib import Path
+
+from reminder_item import ReminderItem
+from reminders_persistence import RemindersPersistence
+from reminders_database import RemindersDatabase
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+TEMP_DIR = Path(__file__).parent.parent / "temp"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+def make_reminders(count, seed=1):
+    rng = random.Random(seed)
+    start = dt.datetime(2026, 1, 1)
+    reminders = []
+    for i in range(count):
+        when = start + dt.timedelta(days=rng.randrange(730), minutes=15 * rng.randrange(96))
+        notes = "Bring the paperwork\nRoom 12" if i % 4 == 0 else ""
+        flags = C.IS_CRITICAL_FLAG if i % 10 == 0 else ""
+        reminders.append(ReminderItem(when, f"Reminder #{i}", flags, notes, ""))
+    reminders.sort(key=lambda r: r.sort_key())
+    return reminders
+
+def timed(fcn, *args):
+    start = time.perf_counter()
+    result = fcn(*args)
+    return time.perf_counter() - start, result
+
+def remove(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def bench(count):
+    csv_path = TEMP_DIR / f"bench_{count}.csv"
+    db_path = TEMP_DIR / f"bench_{count}.db"
+    remove(csv_path, f"{csv_path}{C.JOURNAL_SUFFIX}", f"{csv_path}{C.SNAPSHOT_SUFFIX}", db_path)
+
+    reminders = make_reminders(count)
+    middle = reminders[count // 2]
+    old_row = middle.to_csv_row()
+    middle.toggle_critical()
+    edit = [(C.JOURNAL_UPDATE, old_row, middle.to_csv_row())]
+
+    results = {}
+
+    csv_store = RemindersPersistence(csv_path)
+    results["CSV save"], _ = timed(csv_store.save, reminders)
+    results["CSV load"], _ = timed(csv_store.load)
+    results["CSV 1 edit"], _ = timed(csv_store.log_changes, reminders, edit)
+    csv_store.use_journal = True
+    results["CSV 1 edit (journal)"], _ = timed(csv_store.log_changes, reminders, edit)
+    csv_store.use_snapshot = True
+    results["CSV+snapshot save"], _ = timed(csv_store.save, reminders)
+    results["Snapshot load"], _ = timed(csv_store.load)
+
+    db_store = RemindersDatabase(db_path)
+    results["DB save"], _ = timed(db_store.save, reminders)
+    results["DB load"], _ = timed(db_store.load)
+    results["DB 1 edit"], _ = timed(db_store.log_changes, reminders, edit)
+    db_store.close()
+
+    remove(csv_path, f"{csv_path}{C.JOURNAL_SUFFIX}", f"{csv_path}{C.SNAPSHOT_SUFFIX}", db_path)
+    return results
+
+def main(argv):
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+    for count in sizes:
+        print(f"\n{count:,} rows")
+        for name, secs in bench(count).items():
+            print(f"  {name:<22}{secs * 1000:>10.1f} ms")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
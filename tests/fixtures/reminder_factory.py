@@ -5,8 +5,8 @@
 def sample_reminders():
     """List of Reminder objects from strings with iso-format dates & times"""
     return [
-        make_reminder_from_args("", "Wake up", "2025-01-01", "06:00", "Be grateful!", "Daily"),
-        make_reminder_from_args("!","Meditate", "2025-01-01", "06:30", "Good fer ya!", "Daily"),
+        make_reminder_from_args("", "Wake up", "2025-01-01", "06:00", "Be grateful!", "Daily", uid=1),
+        make_reminder_from_args("!","Meditate", "2025-01-01", "06:30", "Good fer ya!", "Daily", uid=2),
     ]
 
 
@@ -20,9 +20,9 @@ def sample_display_rows():
 
 def sample_csv_text():
     """Text values stored in the CSV file (empty line at the end)"""
-    return """Title,Date,Time,Flag,Notes,Repeat
-Wake up,2025-01-01,06:00,,Be grateful!,Daily
-Meditate,2025-01-01,06:30,!,Good fer ya!,Daily
+    return """Title,Date,Time,Flag,Notes,Repeat,Id
+Wake up,2025-01-01,06:00,,Be grateful!,Daily,1
+Meditate,2025-01-01,06:30,!,Good fer ya!,Daily,2
 """
 
 # --------------
@@ -30,7 +30,7 @@ Meditate,2025-01-01,06:30,!,Good fer ya!,Daily
 # --------------
 
 # Make a Reminder instance
-def make_reminder_from_args(flag, title, date_str, time_str, notes, repeat):
+def make_reminder_from_args(flag, title, date_str, time_str, notes, repeat, uid=None):
     import datetime as dt
     from reminder_item import ReminderItem
    
@@ -38,7 +38,7 @@ def make_reminder_from_args(flag, title, date_str, time_str, notes, repeat):
     time_obj = dt.time.fromisoformat(time_str)
     when = dt.datetime.combine(date_obj, time_obj)
 
-    return ReminderItem(when, title, flag, notes, repeat)
+    return ReminderItem(when, title, flag, notes, repeat, uid)
 
 # TODO determine: Is this ever used?
 def make_reminder_from_row(row):
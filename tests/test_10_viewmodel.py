@@ -21,8 +21,374 @@ def test_viewmodel_row_width():
     for row in vm.display_rows():
         assert len(row) == len(C.VM_COLUMN_LABELS)
 
+from PySide6.QtCore import QModelIndex, Qt
 from app.qt_ui.model_adapter import ModelAdapter
 def test_qt_adapter_column_count():
     vm = RemindersModel(reminder_list=sample_reminders())
     qt_adapter = ModelAdapter(vm)
     assert qt_adapter.columnCount() == len(C.ALL_COL_LABELS)
+
+from .fixtures.reminder_factory import make_reminder_from_args
+def test_sorted_insert():
+    vm = RemindersModel(reminder_list=sample_reminders())
+    early = make_reminder_from_args("", "Alarm", "2025-01-01", "05:30", "", "")
+    late = make_reminder_from_args("", "Breakfast", "2025-01-01", "07:00", "", "")
+
+    assert vm.add(late) == 2
+    assert vm.add(early) == 0
+    # Move the last item to the top
+    assert vm.update(3, make_reminder_from_args("", "Brunch", "2025-01-01", "05:00", "", "")) == 0
+    assert [r.descr.split("\n")[0] for r in vm.items()] == ["Brunch", "Alarm", "Wake up", "Meditate"]
+
+def test_row_lookup_by_uid():
+    vm = RemindersModel(reminder_list=sample_reminders())
+    alarm = make_reminder_from_args("", "Alarm", "2025-01-01", "05:30", "", "")
+    vm.add(alarm)
+    assert alarm.uid == 3   # Next unused ID
+
+    late = make_reminder_from_args("", "Alarm", "2025-01-01", "08:00", "", "")
+    assert vm.update(0, late) == 2
+    assert late.uid == 3    # An edited reminder keeps its ID
+    assert vm.index_of(late) == 2
+
+    vm.delete(0)
+    assert vm.row_of_uid(1) == -1
+    assert [vm.row_of_uid(uid) for uid in (2, 3)] == [0, 1]
+    assert vm.index_of(alarm) == 1   # (Same ID)
+
+def test_batch_signals():
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    signals = []
+    qt_adapter.rowsRemoved.connect(lambda parent, first, last: signals.append(("removed", first, last)))
+    qt_adapter.rowsInserted.connect(lambda parent, first, last: signals.append(("inserted", first, last)))
+    qt_adapter.layoutChanged.connect(lambda *args: signals.append(("moved",)))
+    qt_adapter.rowsInserted.connect(lambda *args: signals.append(("count", qt_adapter.rowCount())))
+
+    with qt_adapter.batch():
+        qt_adapter.delete_reminder(0)
+        for title, time_str in [("Late", "09:00"), ("Alarm", "05:30"), ("Later", "10:00")]:
+            vm.add(make_reminder_from_args("", title, "2025-01-01", time_str, "", ""))
+        assert signals == []   # Nothing is announced until the batch ends
+
+    assert [r.descr.split("\n")[0] for r in vm.items()] == ["Alarm", "Meditate", "Late", "Later"]
+    assert signals == [("removed", 0, 0),
+                       ("inserted", 0, 0), ("count", 2),
+                       ("inserted", 2, 3), ("count", 4)]
+
+def test_paged_adapter():
+    vm = RemindersModel(reminder_list=sample_reminders())
+    for hour in range(10, 13):
+        vm.add(make_reminder_from_args("", f"Task {hour}", "2025-01-01", f"{hour}:00", "", ""))
+    qt_adapter = ModelAdapter(vm, page_size=2)
+    inserted = []
+    qt_adapter.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+
+    # The View sees one page, and asks for more as it scrolls
+    assert qt_adapter.rowCount() == 2
+    assert qt_adapter.canFetchMore()
+    qt_adapter.fetchMore()
+    assert qt_adapter.rowCount() == 4
+    assert inserted == [(2, 3)]
+
+    # Deleting a row doesn't pull an unfetched row into view
+    qt_adapter.delete_reminder(0)
+    assert qt_adapter.rowCount() == 3
+
+    # A new reminder that sorts past the fetched rows waits for fetchMore
+    # (Rather than pulling every row before it into the View)
+    new_row = qt_adapter.add_reminder({"when": make_reminder_from_args(
+        "", "", "2025-01-02", "08:00", "", "")._when, "descr": "Tomorrow", "notes": "", "repeats": ""})
+    assert new_row == 4 and qt_adapter.rowCount() == 3
+    assert inserted == [(2, 3)]
+    qt_adapter.fetchMore()
+    assert qt_adapter.rowCount() == 5 and not qt_adapter.canFetchMore()
+
+    # Once every row is fetched, a new last row is visible at once
+    new_row = qt_adapter.add_reminder({"when": make_reminder_from_args(
+        "", "", "2025-01-03", "08:00", "", "")._when, "descr": "Later", "notes": "", "repeats": ""})
+    assert new_row == 5 and qt_adapter.rowCount() == 6
+
+def test_paged_adapter_large_list():
+    vm = RemindersModel(reminder_list=[make_reminder_from_args("", f"Task {i}", "2025-01-01", "09:00", "", "")
+                                       for i in range(2000)])
+    qt_adapter = ModelAdapter(vm, page_size=50)
+    removed = []
+    qt_adapter.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+
+    # An add past the page: rowCount() grows by at most one
+    qt_adapter.add_reminder({"when": make_reminder_from_args("", "", "2026-01-01", "09:00", "", "")._when,
+                             "descr": "Next year", "notes": "", "repeats": ""})
+    assert qt_adapter.rowCount() <= 51
+
+    # An edit that moves a row past the page: It leaves the View
+    qt_adapter.update_reminder(0, {"when": make_reminder_from_args("", "", "2026-02-01", "09:00", "", "")._when,
+                                   "descr": "Moved", "notes": "", "repeats": ""})
+    assert removed == [(0, 0)] and qt_adapter.rowCount() == 49
+    assert len(vm) == 2001
+
+def test_targeted_add_and_edit_signals():
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    signals = []
+    qt_adapter.modelReset.connect(lambda: signals.append(("reset",)))
+    qt_adapter.rowsInserted.connect(lambda parent, first, last: signals.append(("inserted", first, last)))
+    qt_adapter.rowsMoved.connect(
+        lambda parent, first, last, dest_parent, dest: signals.append(("moved", first, dest)))
+    qt_adapter.dataChanged.connect(lambda top_left, *args: signals.append(("changed", top_left.row())))
+
+    def dialog_data(title, time_str):
+        when = make_reminder_from_args("", title, "2025-01-01", time_str, "", "")._when
+        return {"when": when, "descr": title, "notes": "", "repeats": ""}
+
+    assert qt_adapter.add_reminder(dialog_data("Alarm", "05:30")) == 0
+    assert signals == [("inserted", 0, 0)]
+
+    # Later in the day: Alarm moves below the other two (in front of old row 3)
+    signals.clear()
+    assert qt_adapter.update_reminder(0, dialog_data("Alarm", "08:00")) == 2
+    assert signals == [("moved", 0, 3), ("changed", 2)]
+
+    # Same position: Just a repaint
+    signals.clear()
+    assert qt_adapter.update_reminder(2, dialog_data("Snooze", "08:30")) == 2
+    assert signals == [("changed", 2)]
+    assert [r.descr.split("\n")[0] for r in vm.items()] == ["Wake up", "Meditate", "Snooze"]
+
+def test_multi_data_row_bundles():
+    from PySide6.QtCore import Qt, QModelRoleData, QModelRoleDataSpan
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    index = qt_adapter.index(0, C.DESCR_IDX)
+
+    role_data = QModelRoleData(Qt.DisplayRole)
+    qt_adapter.multiData(index, QModelRoleDataSpan(role_data))
+    assert role_data.data() == qt_adapter.data(index, Qt.DisplayRole) == vm.get_reminder(0).descr
+    assert qt_adapter.data(qt_adapter.index(0, C.EDIT_IDX), Qt.DisplayRole) is None
+
+    # The row's bundle is kept until its data changes
+    assert qt_adapter.data(index, Qt.FontRole) is None
+    assert qt_adapter._row_bundle(0) is qt_adapter._row_bundle(0)
+    qt_adapter.toggle_flag(0)
+    assert qt_adapter.data(index, Qt.FontRole).bold()
+    assert qt_adapter.data(qt_adapter.index(0, C.FLAG_IDX), Qt.DisplayRole) == C.IS_CRITICAL_FLAG
+
+def test_row_bundle_lru():
+    qt_adapter = ModelAdapter(RemindersModel(reminder_list=sample_reminders()))
+    qt_adapter.bundle_cache_size = 1
+
+    # Only the least recently used bundle is dropped (and the row keeps its version)
+    version = qt_adapter.row_version(0)
+    qt_adapter.row_version(1)
+    assert len(qt_adapter._bundles) == 1
+    assert qt_adapter.row_version(1) == qt_adapter.row_version(1)
+    assert qt_adapter.row_version(0) != version
+
+    # A removed row's bundle goes with it
+    qt_adapter.bundle_cache_size = 10
+    qt_adapter.row_version(1)
+    uid = qt_adapter.get_reminder(0).uid
+    qt_adapter.delete_reminder(0)
+    assert uid not in qt_adapter._bundles and len(qt_adapter._bundles) == 1
+
+    # ...also when a batch's removals are announced
+    uid = qt_adapter.get_reminder(0).uid
+    with qt_adapter.batch():
+        qt_adapter.delete_reminder(0)
+    assert uid not in qt_adapter._bundles
+
+def test_row_bundle_cells_on_demand():
+    qt_adapter = ModelAdapter(RemindersModel(reminder_list=sample_reminders()))
+    index = qt_adapter.index(0, C.DESCR_IDX)
+    assert qt_adapter.data(index, Qt.DisplayRole) == qt_adapter.get_reminder(0).descr
+
+    # Only the cell that was asked for is built
+    cells = qt_adapter._row_bundle(0).cells
+    assert [col for col, cell in enumerate(cells) if cell is not None] == [C.DESCR_IDX]
+
+from app.config import config
+def test_display_strings_are_cached(monkeypatch):
+    vm = RemindersModel(reminder_list=sample_reminders())
+    calls = []
+    item_class = type(vm.get_reminder(0))   # (The fixtures' ReminderItem)
+    original = item_class._format_display_strings
+    monkeypatch.setattr(item_class, "_format_display_strings",
+                        lambda self: calls.append(self) or original(self))
+
+    # A "full repaint" or two: Each item is formatted once
+    for _ in range(2):
+        for item in vm.items():
+            _ = item.day_of_week, item.date, item.time
+    assert len(calls) == len(vm)
+
+    # A new format: Each item is formatted again
+    saved_format = config.date_display_format
+    try:
+        config.date_display_format = "%m/%d/%y"
+        assert vm.get_reminder(0).date == "1/01/25"
+        assert len(calls) == len(vm) + 1
+    finally:
+        config.date_display_format = saved_format
+
+def test_column_width_tracker():
+    from PySide6.QtWidgets import QApplication
+    from app.qt_ui.column_width_tracker import ColumnWidthTracker
+    app = QApplication.instance() or QApplication([])
+
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    tracker = ColumnWidthTracker(qt_adapter, app.font())
+    reported = {}
+    tracker.width_changed.connect(lambda col, width: reported.__setitem__(col, width))
+    tracker.rebuild()
+    assert len(reported) == qt_adapter.columnCount()
+    for col, col_def in enumerate(C.ALL_COLS):
+        assert col_def.min_w <= reported[col] <= col_def.max_w
+
+    # A new row is measured by itself. A wider description widens the column
+    reported.clear()
+    measured = tracker.measure_count
+    vm.add(make_reminder_from_args("", "A much, much longer description than the others", "2025-01-01", "09:00", "", ""))
+    qt_adapter.beginInsertRows(QModelIndex(), 2, 2)
+    qt_adapter.endInsertRows()
+    assert tracker.measure_count - measured == qt_adapter.columnCount()
+    assert list(reported) == [C.DESCR_IDX]
+
+    # Removing it narrows the column again
+    reported.clear()
+    qt_adapter.delete_reminder(2)
+    assert list(reported) == [C.DESCR_IDX]
+
+def test_column_width_tracker_chunks():
+    from PySide6.QtWidgets import QApplication
+    from app.qt_ui.column_width_tracker import ColumnWidthTracker
+    app = QApplication.instance() or QApplication([])
+
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    tracker = ColumnWidthTracker(qt_adapter, app.font())
+    tracker.chunk_rows = 5
+    reported = {}
+    tracker.width_changed.connect(lambda col, width: reported.__setitem__(col, width))
+    tracker.rebuild()
+    descr_width = reported[C.DESCR_IDX]
+
+    # Many new rows: One chunk is measured right away, the rest later
+    reported.clear()
+    measured = tracker.measure_count
+    qt_adapter.beginInsertRows(QModelIndex(), 2, 13)
+    for n in range(12):
+        vm.add(make_reminder_from_args("", "Row %d" % n + " is wide" * (n == 11) * 10, "2025-01-01", "09:00", "", ""))
+    qt_adapter.endInsertRows()
+    assert tracker.measure_count - measured == 5 * qt_adapter.columnCount()
+
+    # ...and the column widens as the results come in
+    for _ in range(5):
+        app.processEvents()
+    assert tracker.measure_count - measured == 12 * qt_adapter.columnCount()
+    assert reported[C.DESCR_IDX] > descr_width
+
+def test_text_layout_cache():
+    from PySide6.QtWidgets import QApplication
+    from app.qt_ui.text_layout_cache import TextLayoutCache
+    app = QApplication.instance() or QApplication([])
+    font = app.font()
+
+    cache = TextLayoutCache(max_entries=2)
+    lines = cache.line_count("Wake up\nBe grateful!", 200, font)
+    assert lines == 2
+    assert cache.line_count("Wake up\nBe grateful!", 200, font) == lines
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Least recently used layouts are dropped
+    cache.line_count("Meditate", 200, font)
+    cache.line_count("Meditate", 100, font)
+    assert len(cache) == 2
+    cache.line_count("Wake up\nBe grateful!", 200, font)
+    assert cache.misses == 4
+
+def test_render_cache():
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtWidgets import QApplication, QStyleOptionViewItem, QStyledItemDelegate
+    from app.qt_ui.render_cache import RenderCache
+    app = QApplication.instance() or QApplication([])
+
+    vm = RemindersModel(reminder_list=sample_reminders())
+    qt_adapter = ModelAdapter(vm)
+    delegate = QStyledItemDelegate()
+    cache = RenderCache()
+    image = QImage(200, 100, QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    option = QStyleOptionViewItem()
+    option.rect = QRect(0, 0, 100, 30)
+    option.font = app.font()
+
+    def paint(row):
+        cache.paint(painter, option, qt_adapter.index(row, C.DATE_IDX), delegate.paint)
+
+    try:
+        # The second paint is a blit
+        paint(0)
+        paint(0)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # An edited row is rendered again
+        qt_adapter.toggle_flag(0)
+        paint(0)
+        assert cache.misses == 2
+
+        # Memory is capped
+        saved_kb = config.render_cache_kb
+        config.render_cache_kb = 1 + cache.nbytes // 1024
+        try:
+            paint(1)
+            assert len(cache) <= 2 and cache.nbytes <= config.render_cache_kb * 1024
+        finally:
+            config.render_cache_kb = saved_kb
+    finally:
+        painter.end()
+
+def test_row_heights_visible_rows_only():
+    from PySide6.QtWidgets import QApplication, QTableView
+    from app.qt_ui.row_height_engine import RowHeightEngine
+    app = QApplication.instance() or QApplication([])
+
+    reminders = [make_reminder_from_args("", f"Reminder {i}\nSecond line", f"2030-01-{i % 28 + 1:02d}", "09:00", "", "")
+                 for i in range(300)]
+    qt_adapter = ModelAdapter(RemindersModel(reminder_list=reminders))
+    view = QTableView()
+    view.setModel(qt_adapter)
+    view.resize(600, 200)
+    engine = RowHeightEngine(view, qt_adapter, margin_rows=5)
+
+    # Every row has an estimate; only the rows near the viewport are measured
+    engine.refresh()
+    assert 0 < engine.measure_count < qt_adapter.rowCount() // 4
+    first, last = engine.visible_rows()
+    assert first == 0 and last < 50
+    max_h = engine.max_height()
+    assert all(0 < view.rowHeight(row) <= max_h for row in range(qt_adapter.rowCount()))
+
+    # Scrolling measures the newly visible rows (once)
+    measured = engine.measure_count
+    view.scrollToBottom()
+    engine.refine()
+    assert engine.measure_count > measured
+    measured = engine.measure_count
+    engine.refine()
+    assert engine.measure_count == measured
+
+def test_cached_cell_delegate_keeps_snug_size():
+    from PySide6.QtWidgets import QApplication, QTableView, QStyleOptionViewItem
+    from app.qt_ui.delegates.cached_cell_delegate import CachedCellDelegate
+    from app.qt_ui.delegates.centered_delegate import CenteredDelegate
+    app = QApplication.instance() or QApplication([])
+
+    qt_adapter = ModelAdapter(RemindersModel(reminder_list=sample_reminders()))
+    view = QTableView()
+    view.setModel(qt_adapter)
+    option = QStyleOptionViewItem()
+    option.initFrom(view)
+    index = qt_adapter.index(0, C.DATE_IDX)
+    assert CachedCellDelegate(view).sizeHint(option, index) == CenteredDelegate(view).sizeHint(option, index)
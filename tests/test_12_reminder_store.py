@@ -0,0 +1,112 @@
+import datetime as dt
+
+from app.model.reminders_model import RemindersModel
+from app.model.reminder_item import ReminderItem
+from app.model.reminder_store import ReminderStore, StoredReminder
+
+def make_items():
+    start = dt.datetime(2025, 1, 1, 6, 0)
+    return [
+        ReminderItem(start, "Wake up", "", "Be grateful!", "Daily", uid=1),
+        ReminderItem(start + dt.timedelta(minutes=30), "Meditate", "!", "Good fer ya!\nReally", "Daily", uid=2),
+        ReminderItem(dt.datetime(2025, 1, 2), "Date only", "!A", "", ""),
+        ReminderItem(None, "Date TBD", "A", "", "Weekly"),
+    ]
+
+def display_values(item):
+    return (item.descr, item.date, item.time, item.day_of_week, item.countdown,
+            item.is_critical, item.alerts_enabled, item.has_notes, item.uid, item.to_csv_row())
+
+def test_views_match_items():
+    store = ReminderStore()
+    now = dt.datetime(2025, 1, 1, 5, 0)
+    for item in make_items():
+        view = store.add(item)
+        assert isinstance(view, StoredReminder)
+        assert not hasattr(view, "__dict__")
+        item.update_countdown(now)
+        view.update_countdown(now)
+        assert view == item
+        assert display_values(view) == display_values(item)
+
+def test_columnar_model_matches():
+    plain = RemindersModel(reminder_list=make_items())
+    columnar = RemindersModel(reminder_list=make_items(), columnar=True)
+
+    for model in (plain, columnar):
+        model.toggle_item_flag(0)
+        model.add(ReminderItem(dt.datetime(2025, 1, 1, 7, 0), "Breakfast", notes="Eggs"))
+        model.update(1, ReminderItem(dt.datetime(2025, 1, 3, 9, 0), "Moved"))
+        model.delete(0)
+        model.update_countdown_values(dt.datetime(2025, 1, 1, 6, 15))
+
+    assert [display_values(r) for r in columnar.items()] == [display_values(r) for r in plain.items()]
+
+def test_slots_are_reused():
+    model = RemindersModel(reminder_list=make_items(), columnar=True)
+    store = model._store
+    slots = len(store)
+    old_view = model.get_reminder(0)
+
+    # Edits & deletes free their slots. The next adds take them
+    for _ in range(50):
+        model.update(0, ReminderItem(dt.datetime(2025, 1, 1, 8, 0), "Edited " * 20, notes="More notes"))
+    model.delete(0)
+    model.add(ReminderItem(dt.datetime(2025, 1, 4), "Re-added"))
+    assert len(store) == slots + 1 and store.live_count == len(model)
+    assert [r.descr for r in model.items()][-1] == "Re-added"
+
+    # A released view is detached (rather than reading someone else's slot)
+    try:
+        _ = old_view.descr
+        assert False, "A released view should not be readable"
+    except AttributeError:
+        pass
+
+def test_string_table_compaction():
+    from app.model.reminder_store import COMPACT_MIN_BYTES
+    store = ReminderStore()
+    view = store.add(ReminderItem(None, "x"))
+    for i in range(200):
+        view._descr = f"{i:04d}" * (COMPACT_MIN_BYTES // 1000)  # (Longer each time)
+    view._descr = "Short"
+    other = store.add(ReminderItem(None, "Other"))
+    store.release(other)
+    assert view._descr == "Short"
+    assert store._descrs.nbytes() < 4 * COMPACT_MIN_BYTES
+
+from pathlib import Path
+from reminders_persistence import RemindersPersistence
+csv_test_path = Path(__file__).parent / "temp" / "store_test.csv"
+
+def test_columnar_model_persists():
+    manager = RemindersPersistence(csv_test_path, use_snapshot=True)
+    manager.save(make_items())
+    model = RemindersModel(data_manager=RemindersPersistence(csv_test_path, use_snapshot=True),
+                           columnar=True)
+    model.toggle_item_flag(1)
+    model.save()
+
+    expected = [r.to_csv_row() for r in model.items()]
+    assert [r.to_csv_row() for r in RemindersPersistence(csv_test_path).load()] == expected
+    assert [r.to_csv_row() for r in RemindersPersistence(csv_test_path, use_snapshot=True).load()] == expected
+
+def test_held_slots_freed_when_writer_idle():
+    manager = RemindersPersistence(csv_test_path, use_snapshot=True)
+    manager.save(make_items())
+    model = RemindersModel(data_manager=RemindersPersistence(csv_test_path, use_snapshot=True),
+                           columnar=True, background_saves=True)
+    try:
+        # The last delete: Its slot is held while the writer has a save pending...
+        model.toggle_item_flag(1)
+        model.delete(0)
+        assert model._save_worker.pending_writes
+        assert model._store.live_count == len(model) + 1
+
+        # ...and freed once the writer is done
+        model.flush()
+        assert model._store.live_count == len(model)
+        model.add(ReminderItem(dt.datetime(2025, 1, 4), "Re-added"))
+        assert len(model._store) == len(make_items())
+    finally:
+        model.close()
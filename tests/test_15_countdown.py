@@ -0,0 +1,104 @@
+import datetime as dt
+import pytest
+
+from app.model.reminders_model import RemindersModel
+from app.model.reminder_item import ReminderItem
+
+START = dt.datetime(2025, 3, 1, 21, 0)
+
+def make_items():
+    """Reminders that cover each countdown rule: days ahead, today (hours,
+    minutes, NOW, LATE, Over), date-only, past, and no date"""
+    whens = [START + dt.timedelta(minutes=m) for m in (7, 20, 45, 75, 130, 185, 300, 1500, 4000)]
+    whens += [dt.datetime(2025, 3, 2), dt.datetime(2025, 3, 3), START - dt.timedelta(minutes=30), None]
+    return [ReminderItem(when, f"Reminder {i}", uid=i + 1) for i, when in enumerate(whens)]
+
+def strings(items):
+    return [(r.countdown, r._faux_date_str) for r in items]
+
+def test_scheduler_matches_full_sweep():
+    scheduled = RemindersModel(reminder_list=make_items())
+    swept = make_items()
+
+    now = START
+    changed = scheduled.update_countdown_values(now)
+    assert changed == [row for row, item in enumerate(scheduled.items()) if item.countdown]
+
+    # Every minute for 3 days (past the last reminder)
+    while now < START + dt.timedelta(days=3):
+        now += dt.timedelta(minutes=1)
+        before = strings(scheduled.items())
+        changed = scheduled.update_countdown_values(now)
+        for item in swept:
+            item.update_countdown(now)
+
+        assert strings(scheduled.items()) == strings(sorted(swept, key=ReminderItem.sort_key))
+        after = strings(scheduled.items())
+        assert changed == [row for row in range(len(after)) if after[row] != before[row]]
+
+def test_only_due_items_are_updated():
+    model = RemindersModel(reminder_list=make_items())
+    model.update_countdown_values(START)
+
+    # An hour later, the reminders that are days away haven't changed
+    changed = model.update_countdown_values(START + dt.timedelta(hours=1))
+    assert len(changed) < len(model)
+    assert all(model.get_reminder(row)._faux_date_str != "" for row in changed)
+
+    # A new reminder is updated on the next tick
+    added = ReminderItem(START + dt.timedelta(days=5), "Added")
+    row = model.add(added)
+    assert model.update_countdown_values(START + dt.timedelta(hours=1)) == [row]
+    assert added.countdown == "in 5 days"
+
+def test_vector_countdowns_match():
+    pytest.importorskip("numpy")
+    model = RemindersModel(reminder_list=make_items())
+    model.vector_min_items = 0   # Use NumPy for this short list
+    swept = sorted(make_items(), key=ReminderItem.sort_key)
+
+    now = START - dt.timedelta(days=1)
+    while now < START + dt.timedelta(days=3):
+        before = strings(model.items())
+        changed = model.update_countdown_values(now)
+        for item in swept:
+            item.update_countdown(now)
+
+        after = strings(model.items())
+        assert after == strings(swept)
+        assert changed == [row for row in range(len(after)) if after[row] != before[row]]
+        # (Odd steps, with microseconds, to hit every boundary both ways)
+        now += dt.timedelta(seconds=47, microseconds=250_000)
+
+def test_vector_countdowns_follow_edits():
+    pytest.importorskip("numpy")
+    model = RemindersModel(reminder_list=make_items())
+    model.vector_min_items = 0
+    model.update_countdown_values(START)
+
+    added = ReminderItem(START + dt.timedelta(days=5), "Added")
+    model.add(added)
+    model.delete(0)
+    model.update(model.index_of(added), ReminderItem(START + dt.timedelta(minutes=3), "Soon"))
+    assert model.update_countdown_values(START) == [model.row_of_uid(added.uid)]
+    assert model.get_reminder(model.row_of_uid(added.uid)).countdown == "in 3 minutes"
+
+def test_heartbeat_repaints_changed_rows_only():
+    from app.qt_ui.model_adapter import ModelAdapter
+    # noinspection PyPep8Naming
+    import app.table_constants as C
+
+    qt_adapter = ModelAdapter(RemindersModel(reminder_list=make_items()))
+    qt_adapter.update_countdown_values(START)
+    ranges = []
+    qt_adapter.dataChanged.connect(
+        lambda top_left, bottom_right, roles: ranges.append(
+            (top_left.row(), bottom_right.row(), top_left.column(), bottom_right.column())))
+
+    changed = qt_adapter.update_countdown_values(START + dt.timedelta(minutes=10))
+    emitted = qt_adapter.announce_rows_changed(changed, (C.DATE_IDX, C.COUNTDOWN_IDX))
+    assert emitted == len(ranges) < 2 * len(changed)   # (Adjacent rows share a range)
+    assert {first_col for _, _, first_col, last_col in ranges} == {C.DATE_IDX, C.COUNTDOWN_IDX}
+    repainted = {row for first, last, col, _ in ranges if col == C.COUNTDOWN_IDX
+                 for row in range(first, last + 1)}
+    assert repainted == set(changed)
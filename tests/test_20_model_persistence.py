@@ -38,3 +38,77 @@ def test_load():
     for i, (a, e) in enumerate(zip(actual, expected)):
         # This will tell you EXACTLY which index and which field failed
         assert a == e, f"Mismatch at index {i}!\nActual: {repr(act)}\nExpected: {repr(exp)}"
+
+def test_lazy_load():
+    manager = RemindersPersistence(csv_test_path)
+    items = manager.iter_reminders()
+
+    first = next(items)
+    # Notes aren't decoded until they're used
+    assert first._decoded_notes is None
+    assert first.line_count == 2   # (Counted without decoding)
+    assert first._decoded_notes is None
+    assert first.descr == "Wake up\nBe grateful!"
+    assert first._decoded_notes is not None
+
+    assert [first, *items] == sample_reminders()
+
+from indexed_csv_reader import IndexedCsvReader
+def test_indexed_reader():
+    index_path = f"{csv_test_path}.idx"
+    if os.path.exists(index_path):
+        os.remove(index_path)
+    RemindersPersistence(csv_test_path).save(sample_reminders())
+
+    with IndexedCsvReader(csv_test_path) as reader:
+        assert not reader.loaded_from_cache
+        assert [reader.get_reminder(i) for i in range(len(reader))] == sample_reminders()
+
+    # Re-opening an unchanged file uses the cached index
+    with IndexedCsvReader(csv_test_path) as reader:
+        assert reader.loaded_from_cache
+        assert reader.get_reminder(1) == sample_reminders()[1]
+        assert reader.when_at(0) == sample_reminders()[0]._when
+
+def test_indexed_reader_empty_file():
+    empty_path = TEMP_DIR / "empty_test.csv"
+    empty_path.write_bytes(b"")
+    with IndexedCsvReader(empty_path) as reader:
+        assert len(reader) == 0
+
+import pytest
+# noinspection PyPep8Naming
+import app.table_constants as C
+def test_open_indexed_skips_the_parse(monkeypatch):
+    RemindersPersistence(csv_test_path).save(sample_reminders())
+    IndexedCsvReader(csv_test_path).close()  # (Builds the index)
+
+    manager = RemindersPersistence(csv_test_path, lazy_load=True)
+    monkeypatch.setattr(manager, "iter_reminders", lambda: pytest.fail("The CSV file was parsed"))
+    with manager.open_indexed() as reader:
+        assert reader.loaded_from_cache
+        assert reader.get_reminder(1) == sample_reminders()[1]
+
+def test_open_indexed_folds_the_journal():
+    manager = RemindersPersistence(csv_test_path, use_journal=True)
+    manager.save(sample_reminders())
+    stale = list(manager.reminders)
+    manager.log_changes(stale, [(C.JOURNAL_DELETE, sample_reminders()[0].to_csv_row(), None)])
+
+    # The journaled delete reaches the file (rather than the list loaded earlier)
+    with RemindersPersistence(csv_test_path, use_journal=True, lazy_load=True).open_indexed() as reader:
+        assert [reader.get_reminder(i) for i in range(len(reader))] == sample_reminders()[1:]
+
+def test_snapshot():
+    manager = RemindersPersistence(csv_test_path, use_snapshot=True)
+    manager.save(sample_reminders())
+
+    # Loaded from the snapshot: Plain ReminderItems, rather than lazy CSV items
+    actual = manager.load()
+    assert actual == sample_reminders()
+    assert not hasattr(actual[0], "_row")
+
+    # Once the CSV file changes, the snapshot is ignored
+    with open(csv_test_path, "a", encoding="utf-8") as f:
+        f.write("Added by hand,2025-01-02,,,,\n")
+    assert len(manager.load()) == 3
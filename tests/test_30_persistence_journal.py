@@ -0,0 +1,127 @@
+import os
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+TEMP_DIR = TEST_DIR / "temp"
+csv_test_path = TEMP_DIR / "journal_test.csv"
+
+from tests.fixtures.reminder_factory import sample_reminders, make_reminder_from_args
+from reminders_persistence import RemindersPersistence
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+def fresh_manager():
+    for path in (csv_test_path, f"{csv_test_path}{C.JOURNAL_SUFFIX}"):
+        if os.path.exists(path):
+            os.remove(path)
+    manager = RemindersPersistence(csv_test_path, use_journal=True)
+    manager.save(sample_reminders())
+    return manager
+
+def test_journal_replay():
+    manager = fresh_manager()
+    reminders = sample_reminders()
+    csv_before = open(csv_test_path, encoding="utf-8").read()
+
+    added = make_reminder_from_args("", "Breakfast", "2025-01-01", "07:00", "", "")
+    manager.log_changes(reminders, [(C.JOURNAL_ADD, None, added.to_csv_row())])
+    manager.log_changes(reminders, [(C.JOURNAL_DELETE, reminders[0].to_csv_row(), None)])
+
+    # The CSV snapshot is untouched. The changes live in the journal
+    assert open(csv_test_path, encoding="utf-8").read() == csv_before
+    assert os.path.exists(manager.journal_path)
+
+    actual = RemindersPersistence(csv_test_path).load()
+    assert actual == [reminders[1], added]
+
+def test_journal_compaction():
+    manager = fresh_manager()
+    reminders = sample_reminders()
+    reminders[0].toggle_critical()
+    manager.compact(reminders)
+
+    assert not os.path.exists(manager.journal_path)
+    assert RemindersPersistence(csv_test_path).load() == reminders
+
+def test_stale_journal_is_ignored():
+    manager = fresh_manager()
+    reminders = sample_reminders()
+    manager.log_changes(reminders, [(C.JOURNAL_DELETE, reminders[0].to_csv_row(), None)])
+
+    # Rewrite the CSV behind the journal's back (e.g. a crash during compaction)
+    manager.save(reminders)
+    with open(manager.journal_path, "w", encoding="utf-8") as f:
+        f.write(f"{C.JOURNAL_HEADER},0,0,0,0\n")
+        f.write(f"{C.JOURNAL_DELETE},{','.join(reminders[0].to_csv_row())}\n")
+
+    assert RemindersPersistence(csv_test_path).load() == reminders
+
+from app.model.reminders_model import RemindersModel
+class CountingPersistence(RemindersPersistence):
+    writes = 0
+    def log_changes(self, reminders, changes):
+        self.writes += 1
+        super().log_changes(reminders, changes)
+
+def test_background_saves_are_coalesced():
+    fresh_manager()
+    manager = CountingPersistence(csv_test_path, use_journal=True)
+    model = RemindersModel(data_manager=manager, background_saves=True)
+
+    # A burst of edits: One write, after the debounce window
+    for _ in range(3):
+        model.toggle_item_flag(0)
+    assert model.pending_writes == 3
+
+    model.close()
+    assert model.pending_writes == 0
+    assert manager.writes == 1
+    assert RemindersPersistence(csv_test_path).load()[0].is_critical
+
+def test_batch_saves_once():
+    fresh_manager()
+    manager = CountingPersistence(csv_test_path, use_journal=True)
+    model = RemindersModel(data_manager=manager)
+
+    with model.batch():
+        model.toggle_item_flag(0)
+        model.add(make_reminder_from_args("", "Alarm", "2025-01-01", "05:30", "", ""))
+        model.delete(1)
+    assert manager.writes == 1
+    assert [r.descr for r in model.items()] == ["Alarm", "Wake up\nBe grateful!"]
+    assert RemindersPersistence(csv_test_path).load() == model.items()
+
+class FailingPersistence(RemindersPersistence):
+    fail = True
+    def log_changes(self, reminders, changes):
+        if self.fail:
+            raise OSError("Disk full")
+        super().log_changes(reminders, changes)
+
+    def save(self, reminders):
+        if self.fail:
+            raise OSError("Disk full")
+        super().save(reminders)
+
+def test_failed_background_save_stays_queued():
+    fresh_manager()
+    manager = FailingPersistence(csv_test_path, use_journal=True)
+    manager.fail = False
+    model = RemindersModel(data_manager=manager, background_saves=True)
+    manager.fail = True
+
+    # The failure reaches the caller, and the change is still pending
+    model.toggle_item_flag(0)
+    try:
+        model.flush()
+        assert False, "flush() should raise the write error"
+    except OSError:
+        pass
+    assert model.pending_writes == 1
+
+    # Once the disk recovers, the change is written
+    manager.fail = False
+    model.close()
+    assert model.pending_writes == 0
+    assert RemindersPersistence(csv_test_path).load()[0].is_critical
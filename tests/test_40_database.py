@@ -0,0 +1,47 @@
+import os
+from pathlib import Path
+
+TEST_DIR = Path(__file__).parent
+TEMP_DIR = TEST_DIR / "temp"
+db_test_path = TEMP_DIR / "db_test.db"
+csv_test_path = TEMP_DIR / "db_migration_test.csv"
+
+from tests.fixtures.reminder_factory import sample_reminders, sample_csv_text, make_reminder_from_args
+from reminders_database import RemindersDatabase
+
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+def fresh_database(csv_path=None):
+    if os.path.exists(db_test_path):
+        os.remove(db_test_path)
+    return RemindersDatabase(db_test_path, csv_path=csv_path)
+
+def test_save_and_load():
+    db = fresh_database()
+    db.save(sample_reminders())
+    assert db.load() == sample_reminders()
+    db.close()
+
+def test_row_level_changes():
+    db = fresh_database()
+    reminders = sample_reminders()
+    db.save(reminders)
+
+    early = make_reminder_from_args("", "Alarm", "2025-01-01", "05:30", "", "")
+    edited = make_reminder_from_args("!", "Wake up", "2025-01-01", "06:00", "Be grateful!", "Daily")
+    db.log_changes(reminders, [
+        (C.JOURNAL_ADD, None, early.to_csv_row()),
+        (C.JOURNAL_UPDATE, reminders[0].to_csv_row(), edited.to_csv_row()),
+        (C.JOURNAL_DELETE, reminders[1].to_csv_row(), None),
+    ])
+    assert db.load() == [early, edited]
+    db.close()
+
+def test_csv_migration():
+    with open(csv_test_path, "w", encoding="utf-8") as f:
+        f.write(sample_csv_text())
+
+    db = fresh_database(csv_path=csv_test_path)
+    assert db.reminders == sample_reminders()
+    db.close()
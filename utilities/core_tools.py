@@ -19,6 +19,7 @@ def atomic_save(data_string, target_path, encoding='utf-8'):
     """
     Writes data to a temporary file in the same directory as
     target_path, then renames it to target_path atomically.
+    (data_string may also be bytes, for binary files)
     """
     # Get the directory so the temp file stays on the same partition
     target_dir = os.path.dirname(os.path.abspath(target_path))
@@ -28,7 +29,11 @@ def atomic_save(data_string, target_path, encoding='utf-8'):
     fd, temp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
 
     try:
-        with os.fdopen(fd, 'w', encoding=encoding) as f:
+        if isinstance(data_string, bytes):
+            f = os.fdopen(fd, 'wb')
+        else:
+            f = os.fdopen(fd, 'w', encoding=encoding)
+        with f:
             f.write(data_string)
 
         # Atomic swap
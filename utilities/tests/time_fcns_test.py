@@ -15,4 +15,58 @@ def test_fmt_extractor():
     d,t = fcn.fmt_date_time(test_obj, date_fmt, time_fmt)
     actual = f"{d}, {t}"
     expected = "01 Jan 2020, 10:30 am"
-    assert actual == expected
\ No newline at end of file
+    assert actual == expected
+
+def test_datetime_from_iso():
+    assert fcn.datetime_from_iso("2020-01-01", "10:30") == dt.datetime(2020, 1, 1, 10, 30)
+    assert fcn.datetime_from_iso("2020-01-01", "") == dt.datetime(2020, 1, 1)
+    assert fcn.datetime_from_iso("", "") is None
+
+import pytest
+# noinspection PyPep8Naming
+import app.table_constants as C
+
+SAMPLE_TIMES = [dt.datetime(2025, 12, 31, 15, 45, 12), dt.datetime(2026, 1, 1, 0, 5),
+                dt.datetime(2024, 2, 29, 12, 0, 59), dt.datetime(1999, 7, 4, 9, 30)]
+FORMATS = [fmt for fmt, _ in C.COMMON_DATE_FORMATS + C.COMMON_TIME_FORMATS] \
+          + ["%a, %d %b %Y", "%A %B %d", "%y%m%d %H%M", "100%% {sure}"]
+
+@pytest.mark.parametrize("pattern", FORMATS)
+def test_compiled_format_matches_strftime(pattern):
+    compiled = fcn.compile_format(pattern)
+    display = fcn.compile_format(pattern, display=True)
+    for when in SAMPLE_TIMES:
+        assert compiled.format(when) == when.strftime(pattern)
+        assert display.format(when) == when.strftime(pattern).lstrip("0").lower()
+
+def test_compiled_format_dates_and_times():
+    # Like strftime: A date is at midnight, a time is on 1900-01-01
+    assert fcn.compile_format("%Y-%m-%d %H:%M").format(dt.date(2024, 1, 2)) == "2024-01-02 00:00"
+    for pattern in FORMATS:
+        for obj in (dt.date(2024, 1, 2), dt.time(15, 45, 12)):
+            assert fcn.compile_format(pattern).format(obj) == obj.strftime(pattern)
+
+@pytest.mark.parametrize("pattern", FORMATS)
+def test_compiled_parse_matches_strptime(pattern):
+    for when in SAMPLE_TIMES:
+        for text in (when.strftime(pattern), when.strftime(pattern).lower(), when.strftime(pattern).lstrip("0")):
+            try:
+                expected = dt.datetime.strptime(text, pattern)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    fcn.parse_datetime(text, pattern)
+                continue
+            assert fcn.parse_datetime(text, pattern) == expected
+
+def test_compiled_parse_rejects_bad_input():
+    for text, pattern in [("13/01/25", "%m/%d/%y"), ("02/30/25", "%m/%d/%y"), ("13:00 pm", "%I:%M %p"),
+                          ("12/31/25 extra", "%m/%d/%y"), ("", "%H:%M")]:
+        with pytest.raises(ValueError):
+            dt.datetime.strptime(text, pattern)
+        with pytest.raises(ValueError):
+            fcn.parse_datetime(text, pattern)
+
+def test_unsupported_directive_falls_back():
+    when = dt.datetime(2025, 3, 9, 8, 0)
+    assert fcn.format_datetime(when, "%j %U") == when.strftime("%j %U")
+    assert fcn.parse_datetime("068", "%j") == dt.datetime.strptime("068", "%j")
@@ -1,4 +1,6 @@
 import datetime as dt
+import re
+from functools import lru_cache
 
 # Formatting helper, used in Main.setup_display, to get truncated time
 def get_now_in_mins():
@@ -28,18 +30,194 @@ def fmt_date_time(datetime_obj, date_format, time_format):
     date_str = ""
     time_str = ""
     if datetime_obj:
-        d: dt.date = datetime_obj.date()
         if date_format:
-            date_str = d.strftime(date_format)
+            date_str = compile_format(date_format).format(datetime_obj)
 
-        t: dt.time = datetime_obj.time()
-        if t.hour == 0 and t.minute == 0:
+        if datetime_obj.hour == 0 and datetime_obj.minute == 0:
             time_str = ""
         elif time_format:
-            time_str = t.strftime(time_format).lstrip("0").lower()
+            time_str = compile_format(time_format, display=True).format(datetime_obj)
 
     return date_str, time_str
 
+# ------------------------------------------
+# Precompiled strftime / strptime patterns
+# ------------------------------------------
+# compile_format(pattern) turns a pattern into a CompiledFormat once (they're
+# cached by pattern), with a format() that matches strftime and a parse()
+# that matches strptime, for the directives used by the app's date & time
+# formats (C.COMMON_DATE_FORMATS, C.COMMON_TIME_FORMATS). A pattern with any
+# other directive falls back to strftime/strptime themselves.
+#
+# Month & day names and AM/PM come from strftime, in the locale that's
+# current when the pattern is compiled. (Call compile_format.cache_clear()
+# after a locale change.)
+
+# Directive -> field text, for a datetime 'o' and the names from _names()
+_FORMAT_FIELDS = {
+    "Y": lambda o, n: str(o.year),
+    "y": lambda o, n: "%02d" % (o.year % 100),
+    "m": lambda o, n: "%02d" % o.month,
+    "d": lambda o, n: "%02d" % o.day,
+    "b": lambda o, n: n["_b"][o.month],
+    "B": lambda o, n: n["_B"][o.month],
+    "a": lambda o, n: n["_a"][o.weekday()],
+    "A": lambda o, n: n["_A"][o.weekday()],
+    "H": lambda o, n: "%02d" % o.hour,
+    "I": lambda o, n: "%02d" % (o.hour % 12 or 12),
+    "M": lambda o, n: "%02d" % o.minute,
+    "S": lambda o, n: "%02d" % o.second,
+    "p": lambda o, n: n["_p"][o.hour >= 12],
+}
+
+def _as_datetime(obj):
+    """A date or time as the datetime strftime formats it as (midnight; 1900-01-01)"""
+    if isinstance(obj, dt.datetime):
+        return obj
+    if isinstance(obj, dt.date):
+        return dt.datetime(obj.year, obj.month, obj.day)
+    return dt.datetime.combine(dt.date(1900, 1, 1), obj)
+
+# Directive -> regex, as strptime has them. (Names are filled in at compile time)
+_PARSE_FIELDS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "y": r"(?P<y>\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "I": r"(?P<I>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>[0-5]\d|\d)",
+}
+_NAMED_FIELDS = ("b", "B", "a", "A", "p")
+
+class CompiledFormat:
+    """A strftime/strptime pattern, split up once. (Use compile_format to get one)"""
+
+    def __init__(self, pattern, display=False):
+        self.pattern = pattern
+        self.display = display
+        parts = re.split(r"(%.)", pattern)
+        directives = [part[1] for part in parts[1::2]]
+
+        if all(d in _FORMAT_FIELDS or d == "%" for d in directives):
+            self.format = self._compile_formatter(parts, display)
+        else:
+            self.format = self._strftime
+
+        unique = len(set(directives)) == len(directives)
+        if unique and all(d in _PARSE_FIELDS or d in _NAMED_FIELDS or d == "%" for d in directives):
+            self._regex = self._compile_parser(parts)
+        else:
+            self._regex = None
+
+    def _strftime(self, obj):
+        text = obj.strftime(self.pattern)
+        return text.lstrip("0").lower() if self.display else text
+
+    @staticmethod
+    def _names():
+        """Month & day names and AM/PM, as strftime spells them right now"""
+        return {
+            "_b": [""] + [dt.date(2001, m, 1).strftime("%b") for m in range(1, 13)],
+            "_B": [""] + [dt.date(2001, m, 1).strftime("%B") for m in range(1, 13)],
+            "_a": [dt.date(2001, 1, 1 + i).strftime("%a") for i in range(7)],  # (A Monday)
+            "_A": [dt.date(2001, 1, 1 + i).strftime("%A") for i in range(7)],
+            "_p": [dt.time(1).strftime("%p"), dt.time(13).strftime("%p")],
+        }
+
+    @classmethod
+    def _compile_formatter(cls, parts, display):
+        # A %-template for the whole pattern: The literal text stays in it,
+        # and each field is filled in by its function from _FORMAT_FIELDS.
+        names = cls._names()
+        template, fields = [], []
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                template.append(part.replace("%", "%%"))
+            elif part == "%%":
+                template.append("%%")
+            else:
+                template.append("%s")
+                fields.append(_FORMAT_FIELDS[part[1]])
+        template = "".join(template)
+
+        def format(obj):
+            if obj.__class__ is not dt.datetime:
+                obj = _as_datetime(obj)
+            text = template % tuple([field(obj, names) for field in fields])
+            return text.lstrip("0").lower() if display else text
+        return format
+
+    @classmethod
+    def _compile_parser(cls, parts):
+        names = cls._names()
+        regex = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                d = part[1]
+                if d == "%":
+                    regex.append("%")
+                elif d in _PARSE_FIELDS:
+                    regex.append(_PARSE_FIELDS[d])
+                else:
+                    choices = sorted((n for n in names["_" + d] if n), key=len, reverse=True)
+                    regex.append(f"(?P<{d}>" + "|".join(re.escape(n) for n in choices) + ")")
+            else:
+                # (strptime lets any run of whitespace match whitespace)
+                regex.append(r"\s+".join(re.escape(text) for text in re.split(r"\s+", part)))
+        return re.compile("".join(regex), re.IGNORECASE), names
+
+    def parse(self, text):
+        """Same as dt.datetime.strptime(text, pattern)"""
+        if self._regex is None:
+            return dt.datetime.strptime(text, self.pattern)
+        regex, names = self._regex
+        found = regex.match(text)
+        if not found or found.end() != len(text):
+            raise ValueError(f"time data {text!r} does not match format {self.pattern!r}")
+        fields = found.groupdict()
+
+        year, month, day = 1900, 1, 1
+        if fields.get("Y"):
+            year = int(fields["Y"])
+        elif fields.get("y"):
+            year = int(fields["y"])
+            year += 2000 if year <= 68 else 1900
+        if fields.get("m"):
+            month = int(fields["m"])
+        for d in ("b", "B"):
+            if fields.get(d):
+                month = [n.lower() for n in names["_" + d]].index(fields[d].lower())
+        if fields.get("d"):
+            day = int(fields["d"])
+
+        hour = int(fields.get("H") or 0)
+        if fields.get("I"):
+            # 12 am is hour 0. (And with no %p, it's taken as am)
+            hour = int(fields["I"]) % 12
+            if (fields.get("p") or "").lower() == names["_p"][1].lower():
+                hour += 12
+        minute = int(fields.get("M") or 0)
+        second = int(fields.get("S") or 0)
+        return dt.datetime(year, month, day, hour, minute, second)
+
+@lru_cache(maxsize=64)
+def compile_format(pattern, display=False):
+    """
+    The CompiledFormat for a strftime pattern (made once per pattern).
+    display=True: As the table shows times: No leading zero, lowercase am/pm.
+    """
+    return CompiledFormat(pattern, display)
+
+def format_datetime(obj, pattern):
+    """Same as obj.strftime(pattern), precompiled"""
+    return compile_format(pattern).format(obj)
+
+def parse_datetime(text, pattern):
+    """Same as dt.datetime.strptime(text, pattern), precompiled"""
+    return compile_format(pattern).parse(text)
+
 def datetime_from_date_and_time(date_obj, time_obj):
     """
     Return the combination of date & time, or date at midnight, time + current date, or None
@@ -60,6 +238,38 @@ def datetime_from_date_and_time(date_obj, time_obj):
     
     return None
 
+def datetime_from_iso(date_str, time_str):
+    """
+    Fast path for datetime_from_date_and_time, from iso-format strings
+    (as stored in the CSV file). Returns None when both are empty.
+    """
+    if date_str:
+        if time_str:
+            return dt.datetime.fromisoformat(f"{date_str}T{time_str}")
+        return dt.datetime.fromisoformat(date_str)  # Midnight
+
+    if time_str:
+        # Date defaults to today
+        return dt.datetime.combine(dt.date.today(), dt.time.fromisoformat(time_str))
+
+    return None
+
+# Compact datetime storage: (naive) seconds since 1970-01-01, as an int64
+EPOCH = dt.datetime(1970, 1, 1)
+NO_DATE_EPOCH = -2**63      # Stands in for None ("Date TBD"). Sorts first.
+
+def epoch_seconds(datetime_obj):
+    """Return a datetime as int seconds since EPOCH (NO_DATE_EPOCH for None)"""
+    if datetime_obj is None:
+        return NO_DATE_EPOCH
+    return (datetime_obj - EPOCH) // dt.timedelta(seconds=1)
+
+def from_epoch_seconds(secs):
+    """Inverse of epoch_seconds()"""
+    if secs == NO_DATE_EPOCH:
+        return None
+    return EPOCH + dt.timedelta(0, secs)  # (days, seconds) - positional args are faster
+
 class Moment:
     """
     Wrapper class for semi-nutsoid datetime module that contains